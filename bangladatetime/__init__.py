@@ -1 +1,57 @@
-from bangladatetime.date import date
+import sys as _sys
+
+from bangladatetime.date import date, datetime, time, BST
+from bangladatetime.date import (set_gregorian_cache, gregorian_cache_info,
+                                 clear_gregorian_cache)
+
+# Everything else is imported the first time it is used, so that
+# "import bangladatetime" only costs the date module.
+_LAZY = {
+    'daterange': 'bangladatetime.calendar',
+    'iter_month': 'bangladatetime.calendar',
+    'iter_year': 'bangladatetime.calendar',
+    'DateArray': 'bangladatetime.datearray',
+    'BusinessCalendar': 'bangladatetime.business',
+    'LookupTable': 'bangladatetime.lookup',
+    'group_by_period': 'bangladatetime.periods',
+    'period_id': 'bangladatetime.periods',
+    'period_ids': 'bangladatetime.periods',
+    'EraCalendar': 'bangladatetime.rules',
+    'RuleSet': 'bangladatetime.rules',
+    'dump_dates': 'bangladatetime.serialize',
+    'dumps_dates': 'bangladatetime.serialize',
+    'load_dates': 'bangladatetime.serialize',
+    'loads_dates': 'bangladatetime.serialize',
+    'map_dates': 'bangladatetime.serialize',
+}
+
+# Submodules that need nothing beyond the standard library.  batch and
+# pandas need NumPy and pandas, and cli and pipeline are for the command
+# line; they are only loaded by "import bangladatetime.<name>", so that
+# dir() and hasattr() never import them.
+_SUBMODULES = ('business', 'calendar', 'datearray', 'formatting', 'lookup',
+               'parsing', 'periods', 'rules', 'serialize')
+
+
+def __getattr__(name):
+    import importlib
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module('bangladatetime.' + name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
+
+
+if _sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) is new in Python 3.7; import everything.
+    import importlib as _importlib
+    for _name in _SUBMODULES:
+        _importlib.import_module('bangladatetime.' + _name)
+    for _name, _module in _LAZY.items():
+        globals()[_name] = getattr(_sys.modules[_module], _name)
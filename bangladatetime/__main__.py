@@ -0,0 +1,5 @@
+import sys
+
+from bangladatetime.cli import main
+
+sys.exit(main())
@@ -0,0 +1,217 @@
+"""Vectorized conversions between Gregorian and Bangla dates.
+
+These functions work on whole NumPy arrays at once and never build a
+per-element ``date`` object.  They use the same conversion tables and the
+same leap year rule as ``bangladatetime.date``, so for every valid input
+they agree with ``date.fromgregorian()``.
+
+NumPy is an optional dependency; it is only needed by this module.
+"""
+
+__all__ = ("from_gregorian", "to_gregorian", "from_ordinal",
+           "from_timestamp")
+
+import numpy as np
+
+from bangladatetime.date import (MINYEAR, MAXYEAR,
+                                 _GREGORIAN_DAY_AT_END_OF_BANGLA_MONTH,
+                                 _BANGLA_DAY_AT_GREGORIAN_MONTH_START,
+                                 _BANGLA_DAY_AT_GREGORIAN_MONTH_END,
+                                 _DAYS_IN_GREGORIAN_MONTH,
+                                 _DAYS_IN_BANGLA_MONTH, _DAYS_BEFORE_MONTH,
+                                 _GREGORIAN_ORDINAL_OFFSET, _MAXORDINAL,
+                                 _EPOCH_ORDINAL, _BST_OFFSET, _DI400Y,
+                                 _DI100Y, _DI4Y, _DAYS_BEFORE_CYCLE,
+                                 _MONTH_DAY_OF_YEAR, _utcoffset_seconds)
+
+_GREGORIAN_DAY_AT_END_OF_BANGLA_MONTH_A = np.array(
+    _GREGORIAN_DAY_AT_END_OF_BANGLA_MONTH, dtype=np.int64)
+_BANGLA_DAY_AT_GREGORIAN_MONTH_START_A = np.array(
+    _BANGLA_DAY_AT_GREGORIAN_MONTH_START, dtype=np.int64)
+_BANGLA_DAY_AT_GREGORIAN_MONTH_END_A = np.array(
+    _BANGLA_DAY_AT_GREGORIAN_MONTH_END, dtype=np.int64)
+_DAYS_IN_GREGORIAN_MONTH_A = np.array(_DAYS_IN_GREGORIAN_MONTH,
+                                      dtype=np.int64)
+_DAYS_IN_BANGLA_MONTH_A = np.array(_DAYS_IN_BANGLA_MONTH, dtype=np.int64)
+_DAYS_BEFORE_MONTH_A = np.array(_DAYS_BEFORE_MONTH, dtype=np.int64)
+
+# Day of year -> month and day of month, indexed by [leap, day of year].
+_MONTH_OF_YEAR_A = np.zeros((2, 367), dtype=np.int64)
+_DAY_OF_YEAR_A = np.zeros((2, 367), dtype=np.int64)
+for _leap in (0, 1):
+    _MONTH_OF_YEAR_A[_leap, 1:len(_MONTH_DAY_OF_YEAR[_leap])] = [
+        md[0] for md in _MONTH_DAY_OF_YEAR[_leap][1:]]
+    _DAY_OF_YEAR_A[_leap, 1:len(_MONTH_DAY_OF_YEAR[_leap])] = [
+        md[1] for md in _MONTH_DAY_OF_YEAR[_leap][1:]]
+del _leap
+
+# Gregorian ordinal of 1970-01-01, the epoch of datetime64.
+_GREGORIAN_EPOCH_ORDINAL = 719163
+
+
+def _is_leap(year):
+    "year array -> bool array, element-wise version of date._is_leap()."
+    year = year + 594
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def _split_datetime64(dates):
+    "datetime64 array -> (year, month, day) int64 arrays."
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    if np.isnat(dates).any():
+        raise ValueError('NaT can not be converted to a Bangla date')
+    months = dates.astype('datetime64[M]')
+    year = months.astype('datetime64[Y]').astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates - months).astype(np.int64) + 1
+    return year, month, day
+
+
+def _int64(values):
+    """Integer array-like -> int64 array.  Other dtypes raise TypeError,
+    like the scalar constructors do, instead of being truncated."""
+    values = np.asarray(values)
+    if values.size and not np.issubdtype(values.dtype, np.integer):
+        raise TypeError('expected integers, not %s' % values.dtype)
+    return values.astype(np.int64, copy=False)
+
+
+def _check_gregorian_date_fields(year, month, day):
+    year, month, day = np.broadcast_arrays(_int64(year), _int64(month),
+                                           _int64(day))
+    if not ((MINYEAR <= year) & (year <= MAXYEAR)).all():
+        raise ValueError('year must be in %d..%d' % (MINYEAR, MAXYEAR))
+    if not ((1 <= month) & (month <= 12)).all():
+        raise ValueError('month must be in 1..12')
+    dim = _DAYS_IN_GREGORIAN_MONTH_A[month] + ((month == 2)
+                                               & _is_leap(year - 594))
+    if not ((1 <= day) & (day <= dim)).all():
+        raise ValueError('day out of range for month')
+    return year, month, day
+
+
+def _check_date_fields(year, month, day):
+    year, month, day = np.broadcast_arrays(_int64(year), _int64(month),
+                                           _int64(day))
+    if not ((MINYEAR <= year) & (year <= MAXYEAR)).all():
+        raise ValueError('year must be in %d..%d' % (MINYEAR, MAXYEAR))
+    if not ((1 <= month) & (month <= 12)).all():
+        raise ValueError('month must be in 1..12')
+    dim = _DAYS_IN_BANGLA_MONTH_A[month] + ((month == 11) & _is_leap(year))
+    if not ((1 <= day) & (day <= dim)).all():
+        raise ValueError('day out of range for month')
+    return year, month, day
+
+
+def _days_before_year(year):
+    "year array -> number of days before Boishakh 1st of each year."
+    y = year - 1
+    yy = y + 594
+    return y * 365 + yy // 4 - yy // 100 + yy // 400 - 144
+
+
+def _ymd2ord(year, month, day):
+    "year, month, day arrays -> Bangla ordinals, Boishakh 1, 0001 is day 1."
+    return (_days_before_year(year) + _DAYS_BEFORE_MONTH_A[month] +
+            ((month > 11) & _is_leap(year)) + day)
+
+
+def _ord2ymd(n):
+    "ordinal array -> (year, month, day) arrays, see date._ord2ymd()."
+    n = n + (_DAYS_BEFORE_CYCLE - 1)
+    n400, n = np.divmod(n, _DI400Y)
+    year = n400 * 400 + 1
+    n100, n = np.divmod(n, _DI100Y)
+    n4, n = np.divmod(n, _DI4Y)
+    n1, n = np.divmod(n, 365)
+    year += n100 * 100 + n4 * 4 + n1 - 594
+    leap = (n1 == 3) & ((n4 != 24) | (n100 == 3))
+    month = _MONTH_OF_YEAR_A[leap.astype(np.intp), n + 1]
+    day = _DAY_OF_YEAR_A[leap.astype(np.intp), n + 1]
+    # Last day of a leap year, i.e. Choitro 30 of the previous year.
+    last = (n1 == 4) | (n100 == 4)
+    return (np.where(last, year - 1, year), np.where(last, 12, month),
+            np.where(last, 30, day))
+
+
+def from_ordinal(ordinals):
+    """Convert ordinals (Boishakh 1, 0001 is day 1) to Bangla dates,
+    element-wise.  Returns a tuple of int64 arrays (year, month, day).
+    """
+    ordinals = _int64(ordinals)
+    if not ((1 <= ordinals) & (ordinals <= _MAXORDINAL)).all():
+        raise ValueError('Ordinal date must be in 1..%d' % _MAXORDINAL)
+    return _ord2ymd(ordinals)
+
+
+def from_timestamp(timestamps, tz=None):
+    """Convert POSIX timestamps to Bangla dates, element-wise.
+
+    The dates are the ones in Bangladesh (BST) unless a time zone with a
+    fixed UTC offset is passed as tz, like date.fromtimestamp().  Returns a
+    tuple of int64 arrays (year, month, day).
+    """
+    offset = _BST_OFFSET if tz is None else _utcoffset_seconds(tz)
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind == 'f':
+        timestamps = np.floor(timestamps)
+    days = (timestamps.astype(np.int64) + offset) // 86400
+    return from_ordinal(days + _EPOCH_ORDINAL)
+
+
+def from_gregorian(years, months=None, days=None):
+    """Convert Gregorian dates to Bangla dates, element-wise.
+
+    Either pass three integer array-likes (years, months, days), which are
+    broadcast against each other, or a single ``datetime64`` array-like as
+    `years`.  Returns a tuple of int64 arrays (year, month, day) holding the
+    Bangla fields.  Raises ValueError if any input is not a valid Gregorian
+    date or falls outside the supported Bangla years.
+    """
+    if months is None and days is None:
+        years, months, days = _split_datetime64(years)
+    elif months is None or days is None:
+        raise TypeError('from_gregorian() takes either a datetime64 array '
+                        'or years, months and days')
+
+    gregorian_year, gregorian_month, gregorian_day = \
+        _check_gregorian_date_fields(years, months, days)
+    leap = _is_leap(gregorian_year - 594)
+
+    bar = (gregorian_month < 4) | ((gregorian_month == 4) &
+                                   (gregorian_day < 14))
+    bangla_year = gregorian_year - 593 - bar
+    if not ((MINYEAR <= bangla_year) & (bangla_year <= MAXYEAR)).all():
+        raise ValueError('year must be in %d..%d' % (MINYEAR, MAXYEAR))
+
+    foo = _GREGORIAN_DAY_AT_END_OF_BANGLA_MONTH_A[gregorian_month]
+    first_part = gregorian_day <= foo
+
+    month_start = (_BANGLA_DAY_AT_GREGORIAN_MONTH_START_A[gregorian_month] +
+                   ((gregorian_month == 3) & leap))
+    month_end = (_BANGLA_DAY_AT_GREGORIAN_MONTH_END_A[gregorian_month] +
+                 ((gregorian_month == 2) & leap))
+    dim = (_DAYS_IN_GREGORIAN_MONTH_A[gregorian_month] +
+           ((gregorian_month == 2) & leap))
+
+    bangla_month = np.where(first_part, (gregorian_month + 8) % 12,
+                            (gregorian_month + 9) % 12)
+    bangla_month = np.where(bangla_month == 0, 12, bangla_month)
+    bangla_day = np.where(first_part, gregorian_day + (month_start - 1),
+                          gregorian_day - (dim - month_end))
+    return bangla_year, bangla_month, bangla_day
+
+
+def to_gregorian(years, months, days):
+    """Convert Bangla dates to Gregorian dates, element-wise.
+
+    The three integer array-likes are broadcast against each other.  Returns
+    a ``datetime64[D]`` array; every element is the Bangla ordinal shifted
+    by a constant, so no per-element lookup is done.  Raises ValueError if
+    any input is not a valid Bangla date.
+    """
+    year, month, day = _check_date_fields(years, months, days)
+    ordinal = _ymd2ord(year, month, day)
+    return (ordinal +
+            (_GREGORIAN_ORDINAL_OFFSET - _GREGORIAN_EPOCH_ORDINAL)).astype(
+                'datetime64[D]')
@@ -0,0 +1,303 @@
+"""Business day arithmetic on Bangla dates.
+
+A BusinessCalendar compiles its weekend and holidays, over a fixed range of
+years, into a table with one entry per day: whether it is a business day
+and how many business days come before it.  is_busday(), busday_count()
+and busday_offset() are then a lookup or two in that table, however far
+apart the dates are, and their _many() variants do the same for whole
+arrays of dates.  The names and the semantics follow numpy.busday_count()
+and friends.
+
+    >>> cal = BusinessCalendar(holidays=[date(1427, 9, 16)])
+    >>> cal.busday_offset(date(1427, 9, 9), 5)
+    bangladatetime.date.date(1427, 9, 19)
+"""
+
+__all__ = ("BusinessCalendar", "POHELA_BOISHAKH")
+
+from array import array as _array
+from itertools import (accumulate as _accumulate, compress as _compress,
+                       repeat as _repeat)
+from operator import index as _index
+
+from bangladatetime.date import (date, _days_in_month, _check_date_fields,
+                                 _ymd2ord)
+from bangladatetime.datearray import DateArray, _toreadonly, _TYPECODE
+
+# Boishakh 1, the Bangla new year, as an annual holiday rule.
+POHELA_BOISHAKH = (1, 1)
+
+_ROLLS = ('raise', 'forward', 'following', 'backward', 'preceding')
+
+
+def _parse_weekmask(weekmask):
+    "'1111001' or 7 truth values, Monday first -> bytes of 0/1."
+    if isinstance(weekmask, str):
+        mask = weekmask.replace(' ', '')
+        if len(mask) != 7 or mask.strip('01'):
+            raise ValueError("weekmask must be 7 '0'/'1' characters",
+                             weekmask)
+        mask = bytes(int(c) for c in mask)
+    else:
+        mask = bytes(1 if day else 0 for day in weekmask)
+        if len(mask) != 7:
+            raise ValueError('weekmask must have 7 entries', weekmask)
+    if not any(mask):
+        raise ValueError('weekmask has no business day', weekmask)
+    return mask
+
+
+def _ordinals(dates):
+    "DateArray or iterable of dates -> buffer of the ordinals."
+    if isinstance(dates, DateArray):
+        return dates.ordinals
+    ordinals = _array(_TYPECODE)
+    append = ordinals.append
+    for d in dates:
+        if not isinstance(d, date):
+            raise TypeError('expected dates, not %s' % type(d).__name__)
+        append(d.toordinal())
+    return ordinals
+
+
+def _min(values):
+    # min() of a list or, much faster than min(), of an ndarray.
+    return values.min() if hasattr(values, 'min') else min(values)
+
+
+def _max(values):
+    return values.max() if hasattr(values, 'max') else max(values)
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+class BusinessCalendar:
+    """BusinessCalendar(weekmask='1111001', holidays=(),
+                     annual_holidays=(POHELA_BOISHAKH, ),
+                     first_year=1300, last_year=1500)
+
+    weekmask gives the business days of the week, Monday first, as a string
+    of '0'/'1' or 7 truth values; the default has Friday and Saturday off,
+    as in Bangladesh.  holidays are dates off, annual_holidays are
+    (month, day) pairs of Bangla dates off every year; a pair is skipped in
+    years without that day.
+
+    The calendar covers the dates of the years first_year to last_year,
+    which by default are Gregorian 1893 to 2094, and takes about 8 bytes a
+    day.  Other dates raise ValueError.
+    """
+    def __init__(self,
+                 weekmask='1111001',
+                 holidays=(),
+                 annual_holidays=(POHELA_BOISHAKH, ),
+                 first_year=1300,
+                 last_year=1500):
+        mask = _parse_weekmask(weekmask)
+        first_year, _, _ = _check_date_fields(first_year, 1, 1)
+        last_year, _, _ = _check_date_fields(last_year, 1, 1)
+        if last_year < first_year:
+            raise ValueError('last_year must not be before first_year')
+        first = _ymd2ord(first_year, 1, 1)
+        stop = _ymd2ord(last_year, 12, 30) + 1
+        size = stop - first
+
+        # The weekmask repeated from the weekday of the first day.
+        start = (first + 6) % 7
+        week = mask[start:] + mask[:start]
+        busdays = bytearray(week * (size // 7 + 1))
+        del busdays[size:]
+
+        off = set()
+        for d in holidays:
+            if not isinstance(d, date):
+                raise TypeError('holidays must be dates, not %s' %
+                                type(d).__name__)
+            off.add(d.toordinal())
+        for month, day in annual_holidays:
+            # 1426 is a leap year, so every day that exists in some year
+            # passes.
+            _check_date_fields(1426, month, day)
+            for year in range(first_year, last_year + 1):
+                if 1 <= day <= _days_in_month(year, month):
+                    off.add(_ymd2ord(year, month, day))
+        holiday_ordinals = sorted(o for o in off
+                                  if first <= o < stop and busdays[o - first])
+        for o in holiday_ordinals:
+            busdays[o - first] = 0
+
+        self._weekmask = mask
+        self._first = first
+        self._stop = stop
+        self._holidays = _array(_TYPECODE, holiday_ordinals)
+        self._busdays = bytes(busdays)
+        # _before[i]: number of business days before ordinal first + i.
+        self._before = _array(_TYPECODE, [0])
+        self._before.extend(_accumulate(busdays))
+        # _ranked[k]: ordinal of business day k, counting from 0.
+        self._ranked = _array(_TYPECODE,
+                              _compress(range(first, stop), busdays))
+
+    @property
+    def weekmask(self):
+        "The weekmask as a string of '0'/'1', Monday first."
+        return ''.join(map(str, self._weekmask))
+
+    @property
+    def holidays(self):
+        "DateArray of the holidays falling on business days of the week."
+        return DateArray.fromordinals(self._holidays)
+
+    @property
+    def first(self):
+        "The first date of the calendar."
+        return date._fromordinal(self._first)
+
+    @property
+    def last(self):
+        "The last date of the calendar."
+        return date._fromordinal(self._stop - 1)
+
+    def __repr__(self):
+        return '%s.%s(%r, <%d holidays>, %s..%s)' % (
+            self.__class__.__module__, self.__class__.__qualname__,
+            self.weekmask, len(self._holidays), self.first, self.last)
+
+    def _offset(self, d, bound=False):
+        # date -> index into the tables.  With bound true, the day after
+        # the last one is allowed too, as a bound of busday_count().
+        if not isinstance(d, date):
+            raise TypeError('expected a date, not %s' % type(d).__name__)
+        i = d.toordinal() - self._first
+        if not 0 <= i < len(self._busdays) + bound:
+            raise ValueError('date out of the range of the business calendar',
+                             d)
+        return i
+
+    def _rank(self, i, roll):
+        # Index of a day -> rank of the business day it rolls to.
+        if self._busdays[i]:
+            return self._before[i]
+        if roll == 'raise':
+            raise ValueError('date %s is not a business day' %
+                             date._fromordinal(self._first + i))
+        if roll in ('forward', 'following'):
+            return self._before[i]
+        return self._before[i] - 1
+
+    def is_busday(self, d):
+        "Return True if the date d is a business day."
+        return bool(self._busdays[self._offset(d)])
+
+    def busday_count(self, begin, end):
+        """Return the number of business days from the date begin up to,
+        but not including, the date end; negative if end is before begin.
+        Either may be the day after the last date of the calendar.
+        """
+        return self._before[self._offset(end, True)] - \
+            self._before[self._offset(begin, True)]
+
+    def busday_offset(self, d, offset, roll='raise'):
+        """Return the date offset business days after d, before it if
+        offset is negative.
+
+        If d is not a business day, roll='raise' (the default) raises
+        ValueError, 'forward' or 'following' first moves it to the next
+        business day and 'backward' or 'preceding' to the previous one.
+        """
+        if roll not in _ROLLS:
+            raise ValueError('roll must be one of %s' % ', '.join(_ROLLS),
+                             roll)
+        rank = self._rank(self._offset(d), roll) + _index(offset)
+        if not 0 <= rank < len(self._ranked):
+            raise ValueError('result out of the range of the business '
+                             'calendar')
+        return date._fromordinal(self._ranked[rank])
+
+    # Batch versions, for a DateArray or an iterable of dates.
+
+    def _indices(self, dates, np, bound=False):
+        # -> indices of dates into the tables, an int64 ndarray if np is
+        # NumPy or else a list.  bound is as for _offset().
+        ordinals = _ordinals(dates)
+        if np is not None:
+            indices = np.asarray(ordinals, dtype=np.int64) - self._first
+        else:
+            indices = [o - self._first for o in ordinals]
+        if len(indices) and not (0 <= _min(indices) and _max(indices) <
+                                 len(self._busdays) + bound):
+            raise ValueError('date out of the range of the business calendar')
+        return indices
+
+    def is_busday_many(self, dates):
+        "Like is_busday(), for many dates; return an array('b') of 0/1."
+        np = _numpy()
+        indices = self._indices(dates, np)
+        if np is not None:
+            busdays = np.frombuffer(self._busdays, dtype=np.int8)
+            return _array('b', busdays[indices].tobytes())
+        busdays = self._busdays
+        return _array('b', [busdays[i] for i in indices])
+
+    def busday_count_many(self, begins, ends):
+        """Like busday_count(), for pairs of dates from begins and ends,
+        which must have the same length; return an array('i').
+        """
+        np = _numpy()
+        begins = self._indices(begins, np, True)
+        ends = self._indices(ends, np, True)
+        if len(begins) != len(ends):
+            raise ValueError('begins and ends must have the same length')
+        if np is not None:
+            before = np.asarray(self._before)
+            counts = before[ends] - before[begins]
+            return _array(_TYPECODE, counts.astype(np.int32).tobytes())
+        before = self._before
+        return _array(_TYPECODE,
+                      [before[e] - before[b] for b, e in zip(begins, ends)])
+
+    def busday_offset_many(self, dates, offsets, roll='raise'):
+        """Like busday_offset(), for many dates; offsets is an int or an
+        iterable of ints as long as dates.  Return a DateArray.
+        """
+        if roll not in _ROLLS:
+            raise ValueError('roll must be one of %s' % ', '.join(_ROLLS),
+                             roll)
+        np = _numpy()
+        indices = self._indices(dates, np)
+        try:
+            offsets = _repeat(_index(offsets), len(indices))
+        except TypeError:
+            offsets = [_index(n) for n in offsets]
+            if len(offsets) != len(indices):
+                raise ValueError('dates and offsets must have the same '
+                                 'length')
+        if np is not None:
+            off = np.frombuffer(self._busdays, dtype=np.int8)[indices] == 0
+            ranks = np.asarray(self._before)[indices].astype(np.int64)
+            if off.any():
+                if roll == 'raise':
+                    self._rank(int(indices[off.argmax()]), roll)
+                if roll in ('backward', 'preceding'):
+                    ranks -= off
+            ranks += np.fromiter(offsets, dtype=np.int64, count=len(ranks))
+        else:
+            ranks = [
+                self._rank(i, roll) + n for i, n in zip(indices, offsets)
+            ]
+        if len(ranks) and not (0 <= _min(ranks) and
+                               _max(ranks) < len(self._ranked)):
+            raise ValueError('result out of the range of the business '
+                             'calendar')
+        # The ordinals of the table are valid, so they are not checked again.
+        if np is not None:
+            ordinals = np.asarray(self._ranked)[ranks]
+        else:
+            ranked = self._ranked
+            ordinals = _array(_TYPECODE, [ranked[k] for k in ranks])
+        return DateArray._fromview(_toreadonly(memoryview(ordinals)))
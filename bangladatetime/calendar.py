@@ -0,0 +1,156 @@
+"""Iterators over ranges of Bangla dates and month calendars.
+
+The generators here step through the calendar with the known month
+lengths instead of constructing and validating every date from scratch,
+and they never hold more than the current date in memory.  Calendar
+mirrors the grid builders of the standard calendar module.
+"""
+
+__all__ = ("daterange", "iter_month", "iter_year", "monthrange", "Calendar",
+           "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY",
+           "SATURDAY", "SUNDAY")
+
+import datetime as _datetime
+from itertools import repeat as _repeat
+from operator import index as _index
+
+from bangladatetime.date import (date, _check_date_fields, _days_in_month,
+                                 _ord2ymd, _ymd2ord)
+
+MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = range(7)
+
+
+def daterange(start, stop, step=1):
+    """Like range(), for dates: yield start, start + step, ... before stop.
+    step is a number of days or a timedelta, and may be negative.
+    """
+    if not isinstance(start, date) or not isinstance(stop, date):
+        raise TypeError('daterange() start and stop must be dates')
+    if isinstance(step, _datetime.timedelta):
+        step = step.days
+    step = _index(step)
+    if step == 0:
+        raise ValueError('daterange() arg 3 must not be zero')
+    return _daterange(start, stop, step)
+
+
+def _daterange(start, stop, step):
+    fromfields = type(start)._fromfields
+    o, end = start.toordinal(), stop.toordinal()
+    y, m, d = start.year, start.month, start.day
+    if step > 0:
+        dim = _days_in_month(y, m)
+        while o < end:
+            yield fromfields(y, m, d, o)
+            o += step
+            d += step
+            if d > dim and o < end:
+                if step > 28:
+                    # Long steps jump straight to the target month.
+                    y, m, d = _ord2ymd(o)
+                    dim = _days_in_month(y, m)
+                else:
+                    while d > dim:
+                        d -= dim
+                        if m == 12:
+                            y += 1
+                            m = 1
+                        else:
+                            m += 1
+                        dim = _days_in_month(y, m)
+    else:
+        while o > end:
+            yield fromfields(y, m, d, o)
+            o += step
+            d += step
+            if d < 1 and o > end:
+                if step < -28:
+                    y, m, d = _ord2ymd(o)
+                else:
+                    while d < 1:
+                        if m == 1:
+                            y -= 1
+                            m = 12
+                        else:
+                            m -= 1
+                        d += _days_in_month(y, m)
+
+
+def iter_month(year, month):
+    "Yield every date of the given month in order."
+    year, month, _ = _check_date_fields(year, month, 1)
+    fromfields = date._fromfields
+    o = _ymd2ord(year, month, 1)
+    for day in range(1, _days_in_month(year, month) + 1):
+        yield fromfields(year, month, day, o)
+        o += 1
+
+
+def iter_year(year):
+    "Yield every date of the given year in order."
+    year, _, _ = _check_date_fields(year, 1, 1)
+    for month in range(1, 13):
+        yield from iter_month(year, month)
+
+
+def monthrange(year, month):
+    """Return weekday (0-6 ~ Mon-Sun) of the first day and number of days
+    (29-31) for year, month."""
+    year, month, _ = _check_date_fields(year, month, 1)
+    return (_ymd2ord(year, month, 1) + 6) % 7, _days_in_month(year, month)
+
+
+class Calendar:
+    """
+    Base calendar class, like calendar.Calendar of the standard library.
+    Provides data to subclasses.
+    """
+    def __init__(self, firstweekday=0):
+        self.firstweekday = firstweekday  # 0 = Monday, 6 = Sunday
+
+    def iterweekdays(self):
+        """
+        Return an iterator for one week of weekday numbers starting with the
+        configured first one.
+        """
+        for i in range(self.firstweekday, self.firstweekday + 7):
+            yield i % 7
+
+    def itermonthdays(self, year, month):
+        """
+        Like itermonthdays2() but will yield day numbers. For days outside
+        the specified month the day number is 0.
+        """
+        day1, ndays = monthrange(year, month)
+        days_before = (day1 - self.firstweekday) % 7
+        yield from _repeat(0, days_before)
+        yield from range(1, ndays + 1)
+        days_after = (self.firstweekday - day1 - ndays) % 7
+        yield from _repeat(0, days_after)
+
+    def itermonthdays2(self, year, month):
+        """
+        Like itermonthdays(), but will yield (day number, weekday number)
+        tuples. For days outside the specified month the day number is 0.
+        """
+        for i, d in enumerate(self.itermonthdays(year, month),
+                              self.firstweekday):
+            yield d, i % 7
+
+    def monthdayscalendar(self, year, month):
+        """
+        Return a matrix representing a month's calendar.
+        Each row represents a week; days outside this month are zero.
+        """
+        days = list(self.itermonthdays(year, month))
+        return [days[i:i + 7] for i in range(0, len(days), 7)]
+
+    def monthdays2calendar(self, year, month):
+        """
+        Return a matrix representing a month's calendar.
+        Each row represents a week; week entries are
+        (day number, weekday number) tuples. Day numbers outside this month
+        are zero.
+        """
+        days = list(self.itermonthdays2(year, month))
+        return [days[i:i + 7] for i in range(0, len(days), 7)]
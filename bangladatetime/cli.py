@@ -0,0 +1,98 @@
+"""The bangladatetime command line tool.
+
+    bangladatetime today
+    bangladatetime csv INPUT OUTPUT [--column gregorian] [--encoding utf-16]
+    bangladatetime table OUTPUT
+
+INPUT and OUTPUT may be '-' for the standard input and output.
+"""
+
+import argparse
+import sys
+
+from bangladatetime.date import date
+from bangladatetime.lookup import write_table
+from bangladatetime.pipeline import convert_csv, CHUNK_LINES
+
+
+def _today(args):
+    print(date.today().strftime(args.format))
+
+
+def _csv(args):
+    source = sys.stdin.buffer if args.input == '-' else args.input
+    destination = sys.stdout.buffer if args.output == '-' else args.output
+    column = int(args.column) if args.column.isdigit() else args.column
+    count = convert_csv(source,
+                        destination,
+                        column=column,
+                        output_column=args.output_column,
+                        encoding=args.encoding,
+                        output_encoding=args.output_encoding,
+                        workers=args.workers,
+                        chunk_lines=args.chunk_lines,
+                        errors=args.errors)
+    if args.verbose:
+        print('%d records converted' % count, file=sys.stderr)
+
+
+def _table(args):
+    count = write_table(args.output)
+    if args.verbose:
+        print('%d dates written' % count, file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='bangladatetime',
+        description='Bangla (Bangabdo) date tools.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    today = commands.add_parser('today', help="print today's Bangla date")
+    today.add_argument('--format', default='%Y-%m-%d',
+                       help='strftime() format (default: %(default)s)')
+    today.set_defaults(run=_today)
+
+    csv = commands.add_parser(
+        'csv', help='add the Bangla dates of a Gregorian date column to a '
+        'CSV file')
+    csv.add_argument('input', help="input CSV file, or '-'")
+    csv.add_argument('output', help="output CSV file, or '-'")
+    csv.add_argument('--column', default='gregorian',
+                     help='name or index of the Gregorian date column '
+                     '(default: %(default)s)')
+    csv.add_argument('--output-column', default='bangla',
+                     help='name of the added column (default: %(default)s)')
+    csv.add_argument('--encoding', default='utf-8',
+                     help='input encoding (default: %(default)s)')
+    csv.add_argument('--output-encoding',
+                     help='output encoding (default: the input encoding)')
+    csv.add_argument('-j', '--workers', type=int,
+                     help='number of worker processes (default: one per '
+                     'CPU)')
+    csv.add_argument('--chunk-lines', type=int, default=CHUNK_LINES,
+                     help='lines per chunk (default: %(default)s)')
+    csv.add_argument('--errors', choices=('raise', 'ignore'),
+                     default='raise',
+                     help='fail on invalid dates, or leave them empty')
+    csv.add_argument('-v', '--verbose', action='store_true')
+    csv.set_defaults(run=_csv)
+
+    table = commands.add_parser(
+        'table', help='write the lookup table of all dates for '
+        'bangladatetime.LookupTable')
+    table.add_argument('output', help='output file')
+    table.add_argument('-v', '--verbose', action='store_true')
+    table.set_defaults(run=_table)
+
+    args = parser.parse_args(argv)
+    try:
+        args.run(args)
+    except (OSError, ValueError) as e:
+        parser.exit(1, 'bangladatetime: error: %s\n' % e)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,9 +3,16 @@ See http://www.iana.org/time-zones/repository/tz-link.html for
 time zone and DST data sources.
 """
 
-__all__ = ("date", "MINYEAR", "MAXYEAR")
+__all__ = ("date", "datetime", "time", "BST", "MINYEAR", "MAXYEAR",
+           "set_gregorian_cache", "gregorian_cache_info",
+           "clear_gregorian_cache")
 
 import time as _time
+import math as _math
+import datetime as _datetime
+from array import array as _array
+from collections import namedtuple as _namedtuple, OrderedDict as _OrderedDict
+from functools import lru_cache as _lru_cache
 from operator import index as _index
 
 
@@ -15,8 +22,21 @@ def _cmp(x, y):
 
 MINYEAR = 1
 MAXYEAR = 9999
-# _MAXORDINAL = 3652059  # date.max.toordinal()
-_MAXORDINAL = 3651695
+_MAXORDINAL = 3652060  # date(MAXYEAR, 12, 30).toordinal()
+
+# Boishakh 1, 0001 falls on April 14, 594 of the proleptic Gregorian calendar
+# and both calendars insert their leap day in the same years, so a Bangla
+# ordinal and the matching Gregorian ordinal always differ by this constant.
+_GREGORIAN_ORDINAL_OFFSET = 216692  # _datetime.date(594, 4, 14).toordinal()-1
+
+# Ordinal of 1970-01-01, the day POSIX timestamps count from.
+_EPOCH_ORDINAL = 502471  # date.fromgregorian(1970, 1, 1).toordinal()
+
+# Bangladesh Standard Time, UTC+06:00 all year round.  Bangla dates change
+# at midnight in Bangladesh, so timestamps are converted to this time zone
+# unless another one is asked for.
+_BST_OFFSET = 6 * 3600
+BST = _datetime.timezone(_datetime.timedelta(seconds=_BST_OFFSET), 'BST')
 
 # Utility functions, adapted from Python's Demo/classes/Dates.py, which
 # also assumes the current Gregorian calendar indefinitely extended in
@@ -51,12 +71,11 @@ _MONTHNAMES = [
 ]
 _DAYNAMES = [None, "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
-_DAYS_BEFORE_MONTH = [-1]  # -1 is a placeholder for indexing purposes.
-dbm = 0
-for dim in _DAYS_IN_BANGLA_MONTH[1:]:
-    _DAYS_BEFORE_MONTH.append(dbm)
-    dbm += dim
-del dbm, dim
+# Running sum of _DAYS_IN_BANGLA_MONTH; -1 is a placeholder for indexing
+# purposes.
+_DAYS_BEFORE_MONTH = [
+    -1, 0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 335
+]
 
 
 def _is_leap(year):
@@ -136,83 +155,83 @@ def _days_before_month(year, month):
     return _DAYS_BEFORE_MONTH[month] + (month > 11 and _is_leap(year))
 
 
+# _days_before_year() for every year in 0..MAXYEAR+1, indexed by year.  It
+# takes about 40 KB, so it is only built the first time it is needed.
+_DAYS_BEFORE_YEAR = None
+
+
+def _build_days_before_year():
+    global _DAYS_BEFORE_YEAR
+    _DAYS_BEFORE_YEAR = _array(
+        'i', (_days_before_year(year) for year in range(MAXYEAR + 2)))
+    return _DAYS_BEFORE_YEAR
+
+
 def _ymd2ord(year, month, day):
-    "year, month, day -> ordinal, considering 01-Jan-0001 as day 1."
+    "year, month, day -> ordinal, considering Boishakh 1, 0001 as day 1."
     assert 1 <= month <= 12, 'month must be in 1..12'
     dim = _days_in_month(year, month)
     assert 1 <= day <= dim, ('day must be in 1..%d' % dim)
-    return (_days_before_year(year) + _days_before_month(year, month) + day)
+    days_before_year = _DAYS_BEFORE_YEAR or _build_days_before_year()
+    return (days_before_year[year] + _days_before_month(year, month) + day)
 
 
-_DI400Y = _days_before_year(401)  # number of days in 400 years
-_DI100Y = _days_before_year(101)  # number of days in 100 years
-_DI4Y = _days_before_year(5)  # number of days in 4 years
+def _checked_ymd2ord(year, month, day):
+    "Like _ymd2ord(), for fields already validated by _check_date_fields()."
+    days_before_year = _DAYS_BEFORE_YEAR or _build_days_before_year()
+    return (days_before_year[year] + _DAYS_BEFORE_MONTH[month] +
+            (month == 12 and _is_leap(year)) + day)
 
-# A 4-year cycle has an extra leap day over what we'd get from pasting
-# together 4 single years.
-assert _DI4Y == 4 * 365 + 1
 
-# Similarly, a 400-year cycle has an extra leap day over what we'd get from
-# pasting together 4 100-year cycles.
-assert _DI400Y == 4 * _DI100Y + 1
+# Number of days in 400, 100 and 4 years of the leap cycle.  A 4-year cycle
+# has an extra leap day over 4 single years, a 100-year cycle has one fewer
+# than 25 4-year cycles and a 400-year cycle one more than 4 100-year cycles.
+_DI400Y = 146097  # 4 * _DI100Y + 1
+_DI100Y = 36524  # 25 * _DI4Y - 1
+_DI4Y = 1461  # 4 * 365 + 1
 
-# OTOH, a 100-year cycle has one fewer leap day than we'd get from
-# pasting together 25 4-year cycles.
-assert _DI100Y == 25 * _DI4Y - 1
+# Number of days from the start of the 400-year leap cycle containing
+# Boishakh 1, 0001 up to that day, i.e. the days in Gregorian years 1..594.
+_DAYS_BEFORE_CYCLE = 594 * 365 + 144
 
+# Day of year -> (month, day), one table for each leap state.  Index 0 is a
+# placeholder for indexing purposes.
+_MONTH_DAY_OF_YEAR = ([None], [None])
+for leap in (0, 1):
+    for month in range(1, 13):
+        dim = _DAYS_IN_BANGLA_MONTH[month] + (month == 11 and leap)
+        _MONTH_DAY_OF_YEAR[leap].extend(
+            (month, day) for day in range(1, dim + 1))
+del leap, month, dim
 
-def _ord2md(year, od):
 
-    bar = 365 + _is_leap(year)
-    if not 1 <= od <= bar:
-        raise ValueError('Ordinal date must be in 1..%d' % bar, od)
-    for month in range(12, 0, -1):
-        before = _days_before_month(year, month)
-        if od > before:
-            day = od - before
-            year, month, day = _check_date_fields(year, month, day)
-            return (month, day)
+def _ord2md(year, od):
+    "year, day of year -> (month, day), considering Boishakh 1 as day 1."
+    leap = _is_leap(year)
+    if not 1 <= od <= 365 + leap:
+        raise ValueError('Ordinal date must be in 1..%d' % (365 + leap), od)
+    return _MONTH_DAY_OF_YEAR[leap][od]
 
 
 def _ord2ymd(n):
-    "ordinal -> (year, month, day), considering 01-Jan-0001 as day 1."
+    "ordinal -> (year, month, day), considering Boishakh 1, 0001 as day 1."
     if not 1 <= n <= _MAXORDINAL:
-        raise ValueError('Ordinal date must be in 1..3651695', n)
-    """
-        Boishakh 1, 0001 is ordinal date 1
-    """
-    n -= 1
+        raise ValueError('Ordinal date must be in 1..%d' % _MAXORDINAL, n)
+    # Shift n so that it counts days from the start of a 400-year leap cycle;
+    # from there on this is the same closed form datetime uses for Gregorian
+    # ordinals.  See _days_before_year() for the 594 years offset.
+    n += _DAYS_BEFORE_CYCLE - 1
     n400, n = divmod(n, _DI400Y)
-    year = n400 * 400  # ..., -399, 1, 401, ...
+    year = n400 * 400 + 1
     n100, n = divmod(n, _DI100Y)
-    year += n100 * 100
     n4, n = divmod(n, _DI4Y)
-    year += n4 * 4
-
-    isleappossible = True
-    if n4 == 1:
-        isleappossible = False
-    if n100 == 2:
-        isleappossible = True
-    if n4 >= 2:
-        n += 1
-    if (n100 == 2 and n4 >= 2) or (n100 > 2):
-        n -= 1
-
-    if n == 730 and isleappossible:
-        return year + 2, 12, 30
-    if n >= 731 and isleappossible:
-        n -= isleappossible
-
     n1, n = divmod(n, 365)
-
-    year += n1 + 1
-
-    if isleappossible and n1 == 1:
-        dumpyear = 2
-    else:
-        dumpyear = 1
-    month, day = _ord2md(dumpyear, n + 1)
+    year += n100 * 100 + n4 * 4 + n1 - 594
+    if n1 == 4 or n100 == 4:
+        # Last day of a leap year, i.e. Choitro 30 of the previous year.
+        return year - 1, 12, 30
+    leap = n1 == 3 and (n4 != 24 or n100 == 3)
+    month, day = _MONTH_DAY_OF_YEAR[leap][n + 1]
     return year, month, day
 
 
@@ -302,6 +321,102 @@ def _parse_hh_mm_ss_ff(tstr):
     return time_comps
 
 
+def _parse_isoformat_time(tstr):
+    # Format supported is HH[:MM[:SS[.fff[fff]]]][+HH:MM[:SS[.ffffff]]]
+    len_str = len(tstr)
+    if len_str < 2:
+        raise ValueError('Isoformat time too short')
+
+    # This is equivalent to re.search('[+-]', tstr), but faster
+    tz_pos = (tstr.find('-') + 1 or tstr.find('+') + 1)
+    timestr = tstr[:tz_pos - 1] if tz_pos > 0 else tstr
+
+    time_comps = _parse_hh_mm_ss_ff(timestr)
+
+    tzi = None
+    if tz_pos > 0:
+        tzstr = tstr[tz_pos:]
+
+        # Valid time zone strings are:
+        # HH:MM               len: 5
+        # HH:MM:SS            len: 8
+        # HH:MM:SS.ffffff     len: 15
+
+        if len(tzstr) not in (5, 8, 15):
+            raise ValueError('Malformed time zone string')
+
+        tz_comps = _parse_hh_mm_ss_ff(tzstr)
+        if all(x == 0 for x in tz_comps):
+            tzi = _datetime.timezone.utc
+        else:
+            tzsign = -1 if tstr[tz_pos - 1] == '-' else 1
+
+            td = _datetime.timedelta(hours=tz_comps[0],
+                                     minutes=tz_comps[1],
+                                     seconds=tz_comps[2],
+                                     microseconds=tz_comps[3])
+
+            tzi = _datetime.timezone(tzsign * td)
+
+    time_comps.append(tzi)
+
+    return time_comps
+
+
+def _format_offset(off):
+    s = ''
+    if off is not None:
+        if off.days < 0:
+            sign = "-"
+            off = -off
+        else:
+            sign = "+"
+        hh, mm = divmod(off, _datetime.timedelta(hours=1))
+        mm, ss = divmod(mm, _datetime.timedelta(minutes=1))
+        s += "%s%02d:%02d" % (sign, hh, mm)
+        if ss or ss.microseconds:
+            s += ":%02d" % ss.seconds
+
+            if ss.microseconds:
+                s += '.%06d' % ss.microseconds
+    return s
+
+
+def _timestamp2fields(t, offset):
+    """POSIX timestamp, UTC offset in seconds -> ordinal, hour, minute,
+    second, microsecond of the local time, by plain epoch-day arithmetic.
+    """
+    if isinstance(t, int):
+        us = 0
+    else:
+        frac, t = _math.modf(t)
+        us = round(frac * 1e6)
+        if us >= 1000000:
+            t += 1
+            us -= 1000000
+        elif us < 0:
+            t -= 1
+            us += 1000000
+        t = int(t)
+    days, secs = divmod(t + offset, 86400)
+    ordinal = _EPOCH_ORDINAL + days
+    if not 1 <= ordinal <= _MAXORDINAL:
+        raise OverflowError("timestamp out of range for platform time_t")
+    hh, secs = divmod(secs, 3600)
+    mm, ss = divmod(secs, 60)
+    return ordinal, hh, mm, ss, us
+
+
+def _utcoffset_seconds(tz):
+    "tzinfo with a fixed UTC offset -> that offset in seconds."
+    _check_tzinfo_arg(tz)
+    offset = tz.utcoffset(None)
+    if offset is None:
+        raise ValueError('tz must have a fixed UTC offset', tz)
+    _check_utc_offset("utcoffset", offset)
+    return offset // _datetime.timedelta(seconds=1)
+
+
 # Just raise TypeError if the arg isn't None or a string.
 def _check_tzname(name):
     if name is not None and not isinstance(name, str):
@@ -309,6 +424,30 @@ def _check_tzname(name):
                         "not '%s'" % type(name))
 
 
+# name is the offset-producing method, "utcoffset" or "dst".
+# offset is what it returned.
+# If offset isn't None or timedelta, raises TypeError.
+# If offset is None, returns None.
+# Else offset is checked for being in range.
+# If it is, its integer value is returned.  Else ValueError is raised.
+def _check_utc_offset(name, offset):
+    assert name in ("utcoffset", "dst")
+    if offset is None:
+        return
+    if not isinstance(offset, _datetime.timedelta):
+        raise TypeError("tzinfo.%s() must return None "
+                        "or timedelta, not '%s'" % (name, type(offset)))
+    if not -_datetime.timedelta(1) < offset < _datetime.timedelta(1):
+        raise ValueError("%s()=%s, must be strictly between "
+                         "-timedelta(hours=24) and timedelta(hours=24)" %
+                         (name, offset))
+
+
+def _check_tzinfo_arg(tz):
+    if tz is not None and not isinstance(tz, _datetime.tzinfo):
+        raise TypeError("tzinfo argument must be None or of a tzinfo subclass")
+
+
 def _check_gregorian_date_fields(year, month, day):
     year = _index(year)
     month = _index(month)
@@ -323,6 +462,36 @@ def _check_gregorian_date_fields(year, month, day):
     return year, month, day
 
 
+def _gregorian2bangla(gregorian_year, gregorian_month, gregorian_day):
+    """Gregorian year, month, day -> (year, month, day, ordinal) of the same
+    day in the Bangla calendar."""
+    gregorian_year, gregorian_month, gregorian_day = \
+        _check_gregorian_date_fields(gregorian_year,
+                                     gregorian_month,
+                                     gregorian_day)
+
+    bar = gregorian_month < 4 or \
+        (gregorian_month == 4 and gregorian_day < 14)
+    bangla_year = gregorian_year - 593 - bar
+    if bangla_year < MINYEAR:
+        raise ValueError('year must be in %d..%d' % (MINYEAR, MAXYEAR),
+                         bangla_year)
+
+    foo = _gregorian_day_at_bangla_month_end(gregorian_year, gregorian_month)
+    if gregorian_day <= foo:
+        bangla_month = (gregorian_month + 8) % 12 or 12
+        bangla_day = gregorian_day + (_bangla_day_at_gregorian_month_start(
+            gregorian_year, gregorian_month) - 1)
+    else:
+        bangla_month = (gregorian_month + 9) % 12 or 12
+        bangla_day = gregorian_day - (
+            _days_in_gregorian_month(gregorian_year, gregorian_month) -
+            _bangla_day_at_gregorian_month_end(gregorian_year,
+                                               gregorian_month))
+    return (bangla_year, bangla_month, bangla_day,
+            _checked_ymd2ord(bangla_year, bangla_month, bangla_day))
+
+
 def _check_date_fields(year, month, day):
     year = _index(year)
     month = _index(month)
@@ -381,7 +550,6 @@ def _divide_and_round(a, b):
 
 def _isoweek1monday(year):
     # Helper to calculate the day number of the Monday starting week 1
-    # XXX This could be done more efficiently
     THURSDAY = 3
     firstday = _ymd2ord(year, 1, 1)
     firstweekday = (firstday + 6) % 7  # See weekday() above
@@ -391,13 +559,69 @@ def _isoweek1monday(year):
     return week1monday
 
 
+@_lru_cache(maxsize=512)
+def _year_info(year):
+    "year -> (1 if leap year else 0, day number of the Monday of ISO week 1)."
+    return int(_is_leap(year)), _isoweek1monday(year)
+
+
+# Opt-in LRU cache of date.fromgregorian() results, keyed on the proleptic
+# Gregorian ordinal of the validated fields.  It holds shared date
+# instances, which is safe as they are immutable.  None when disabled.
+_gregorian_cache = None
+_gregorian_cache_maxsize = 0
+_gregorian_cache_hits = 0
+_gregorian_cache_misses = 0
+
+_CacheInfo = _namedtuple("CacheInfo",
+                         ["hits", "misses", "maxsize", "currsize"])
+
+
+def set_gregorian_cache(maxsize=1024):
+    """Cache up to maxsize results of date.fromgregorian(), evicting the
+    least recently used ones.  A maxsize of 0 or None disables the cache.
+    Either way the cache and its statistics start out empty.
+    """
+    global _gregorian_cache, _gregorian_cache_maxsize
+    if maxsize is not None:
+        maxsize = _index(maxsize)
+        if maxsize < 0:
+            raise ValueError('maxsize must not be negative', maxsize)
+    if maxsize:
+        _gregorian_cache = _OrderedDict()
+        _gregorian_cache_maxsize = maxsize
+    else:
+        _gregorian_cache = None
+        _gregorian_cache_maxsize = 0
+    clear_gregorian_cache()
+
+
+def gregorian_cache_info():
+    "Report the fromgregorian() cache statistics as (hits, misses, ...)."
+    cache = _gregorian_cache
+    return _CacheInfo(_gregorian_cache_hits, _gregorian_cache_misses,
+                      _gregorian_cache_maxsize,
+                      0 if cache is None else len(cache))
+
+
+def clear_gregorian_cache():
+    "Empty the fromgregorian() cache and reset its statistics."
+    global _gregorian_cache_hits, _gregorian_cache_misses
+    if _gregorian_cache is not None:
+        _gregorian_cache.clear()
+    _gregorian_cache_hits = _gregorian_cache_misses = 0
+
+
 class date:
     """Concrete date type.
     Constructors:
     __new__()
+    fromgregorian()
     fromtimestamp()
     today()
     fromordinal()
+    fromtrusted()
+    strptime()
     Operators:
     __repr__, __str__
     __eq__, __le__, __lt__, __ge__, __gt__, __hash__
@@ -405,6 +629,8 @@ class date:
     Methods:
     timetuple()
     toordinal()
+    togregorian()
+    shift()
     weekday()
     isoweekday(), isocalendar(), isoformat()
     ctime()
@@ -412,7 +638,8 @@ class date:
     Properties (readonly):
     year, month, day
     """
-    __slots__ = '_year', '_month', '_day', '_hashcode'
+    # _ordinal caches toordinal(); comparisons and hashing only look at it.
+    __slots__ = '_year', '_month', '_day', '_ordinal'
 
     def __new__(cls, year, month=None, day=None):
         """Constructor.
@@ -433,14 +660,13 @@ class date:
                         "pickle.load(data, encoding='latin1') is assumed.")
             self = object.__new__(cls)
             self.__setstate(year)
-            self._hashcode = -1
             return self
         year, month, day = _check_date_fields(year, month, day)
         self = object.__new__(cls)
         self._year = year
         self._month = month
         self._day = day
-        self._hashcode = -1
+        self._ordinal = _checked_ymd2ord(year, month, day)
         return self
 
     # Additional constructors
@@ -450,36 +676,46 @@ class date:
                       gregorian_year=None,
                       gregorian_month=None,
                       gregorian_day=None):
-
-        gregorian_year, gregorian_month, gregorian_day = \
-            _check_gregorian_date_fields(gregorian_year,
-                                         gregorian_month,
-                                         gregorian_day)
-
-        bar = gregorian_month < 4 or \
-            (gregorian_month == 4 and gregorian_day < 14)
-        bangla_year = gregorian_year - 593 - bar
-
-        foo = _gregorian_day_at_bangla_month_end(gregorian_year,
-                                                 gregorian_month)
-        if gregorian_day <= foo:
-            bangla_month = (gregorian_month + 8) % 12 or 12
-            bangla_day = gregorian_day + (_bangla_day_at_gregorian_month_start(
-                gregorian_year, gregorian_month) - 1)
+        """Construct a date from a Gregorian year, month and day.
+        See set_gregorian_cache() to reuse the results for repeated dates.
+        """
+        global _gregorian_cache_hits, _gregorian_cache_misses
+        cache = _gregorian_cache
+        if cache is None or cls is not date:
+            return cls._fromgregorian(gregorian_year, gregorian_month,
+                                      gregorian_day)
+        # Validate first, so that a hit accepts the same arguments as a
+        # miss, and key on the Gregorian ordinal.
+        key = _datetime.date(*_check_gregorian_date_fields(
+            gregorian_year, gregorian_month, gregorian_day)).toordinal()
+        try:
+            self = cache[key]
+            cache.move_to_end(key)
+        except KeyError:
+            pass
         else:
-            bangla_month = (gregorian_month + 9) % 12 or 12
-            bangla_day = gregorian_day - (
-                _days_in_gregorian_month(gregorian_year, gregorian_month) -
-                _bangla_day_at_gregorian_month_end(gregorian_year,
-                                                   gregorian_month))
-        return cls(bangla_year, bangla_month, bangla_day)
+            _gregorian_cache_hits += 1
+            return self
+        self = cls._fromordinal(key - _GREGORIAN_ORDINAL_OFFSET)
+        _gregorian_cache_misses += 1
+        cache[key] = self
+        if len(cache) > _gregorian_cache_maxsize:
+            cache.popitem(last=False)
+        return self
+
+    @classmethod
+    def _fromgregorian(cls, gregorian_year, gregorian_month, gregorian_day):
+        return cls._fromfields(*_gregorian2bangla(
+            gregorian_year, gregorian_month, gregorian_day))
 
     @classmethod
-    def fromtimestamp(cls, t):
-        "Construct a date from a POSIX timestamp (like time.time())."
-        y, m, d, hh, mm, ss, weekday, jday, dst = _time.localtime(t)
-        print("called from date class fromtimestamp method")
-        return cls.fromgregorian(y, m, d)
+    def fromtimestamp(cls, t, tz=None):
+        """Construct a date from a POSIX timestamp (like time.time()).
+        The date is the one in Bangladesh (BST) unless a time zone with a
+        fixed UTC offset, such as a datetime.timezone, is passed as tz.
+        """
+        offset = _BST_OFFSET if tz is None else _utcoffset_seconds(tz)
+        return cls._fromordinal(_timestamp2fields(t, offset)[0])
 
     @classmethod
     def today(cls):
@@ -489,12 +725,52 @@ class date:
 
     @classmethod
     def fromordinal(cls, n):
-        """Construct a date from a proleptic Gregorian ordinal.
-        January 1 of year 1 is day 1.  Only the year, month and day are
+        """Construct a date from an ordinal.
+        Boishakh 1 of year 1 is day 1.  Only the year, month and day are
         non-zero in the result.
         """
-        y, m, d = _ord2ymd(n)
-        return cls(y, m, d)
+        return cls._fromordinal(_index(n))
+
+    @classmethod
+    def _fromfields(cls, year, month, day, ordinal):
+        # For callers that derived the fields and the matching ordinal from
+        # an already valid date; nothing is checked.
+        self = object.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal = ordinal
+        return self
+
+    @classmethod
+    def _fromordinal(cls, n):
+        # _ord2ymd() checks the range of n and only returns valid fields, so
+        # they skip the checks done by __new__().
+        self = object.__new__(cls)
+        self._year, self._month, self._day = _ord2ymd(n)
+        self._ordinal = n
+        return self
+
+    @classmethod
+    def fromtrusted(cls, fields):
+        """Return a list of dates from an iterable of (year, month, day)
+        tuples of ints that are known to be valid, e.g. the fields of other
+        dates.  Unlike date(year, month, day), the fields are not checked:
+        invalid fields make invalid dates.
+        """
+        fromfields = cls._fromfields
+        return [
+            fromfields(year, month, day, _checked_ymd2ord(year, month, day))
+            for year, month, day in fields
+        ]
+
+    @classmethod
+    def strptime(cls, date_string, format):
+        """Construct a date from a string and a strftime() style format.
+        See bangladatetime.parsing.strptime() for the supported forms.
+        """
+        from bangladatetime.parsing import _strptime
+        return cls(*_strptime(date_string, format)[:3])
 
     @classmethod
     def fromisoformat(cls, date_string):
@@ -542,6 +818,13 @@ class date:
             return self.strftime(fmt)
         return str(self)
 
+    def strftime(self, fmt):
+        """Format using a strftime() style format string.
+        See bangladatetime.formatting for the supported directives.
+        """
+        from bangladatetime.formatting import strftime
+        return strftime(self, fmt)
+
     def isoformat(self):
         """Return the date formatted according to ISO.
         This is 'YYYY-MM-DD'.
@@ -578,63 +861,104 @@ class date:
                                   -1)
 
     def toordinal(self):
-        """Return proleptic Gregorian ordinal for the year, month and day.
-        January 1 of year 1 is day 1.  Only the year, month and day values
+        """Return the ordinal for the year, month and day.
+        Boishakh 1 of year 1 is day 1.  Only the year, month and day values
         contribute to the result.
         """
-        return _ymd2ord(self._year, self._month, self._day)
+        return self._ordinal
+
+    def togregorian(self):
+        """Return the matching Gregorian date as a datetime.date.
+        Bangla dates whose Gregorian year would exceed datetime.MAXYEAR
+        raise ValueError.
+        """
+        return _datetime.date.fromordinal(self.toordinal() +
+                                          _GREGORIAN_ORDINAL_OFFSET)
+
+    to_pydate = togregorian
 
     def replace(self, year=None, month=None, day=None):
         """Return a new date with new values for the specified fields."""
+        if year is None and month is None and day is None:
+            return type(self)._fromfields(self._year, self._month, self._day,
+                                          self._ordinal)
         if year is None:
             year = self._year
         if month is None:
             month = self._month
         if day is None:
             day = self._day
-        return type(self)(year, month, day)
+        year, month, day = _check_date_fields(year, month, day)
+        return type(self)._fromfields(year, month, day,
+                                      _checked_ymd2ord(year, month, day))
 
     # Comparisons of date objects with other.
 
     def __eq__(self, other):
         if isinstance(other, date):
-            return self._cmp(other) == 0
+            return self._ordinal == other._ordinal
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, date):
-            return self._cmp(other) <= 0
+            return self._ordinal <= other._ordinal
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, date):
-            return self._cmp(other) < 0
+            return self._ordinal < other._ordinal
         return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, date):
-            return self._cmp(other) >= 0
+            return self._ordinal >= other._ordinal
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, date):
-            return self._cmp(other) > 0
+            return self._ordinal > other._ordinal
         return NotImplemented
 
-    def _cmp(self, other):
-        assert isinstance(other, date)
-        y, m, d = self._year, self._month, self._day
-        y2, m2, d2 = other._year, other._month, other._day
-        return _cmp((y, m, d), (y2, m2, d2))
-
     def __hash__(self):
         "Hash."
-        if self._hashcode == -1:
-            self._hashcode = hash(self._getstate())
-        return self._hashcode
+        return hash(self._ordinal)
 
     # Computations
 
+    def __add__(self, other):
+        "Add a date to a timedelta."
+        if isinstance(other, _datetime.timedelta):
+            o = self._ordinal + other.days
+            if 0 < o <= _MAXORDINAL:
+                return type(self)._fromordinal(o)
+            raise OverflowError("result out of range")
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtract two dates, or a date and a timedelta."""
+        if isinstance(other, _datetime.timedelta):
+            return self + _datetime.timedelta(-other.days)
+        if isinstance(other, date) and not isinstance(other, datetime):
+            return _datetime.timedelta(self._ordinal - other._ordinal)
+        return NotImplemented
+
+    def shift(self, days):
+        """Return a list of this date moved by each number of days in days.
+        Equivalent to [self + timedelta(n) for n in days], without building
+        the timedelta objects.
+        """
+        fromordinal = type(self)._fromordinal
+        base = self._ordinal
+        result = []
+        for n in days:
+            o = base + _index(n)
+            if not 0 < o <= _MAXORDINAL:
+                raise OverflowError("result out of range")
+            result.append(fromordinal(o))
+        return result
+
     def weekday(self):
         "Return day of the week, where Monday == 0 ... Sunday == 6."
         return (self.toordinal() + 6) % 7
@@ -657,16 +981,16 @@ class date:
         (used with permission)
         """
         year = self._year
-        week1monday = _isoweek1monday(year)
-        today = _ymd2ord(self._year, self._month, self._day)
+        week1monday = _year_info(year)[1]
+        today = self.toordinal()
         # Internally, week and day have origin 0
         week, day = divmod(today - week1monday, 7)
         if week < 0:
             year -= 1
-            week1monday = _isoweek1monday(year)
+            week1monday = _year_info(year)[1]
             week, day = divmod(today - week1monday, 7)
         elif week >= 52:
-            if today >= _isoweek1monday(year + 1):
+            if today >= _year_info(year + 1)[1]:
                 year += 1
                 week = 0
         return year, week + 1, day + 1
@@ -680,33 +1004,935 @@ class date:
     def __setstate(self, string):
         yhi, ylo, self._month, self._day = string
         self._year = yhi * 256 + ylo
+        self._ordinal = _checked_ymd2ord(self._year, self._month, self._day)
 
     def __reduce__(self):
         return (self.__class__, self._getstate())
 
 
-# _date_class = date  # so functions w/ args named "date" can get at the class
-
-# date.min = date(1, 1, 1)
-# date.max = date(9999, 12, 30)
-
-# try:
-#     from _bangladatetime import *
-# except ImportError:
-#     pass
-# else:
-#     # Clean up unused names
-#     del (_GREGORIAN_DAY_AT_END_OF_BANGLA_MONTH,
-#          _BANGLA_DAY_AT_GREGORIAN_MONTH_START,
-#          _BANGLA_DAY_AT_GREGORIAN_MONTH_END, _DAYS_IN_GREGORIAN_MONTH,
-#          _DAYS_IN_BANGLA_MONTH, _DAYNAMES, _DAYS_BEFORE_MONTH, _DI100Y,
-#          _DI400Y, _DI4Y, _MAXORDINAL, _MONTHNAMES, _build_struct_time,
-#          _check_date_fields, _check_time_fields, _check_tzname, _cmp,
-#          _cmperror, _date_class, _days_before_month, _days_before_year,
-#          _days_in_month, _format_time, _is_leap, _isoweek1monday, _ord2ymd,
-#          _time, _ymd2ord, _divide_and_round)
-#     # XXX Since import * above excludes names that start with _,
-#     # docstring does not get overwritten. In the future, it may be
-#     # appropriate to maintain a single module level docstring and
-#     # remove the following line.
-#     from _datetime import __doc__
+# Built from their known ordinals, so that importing the module does not
+# build _DAYS_BEFORE_YEAR.
+date.min = date._fromfields(1, 1, 1, 1)
+date.max = date._fromfields(9999, 12, 30, _MAXORDINAL)
+date.resolution = _datetime.timedelta(days=1)
+
+
+class time:
+    """Time with time zone.
+    Constructors:
+    __new__()
+    fromisoformat()
+    Operators:
+    __repr__, __str__
+    __eq__, __le__, __lt__, __ge__, __gt__, __hash__
+    Methods:
+    isoformat()
+    utcoffset()
+    tzname()
+    dst()
+    Properties (readonly):
+    hour, minute, second, microsecond, tzinfo, fold
+    """
+    __slots__ = '_hour', '_minute', '_second', '_microsecond', '_tzinfo', \
+        '_fold'
+
+    def __new__(cls,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+                tzinfo=None,
+                *,
+                fold=0):
+        """Constructor.
+        Arguments:
+        hour, minute (required)
+        second, microsecond (default to zero)
+        tzinfo (default to None)
+        fold (keyword only, default to zero)
+        """
+        if (isinstance(hour, (bytes, str)) and len(hour) == 6
+                and ord(hour[0:1]) & 0x7F < 24):
+            # Pickle support
+            if isinstance(hour, str):
+                try:
+                    hour = hour.encode('latin1')
+                except UnicodeEncodeError:
+                    # More informative error message.
+                    raise ValueError(
+                        "Failed to encode latin1 string when unpickling "
+                        "a time object. "
+                        "pickle.load(data, encoding='latin1') is assumed.")
+            self = object.__new__(cls)
+            self.__setstate(hour, minute or None)
+            return self
+        hour, minute, second, microsecond, fold = _check_time_fields(
+            hour, minute, second, microsecond, fold)
+        _check_tzinfo_arg(tzinfo)
+        self = object.__new__(cls)
+        self._hour = hour
+        self._minute = minute
+        self._second = second
+        self._microsecond = microsecond
+        self._tzinfo = tzinfo
+        self._fold = fold
+        return self
+
+    @classmethod
+    def fromisoformat(cls, time_string):
+        """Construct a time from the output of isoformat()."""
+        if not isinstance(time_string, str):
+            raise TypeError('fromisoformat: argument must be str')
+
+        try:
+            return cls(*_parse_isoformat_time(time_string))
+        except Exception:
+            raise ValueError(f'Invalid isoformat string: {time_string!r}')
+
+    # Read-only field accessors
+    @property
+    def hour(self):
+        """hour (0-23)"""
+        return self._hour
+
+    @property
+    def minute(self):
+        """minute (0-59)"""
+        return self._minute
+
+    @property
+    def second(self):
+        """second (0-59)"""
+        return self._second
+
+    @property
+    def microsecond(self):
+        """microsecond (0-999999)"""
+        return self._microsecond
+
+    @property
+    def tzinfo(self):
+        """timezone info object"""
+        return self._tzinfo
+
+    @property
+    def fold(self):
+        return self._fold
+
+    # Standard conversions, __hash__ (and helpers)
+
+    # Comparisons of time objects with other.
+
+    def __eq__(self, other):
+        if isinstance(other, time):
+            return self._cmp(other, allow_mixed=True) == 0
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, time):
+            return self._cmp(other) <= 0
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, time):
+            return self._cmp(other) < 0
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, time):
+            return self._cmp(other) >= 0
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, time):
+            return self._cmp(other) > 0
+        return NotImplemented
+
+    def _cmp(self, other, allow_mixed=False):
+        assert isinstance(other, time)
+        mytz = self._tzinfo
+        ottz = other._tzinfo
+        myoff = otoff = None
+
+        if mytz is ottz:
+            base_compare = True
+        else:
+            myoff = self.utcoffset()
+            otoff = other.utcoffset()
+            base_compare = myoff == otoff
+
+        if base_compare:
+            return _cmp((self._hour, self._minute, self._second,
+                         self._microsecond),
+                        (other._hour, other._minute, other._second,
+                         other._microsecond))
+        if myoff is None or otoff is None:
+            if allow_mixed:
+                return 2  # arbitrary non-zero value
+            else:
+                raise TypeError("cannot compare naive and aware times")
+        myhhmm = self._hour * 60 + self._minute - myoff // _ONE_MINUTE
+        othhmm = other._hour * 60 + other._minute - otoff // _ONE_MINUTE
+        return _cmp((myhhmm, self._second, self._microsecond),
+                    (othhmm, other._second, other._microsecond))
+
+    def __hash__(self):
+        """Hash."""
+        tzoff = self.utcoffset()
+        if not tzoff:  # zero or None
+            return hash((self._hour, self._minute, self._second,
+                         self._microsecond))
+        h, m = divmod(
+            _datetime.timedelta(hours=self._hour, minutes=self._minute) -
+            tzoff, _datetime.timedelta(hours=1))
+        assert not m % _ONE_MINUTE, "whole minute"
+        m //= _ONE_MINUTE
+        return hash((h, m, self._second, self._microsecond))
+
+    # Conversion to string
+
+    def __repr__(self):
+        """Convert to formal string, for repr()."""
+        if self._microsecond != 0:
+            s = ", %d, %d" % (self._second, self._microsecond)
+        elif self._second != 0:
+            s = ", %d" % self._second
+        else:
+            s = ""
+        s = "%s.%s(%d, %d%s)" % (self.__class__.__module__,
+                                 self.__class__.__qualname__, self._hour,
+                                 self._minute, s)
+        if self._tzinfo is not None:
+            assert s[-1:] == ")"
+            s = s[:-1] + ", tzinfo=%r" % self._tzinfo + ")"
+        if self._fold:
+            assert s[-1:] == ")"
+            s = s[:-1] + ", fold=1)"
+        return s
+
+    def isoformat(self, timespec='auto'):
+        """Return the time formatted according to ISO.
+        The full format is 'HH:MM:SS.mmmmmm+zz:zz'. By default, the fractional
+        part is omitted if self.microsecond == 0.
+        The optional argument timespec specifies the number of additional
+        terms of the time to include. Valid options are 'auto', 'hours',
+        'minutes', 'seconds', 'milliseconds' and 'microseconds'.
+        """
+        s = _format_time(self._hour, self._minute, self._second,
+                         self._microsecond, timespec)
+        return s + _format_offset(self.utcoffset())
+
+    __str__ = isoformat
+
+    # Timezone functions
+
+    def utcoffset(self):
+        """Return the timezone offset as timedelta, positive east of UTC
+         (negative west of UTC)."""
+        if self._tzinfo is None:
+            return None
+        offset = self._tzinfo.utcoffset(None)
+        _check_utc_offset("utcoffset", offset)
+        return offset
+
+    def tzname(self):
+        """Return the timezone name.
+        Note that the name is 100% informational -- there's no requirement
+        that it mean anything in particular. For example, "GMT", "UTC",
+        "-500", "-5:00", "EDT", "US/Eastern", "America/New York" are all
+        valid replies.
+        """
+        if self._tzinfo is None:
+            return None
+        name = self._tzinfo.tzname(None)
+        _check_tzname(name)
+        return name
+
+    def dst(self):
+        """Return 0 if DST is not in effect, or the DST offset (as timedelta
+        positive eastward) if DST is in effect.
+        This is purely informational; the DST offset has already been added
+        to the UTC offset returned by utcoffset() if applicable, so there's
+        no need to consult dst() unless you're interested in displaying the
+        DST info.
+        """
+        if self._tzinfo is None:
+            return None
+        offset = self._tzinfo.dst(None)
+        _check_utc_offset("dst", offset)
+        return offset
+
+    def replace(self,
+                hour=None,
+                minute=None,
+                second=None,
+                microsecond=None,
+                tzinfo=True,
+                *,
+                fold=None):
+        """Return a new time with new values for the specified fields."""
+        if hour is None:
+            hour = self.hour
+        if minute is None:
+            minute = self.minute
+        if second is None:
+            second = self.second
+        if microsecond is None:
+            microsecond = self.microsecond
+        if tzinfo is True:
+            tzinfo = self.tzinfo
+        if fold is None:
+            fold = self._fold
+        return type(self)(hour,
+                          minute,
+                          second,
+                          microsecond,
+                          tzinfo,
+                          fold=fold)
+
+    # Pickle support.
+
+    def _getstate(self):
+        us2, us3 = divmod(self._microsecond, 256)
+        us1, us2 = divmod(us2, 256)
+        h = self._hour
+        if self._fold:
+            h += 128
+        basestate = bytes([h, self._minute, self._second, us1, us2, us3])
+        if self._tzinfo is None:
+            return (basestate, )
+        else:
+            return (basestate, self._tzinfo)
+
+    def __setstate(self, string, tzinfo):
+        if tzinfo is not None and not isinstance(tzinfo, _datetime.tzinfo):
+            raise TypeError("bad tzinfo state arg")
+        h, self._minute, self._second, us1, us2, us3 = string
+        if h > 127:
+            self._fold = 1
+            self._hour = h - 128
+        else:
+            self._fold = 0
+            self._hour = h
+        self._microsecond = (((us1 << 8) | us2) << 8) | us3
+        self._tzinfo = tzinfo
+
+    def __reduce__(self):
+        return (self.__class__, self._getstate())
+
+
+_ONE_MINUTE = _datetime.timedelta(minutes=1)
+
+time.min = time(0, 0, 0)
+time.max = time(23, 59, 59, 999999)
+time.resolution = _datetime.timedelta(microseconds=1)
+
+
+class datetime(date):
+    """datetime(year, month, day[, hour[, minute[, second[, microsecond[,
+    tzinfo]]]]])
+    The year, month and day arguments are required. tzinfo may be None, or
+    an instance of a tzinfo subclass. The remaining arguments may be ints.
+
+    Naive datetimes built from timestamps are in Bangladesh Standard Time
+    (BST), and naive datetimes are taken to be in BST by timestamp() and
+    astimezone().  Time zones are queried through the equivalent Gregorian
+    datetime.datetime, see togregorian().
+    """
+    __slots__ = '_hour', '_minute', '_second', '_microsecond', '_tzinfo', \
+        '_fold'
+
+    def __new__(cls,
+                year,
+                month=None,
+                day=None,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+                tzinfo=None,
+                *,
+                fold=0):
+        if (isinstance(year, (bytes, str)) and len(year) == 10
+                and 1 <= ord(year[2:3]) & 0x7F <= 12):
+            # Pickle support
+            if isinstance(year, str):
+                try:
+                    year = bytes(year, 'latin1')
+                except UnicodeEncodeError:
+                    # More informative error message.
+                    raise ValueError(
+                        "Failed to encode latin1 string when unpickling "
+                        "a datetime object. "
+                        "pickle.load(data, encoding='latin1') is assumed.")
+            self = object.__new__(cls)
+            self.__setstate(year, month)
+            return self
+        year, month, day = _check_date_fields(year, month, day)
+        hour, minute, second, microsecond, fold = _check_time_fields(
+            hour, minute, second, microsecond, fold)
+        _check_tzinfo_arg(tzinfo)
+        self = object.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal = _checked_ymd2ord(year, month, day)
+        self._hour = hour
+        self._minute = minute
+        self._second = second
+        self._microsecond = microsecond
+        self._tzinfo = tzinfo
+        self._fold = fold
+        return self
+
+    # Read-only field accessors
+    @property
+    def hour(self):
+        """hour (0-23)"""
+        return self._hour
+
+    @property
+    def minute(self):
+        """minute (0-59)"""
+        return self._minute
+
+    @property
+    def second(self):
+        """second (0-59)"""
+        return self._second
+
+    @property
+    def microsecond(self):
+        """microsecond (0-999999)"""
+        return self._microsecond
+
+    @property
+    def tzinfo(self):
+        """timezone info object"""
+        return self._tzinfo
+
+    @property
+    def fold(self):
+        return self._fold
+
+    @classmethod
+    def _fromfields(cls, year, month, day, ordinal):
+        self = super()._fromfields(year, month, day, ordinal)
+        self._hour = self._minute = self._second = self._microsecond = 0
+        self._tzinfo = None
+        self._fold = 0
+        return self
+
+    @classmethod
+    def _fromordinal(cls, n):
+        y, m, d = _ord2ymd(n)
+        return cls._fromfields(y, m, d, n)
+
+    @classmethod
+    def _fromfieldstime(cls, year, month, day, ordinal, hh, mm, ss, us, tz,
+                        fold=0):
+        # Fields are known to be valid, see _fromfields().
+        self = object.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal = ordinal
+        self._hour = hh
+        self._minute = mm
+        self._second = ss
+        self._microsecond = us
+        self._tzinfo = tz
+        self._fold = fold
+        return self
+
+    @classmethod
+    def _fromordinaltime(cls, n, hh, mm, ss, us, tz, fold=0):
+        return cls._fromfieldstime(*_ord2ymd(n), n, hh, mm, ss, us, tz, fold)
+
+    @classmethod
+    def _frompydatetime(cls, dt):
+        "Construct a datetime from the equivalent datetime.datetime."
+        n = dt.toordinal() - _GREGORIAN_ORDINAL_OFFSET
+        if not 1 <= n:
+            raise ValueError('date is before Boishakh 1, 0001')
+        return cls._fromordinaltime(n, dt.hour, dt.minute, dt.second,
+                                    dt.microsecond, dt.tzinfo, dt.fold)
+
+    @classmethod
+    def fromtimestamp(cls, t, tz=None):
+        """Construct a datetime from a POSIX timestamp (like time.time()).
+        A timezone info object may be passed in as well; without one the
+        result is the naive local time in Bangladesh (BST).
+        """
+        _check_tzinfo_arg(tz)
+        if tz is None:
+            return cls._fromordinaltime(*_timestamp2fields(t, _BST_OFFSET),
+                                        None)
+        if isinstance(tz, _datetime.timezone):
+            offset = tz.utcoffset(None)
+            if not offset.microseconds:
+                return cls._fromordinaltime(
+                    *_timestamp2fields(t, offset // _ONE_SECOND), tz)
+        utc = cls._fromordinaltime(*_timestamp2fields(t, 0), tz)
+        utc = utc.togregorian()
+        return cls._frompydatetime(tz.fromutc(utc))
+
+    @classmethod
+    def utcfromtimestamp(cls, t):
+        """Construct a naive UTC datetime from a POSIX timestamp."""
+        return cls._fromordinaltime(*_timestamp2fields(t, 0), None)
+
+    @classmethod
+    def now(cls, tz=None):
+        "Construct a datetime from time.time() and optional time zone info."
+        t = _time.time()
+        return cls.fromtimestamp(t, tz)
+
+    @classmethod
+    def utcnow(cls):
+        "Construct a UTC datetime from time.time()."
+        t = _time.time()
+        return cls.utcfromtimestamp(t)
+
+    @classmethod
+    def combine(cls, date, time, tzinfo=True):
+        "Construct a datetime from a given date and a given time."
+        if not isinstance(date, _date_class):
+            raise TypeError("date argument must be a date instance")
+        if not isinstance(time, _time_class):
+            raise TypeError("time argument must be a time instance")
+        if tzinfo is True:
+            tzinfo = time.tzinfo
+        else:
+            _check_tzinfo_arg(tzinfo)
+        # Both halves are valid already.
+        return cls._fromfieldstime(date._year, date._month, date._day,
+                                   date._ordinal, time.hour, time.minute,
+                                   time.second, time.microsecond, tzinfo,
+                                   time.fold)
+
+    @classmethod
+    def strptime(cls, date_string, format):
+        """Construct a datetime from a string and a strftime() style format.
+        See bangladatetime.parsing.strptime() for the supported forms.
+        """
+        from bangladatetime.parsing import _strptime
+        return cls(*_strptime(date_string, format))
+
+    @classmethod
+    def fromisoformat(cls, date_string):
+        """Construct a datetime from the output of datetime.isoformat()."""
+        if not isinstance(date_string, str):
+            raise TypeError('fromisoformat: argument must be str')
+
+        # Split this at the separator
+        dstr = date_string[0:10]
+        tstr = date_string[11:]
+
+        try:
+            date_components = _parse_isoformat_date(dstr)
+        except ValueError:
+            raise ValueError(f'Invalid isoformat string: {date_string!r}')
+
+        if tstr:
+            try:
+                time_components = _parse_isoformat_time(tstr)
+            except ValueError:
+                raise ValueError(f'Invalid isoformat string: {date_string!r}')
+        else:
+            time_components = [0, 0, 0, 0, None]
+
+        return cls(*(date_components + time_components))
+
+    def timetuple(self):
+        "Return local time tuple compatible with time.localtime()."
+        dst = self.dst()
+        if dst is None:
+            dst = -1
+        elif dst:
+            dst = 1
+        else:
+            dst = 0
+        return _build_struct_time(self.year, self.month, self.day, self.hour,
+                                  self.minute, self.second, dst)
+
+    def timestamp(self):
+        "Return POSIX timestamp as float"
+        offset = self.utcoffset()
+        if offset is None:
+            offset = BST.utcoffset(None)
+        return ((self._ordinal - _EPOCH_ORDINAL) * 86400 +
+                self._hour * 3600 + self._minute * 60 + self._second -
+                offset / _ONE_SECOND + self._microsecond / 1e6)
+
+    def date(self):
+        "Return the date part."
+        return _date_class._fromfields(self._year, self._month, self._day,
+                                       self._ordinal)
+
+    def time(self):
+        "Return the time part, with tzinfo None."
+        return time(self.hour,
+                    self.minute,
+                    self.second,
+                    self.microsecond,
+                    fold=self.fold)
+
+    def timetz(self):
+        "Return the time part, with same tzinfo."
+        return time(self.hour,
+                    self.minute,
+                    self.second,
+                    self.microsecond,
+                    self._tzinfo,
+                    fold=self.fold)
+
+    def togregorian(self):
+        """Return the equivalent Gregorian datetime.datetime.
+        Bangla dates whose Gregorian year would exceed datetime.MAXYEAR
+        raise ValueError.
+        """
+        g = _datetime.date.fromordinal(self._ordinal +
+                                       _GREGORIAN_ORDINAL_OFFSET)
+        return _datetime.datetime(g.year,
+                                  g.month,
+                                  g.day,
+                                  self._hour,
+                                  self._minute,
+                                  self._second,
+                                  self._microsecond,
+                                  self._tzinfo,
+                                  fold=self._fold)
+
+    to_pydatetime = togregorian
+
+    def replace(self,
+                year=None,
+                month=None,
+                day=None,
+                hour=None,
+                minute=None,
+                second=None,
+                microsecond=None,
+                tzinfo=True,
+                *,
+                fold=None):
+        """Return a new datetime with new values for the specified fields."""
+        if year is None and month is None and day is None:
+            # The date part is valid already.
+            year, month, day, ordinal = (self._year, self._month, self._day,
+                                         self._ordinal)
+        else:
+            if year is None:
+                year = self._year
+            if month is None:
+                month = self._month
+            if day is None:
+                day = self._day
+            year, month, day = _check_date_fields(year, month, day)
+            ordinal = _checked_ymd2ord(year, month, day)
+        if hour is None:
+            hour = self.hour
+        if minute is None:
+            minute = self.minute
+        if second is None:
+            second = self.second
+        if microsecond is None:
+            microsecond = self.microsecond
+        if tzinfo is True:
+            tzinfo = self.tzinfo
+        if fold is None:
+            fold = self.fold
+        hour, minute, second, microsecond, fold = _check_time_fields(
+            hour, minute, second, microsecond, fold)
+        _check_tzinfo_arg(tzinfo)
+        return type(self)._fromfieldstime(year, month, day, ordinal, hour,
+                                          minute, second, microsecond, tzinfo,
+                                          fold)
+
+    def astimezone(self, tz=None):
+        """Convert to the time zone tz, BST if it is None.
+        Naive datetimes are taken to be in BST.
+        """
+        if tz is None:
+            tz = BST
+        elif not isinstance(tz, _datetime.tzinfo):
+            raise TypeError("tz argument must be an instance of tzinfo")
+        if self._tzinfo is tz:
+            return self
+        dt = self.togregorian()
+        if dt.utcoffset() is None:
+            dt = dt.replace(tzinfo=BST)
+        return self._frompydatetime(dt.astimezone(tz))
+
+    # Ways to produce a string.
+
+    def ctime(self):
+        "Return ctime() style string."
+        weekday = self.toordinal() % 7 or 7
+        return "%s %s %2d %02d:%02d:%02d %04d" % (
+            _DAYNAMES[weekday], _MONTHNAMES[self._month], self._day,
+            self._hour, self._minute, self._second, self._year)
+
+    def isoformat(self, sep='T', timespec='auto'):
+        """Return the time formatted according to ISO.
+        The full format looks like 'YYYY-MM-DD HH:MM:SS.mmmmmm'.
+        By default, the fractional part is omitted if self.microsecond == 0.
+        If self.tzinfo is not None, the UTC offset is also attached, giving
+        a full format of 'YYYY-MM-DD HH:MM:SS.mmmmmm+HH:MM'.
+        Optional argument sep specifies the separator between date and
+        time, default 'T'.
+        The optional argument timespec specifies the number of additional
+        terms of the time to include. Valid options are 'auto', 'hours',
+        'minutes', 'seconds', 'milliseconds' and 'microseconds'.
+        """
+        s = ("%04d-%02d-%02d%c" % (self._year, self._month, self._day, sep) +
+             _format_time(self._hour, self._minute, self._second,
+                          self._microsecond, timespec))
+
+        return s + _format_offset(self.utcoffset())
+
+    def __repr__(self):
+        """Convert to formal string, for repr()."""
+        L = [
+            self._year, self._month, self._day, self._hour, self._minute,
+            self._second, self._microsecond
+        ]
+        if L[-1] == 0:
+            del L[-1]
+        if L[-1] == 0:
+            del L[-1]
+        s = "%s.%s(%s)" % (self.__class__.__module__,
+                           self.__class__.__qualname__, ", ".join(map(str,
+                                                                      L)))
+        if self._tzinfo is not None:
+            assert s[-1:] == ")"
+            s = s[:-1] + ", tzinfo=%r" % self._tzinfo + ")"
+        if self._fold:
+            assert s[-1:] == ")"
+            s = s[:-1] + ", fold=1)"
+        return s
+
+    def __str__(self):
+        "Convert to string, for str()."
+        return self.isoformat(sep=' ')
+
+    def utcoffset(self):
+        """Return the timezone offset as timedelta positive east of UTC
+        (negative west of UTC)."""
+        if self._tzinfo is None:
+            return None
+        return self.togregorian().utcoffset()
+
+    def tzname(self):
+        """Return the timezone name.
+        Note that the name is 100% informational -- there's no requirement
+        that it mean anything in particular. For example, "GMT", "UTC",
+        "-500", "-5:00", "EDT", "US/Eastern", "America/New York" are all
+        valid replies.
+        """
+        if self._tzinfo is None:
+            return None
+        return self.togregorian().tzname()
+
+    def dst(self):
+        """Return 0 if DST is not in effect, or the DST offset (as timedelta
+        positive eastward) if DST is in effect.
+        This is purely informational; the DST offset has already been added
+        to the UTC offset returned by utcoffset() if applicable, so there's
+        no need to consult dst() unless you're interested in displaying the
+        DST info.
+        """
+        if self._tzinfo is None:
+            return None
+        return self.togregorian().dst()
+
+    # Comparisons of datetime objects with other.
+
+    def __eq__(self, other):
+        if isinstance(other, datetime):
+            return self._cmp(other, allow_mixed=True) == 0
+        elif not isinstance(other, date):
+            return NotImplemented
+        else:
+            return False
+
+    def __le__(self, other):
+        if isinstance(other, datetime):
+            return self._cmp(other) <= 0
+        elif not isinstance(other, date):
+            return NotImplemented
+        else:
+            _cmperror(self, other)
+
+    def __lt__(self, other):
+        if isinstance(other, datetime):
+            return self._cmp(other) < 0
+        elif not isinstance(other, date):
+            return NotImplemented
+        else:
+            _cmperror(self, other)
+
+    def __ge__(self, other):
+        if isinstance(other, datetime):
+            return self._cmp(other) >= 0
+        elif not isinstance(other, date):
+            return NotImplemented
+        else:
+            _cmperror(self, other)
+
+    def __gt__(self, other):
+        if isinstance(other, datetime):
+            return self._cmp(other) > 0
+        elif not isinstance(other, date):
+            return NotImplemented
+        else:
+            _cmperror(self, other)
+
+    def _cmp(self, other, allow_mixed=False):
+        assert isinstance(other, datetime)
+        mytz = self._tzinfo
+        ottz = other._tzinfo
+        myoff = otoff = None
+
+        if mytz is ottz:
+            base_compare = True
+        else:
+            myoff = self.utcoffset()
+            otoff = other.utcoffset()
+            # Assume that allow_mixed means that we are called from __eq__
+            if allow_mixed:
+                if myoff != self.replace(fold=not self.fold).utcoffset():
+                    return 2
+                if otoff != other.replace(fold=not other.fold).utcoffset():
+                    return 2
+            base_compare = myoff == otoff
+
+        if base_compare:
+            return _cmp((self._ordinal, self._hour, self._minute,
+                         self._second, self._microsecond),
+                        (other._ordinal, other._hour, other._minute,
+                         other._second, other._microsecond))
+        if myoff is None or otoff is None:
+            if allow_mixed:
+                return 2  # arbitrary non-zero value
+            else:
+                raise TypeError("cannot compare naive and aware datetimes")
+        # XXX What follows could be done more efficiently...
+        diff = self - other  # this will take offsets into account
+        if diff.days < 0:
+            return -1
+        return diff and 1 or 0
+
+    def __add__(self, other):
+        "Add a datetime and a timedelta."
+        if not isinstance(other, _datetime.timedelta):
+            return NotImplemented
+        delta = _datetime.timedelta(self._ordinal,
+                                    hours=self._hour,
+                                    minutes=self._minute,
+                                    seconds=self._second,
+                                    microseconds=self._microsecond)
+        delta += other
+        hour, rem = divmod(delta.seconds, 3600)
+        minute, second = divmod(rem, 60)
+        if 0 < delta.days <= _MAXORDINAL:
+            return type(self)._fromordinaltime(delta.days, hour, minute,
+                                               second, delta.microseconds,
+                                               self._tzinfo)
+        raise OverflowError("result out of range")
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        "Subtract two datetimes, or a datetime and a timedelta."
+        if not isinstance(other, datetime):
+            if isinstance(other, _datetime.timedelta):
+                return self + -other
+            return NotImplemented
+
+        secs1 = self._second + self._minute * 60 + self._hour * 3600
+        secs2 = other._second + other._minute * 60 + other._hour * 3600
+        base = _datetime.timedelta(self._ordinal - other._ordinal,
+                                   secs1 - secs2,
+                                   self._microsecond - other._microsecond)
+        if self._tzinfo is other._tzinfo:
+            return base
+        myoff = self.utcoffset()
+        otoff = other.utcoffset()
+        if myoff == otoff:
+            return base
+        if myoff is None or otoff is None:
+            raise TypeError("cannot mix naive and timezone-aware time")
+        return base + otoff - myoff
+
+    def shift(self, days):
+        """Return a list of this datetime moved by each number of days in
+        days."""
+        return [self + _datetime.timedelta(_index(n)) for n in days]
+
+    def __hash__(self):
+        if self.fold:
+            t = self.replace(fold=0)
+        else:
+            t = self
+        tzoff = t.utcoffset()
+        delta = _datetime.timedelta(self._ordinal,
+                                    hours=self._hour,
+                                    minutes=self._minute,
+                                    seconds=self._second,
+                                    microseconds=self._microsecond)
+        if tzoff is None:
+            return hash(delta)
+        return hash(delta - tzoff)
+
+    # Pickle support.
+
+    def _getstate(self):
+        yhi, ylo = divmod(self._year, 256)
+        us2, us3 = divmod(self._microsecond, 256)
+        us1, us2 = divmod(us2, 256)
+        m = self._month
+        if self._fold:
+            m += 128
+        basestate = bytes([
+            yhi, ylo, m, self._day, self._hour, self._minute, self._second,
+            us1, us2, us3
+        ])
+        if self._tzinfo is None:
+            return (basestate, )
+        else:
+            return (basestate, self._tzinfo)
+
+    def __setstate(self, string, tzinfo):
+        if tzinfo is not None and not isinstance(tzinfo, _datetime.tzinfo):
+            raise TypeError("bad tzinfo state arg")
+        (yhi, ylo, m, self._day, self._hour, self._minute, self._second, us1,
+         us2, us3) = string
+        if m > 127:
+            self._fold = 1
+            self._month = m - 128
+        else:
+            self._fold = 0
+            self._month = m
+        self._year = yhi * 256 + ylo
+        self._microsecond = (((us1 << 8) | us2) << 8) | us3
+        self._tzinfo = tzinfo
+        self._ordinal = _checked_ymd2ord(self._year, self._month, self._day)
+
+
+_ONE_SECOND = _datetime.timedelta(seconds=1)
+_date_class = date  # so functions w/ args named "date" can get at the class
+_time_class = time  # so functions w/ args named "time" can get at the class
+
+datetime.min = datetime._fromfields(1, 1, 1, 1)
+datetime.max = datetime._fromordinaltime(_MAXORDINAL, 23, 59, 59, 999999, None)
+datetime.resolution = _datetime.timedelta(microseconds=1)
+
+try:
+    from _bangladatetime import (_check_date_fields,
+                                 _check_gregorian_date_fields,
+                                 _gregorian2bangla, _days_in_month, _ymd2ord,
+                                 _checked_ymd2ord, _ord2ymd)
+except ImportError:
+    pass
@@ -0,0 +1,259 @@
+"""A compact, read-only sequence of Bangla dates.
+
+DateArray keeps nothing but the ordinals of its dates, 4 bytes each, in a
+single int32 buffer.  date objects are only built when an item is taken
+out, slicing shares the buffer instead of copying it, and the year, month,
+day and weekday of all the dates are computed column-wise, with NumPy when
+it is installed.
+"""
+
+__all__ = ("DateArray", )
+
+from array import array as _array
+from bisect import bisect_left as _bisect_left, bisect_right as _bisect_right
+from operator import index as _index
+
+from bangladatetime.date import date, _ord2ymd, _MAXORDINAL
+
+# Typecode of the ordinal buffers, a 4 byte signed integer.
+_TYPECODE = 'i'
+assert _array(_TYPECODE).itemsize == 4
+
+
+def _columns(ordinals):
+    "memoryview of ordinals -> (year, month, day) as array('i')s."
+    try:
+        import numpy as np
+        from bangladatetime import batch
+    except ImportError:
+        columns = (_array(_TYPECODE), _array(_TYPECODE), _array(_TYPECODE))
+        years, months, days = (column.append for column in columns)
+        for n in ordinals:
+            y, m, d = _ord2ymd(n)
+            years(y)
+            months(m)
+            days(d)
+        return columns
+    return tuple(
+        _array(_TYPECODE,
+               column.astype(np.int32).tobytes())
+        for column in batch._ord2ymd(np.asarray(ordinals, dtype=np.int64)))
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _toreadonly(view):
+    "memoryview of 4 byte ints -> read-only memoryview of the same ints."
+    try:
+        toreadonly = view.toreadonly
+    except AttributeError:
+        # memoryview.toreadonly() is new in Python 3.8; before, copy the
+        # ints into an immutable bytes object.
+        if view.readonly:
+            return view
+        return memoryview(view.tobytes()).cast(_TYPECODE)
+    return toreadonly()
+
+
+def _readonly(values):
+    "int32 ndarray or iterable of ints -> read-only memoryview of 'i'."
+    if hasattr(values, 'tobytes'):
+        return _toreadonly(memoryview(_array(_TYPECODE, values.tobytes())))
+    return _toreadonly(memoryview(_array(_TYPECODE, values)))
+
+
+class DateArray:
+    """DateArray(dates) --> an immutable sequence of dates
+
+    dates is an iterable of date objects; see also fromordinals().  Items
+    are returned as date objects and slices as DateArrays sharing the
+    buffer of this one.  Properties year, month and day, and method
+    weekday() return an array('i') with that field of every date.
+    """
+    __slots__ = '_ordinals',
+
+    def __init__(self, dates=()):
+        ordinals = _array(_TYPECODE)
+        for d in dates:
+            if not isinstance(d, date):
+                raise TypeError('DateArray items must be dates, not %s' %
+                                type(d).__name__)
+            ordinals.append(d.toordinal())
+        self._ordinals = _toreadonly(memoryview(ordinals))
+
+    @classmethod
+    def fromordinals(cls, ordinals):
+        """Construct a DateArray from date ordinals.
+
+        A buffer of 4 byte integers, such as an array('i'), the result of
+        parse_isoformat_many(..., ordinals=True) or an int32 NumPy array,
+        is used without copying, so it must not be changed afterwards (on
+        Python 3.7 and older, writable buffers are copied).  Any other
+        iterable of ints is copied.
+        """
+        try:
+            view = memoryview(ordinals)
+        except TypeError:
+            view = None
+        else:
+            if view.ndim != 1 or view.format not in ('i', '=i') or \
+                    view.itemsize != 4:
+                view = None
+        if view is None:
+            view = memoryview(_array(_TYPECODE, map(_index, ordinals)))
+        if len(view):
+            np = _numpy()
+            if np is not None:
+                values = np.asarray(view)
+                low, high = values.min(), values.max()
+            else:
+                low, high = min(view), max(view)
+            if not (1 <= low and high <= _MAXORDINAL):
+                raise ValueError('ordinals must be in 1..%d' % _MAXORDINAL)
+        return cls._fromview(_toreadonly(view))
+
+    @classmethod
+    def _fromview(cls, view):
+        self = object.__new__(cls)
+        self._ordinals = view
+        return self
+
+    @property
+    def ordinals(self):
+        "Read-only memoryview of the ordinals, 4 byte ints."
+        return self._ordinals
+
+    def to_numpy(self):
+        "Return the ordinals as an int32 NumPy array sharing the buffer."
+        import numpy as np
+        return np.asarray(self._ordinals, dtype=np.int32)
+
+    # Sequence protocol
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._fromview(self._ordinals[index])
+        return date._fromordinal(self._ordinals[index])
+
+    def __iter__(self):
+        fromordinal = date._fromordinal
+        for n in self._ordinals:
+            yield fromordinal(n)
+
+    def __contains__(self, value):
+        if not isinstance(value, date):
+            return False
+        return value.toordinal() in self._ordinals
+
+    def __eq__(self, other):
+        if isinstance(other, DateArray):
+            return self._ordinals == other._ordinals
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        if len(self) > 6:
+            items = [repr(d) for d in self[:3]] + ['...'] + \
+                [repr(d) for d in self[-3:]]
+        else:
+            items = [repr(d) for d in self]
+        return '%s.%s([%s])' % (self.__class__.__module__,
+                                self.__class__.__qualname__, ', '.join(items))
+
+    def __reduce__(self):
+        return (self.__class__.fromordinals,
+                (_array(_TYPECODE, self._ordinals), ))
+
+    # Fields
+
+    @property
+    def year(self):
+        "array('i') of the years."
+        return _columns(self._ordinals)[0]
+
+    @property
+    def month(self):
+        "array('i') of the months, 1..12."
+        return _columns(self._ordinals)[1]
+
+    @property
+    def day(self):
+        "array('i') of the days of the month."
+        return _columns(self._ordinals)[2]
+
+    def fields(self):
+        "Return the (year, month, day) arrays at once, see above."
+        return _columns(self._ordinals)
+
+    def weekday(self):
+        "array('i') of the days of the week, Monday == 0 ... Sunday == 6."
+        np = _numpy()
+        if np is not None:
+            weekdays = (np.asarray(self._ordinals, dtype=np.int64) + 6) % 7
+            return _array(_TYPECODE, weekdays.astype(np.int32).tobytes())
+        return _array(_TYPECODE, [(n + 6) % 7 for n in self._ordinals])
+
+    # Searching and reductions
+
+    def searchsorted(self, value, side='left'):
+        """Return the index where the date value would be inserted to keep
+        this array sorted, which it must already be.  With side='left' the
+        index is before any equal dates, with side='right' after them.
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'", side)
+        if not isinstance(value, date):
+            raise TypeError('searchsorted() value must be a date, not %s' %
+                            type(value).__name__)
+        bisect = _bisect_left if side == 'left' else _bisect_right
+        return bisect(self._ordinals, value.toordinal())
+
+    def min(self):
+        "Return the earliest date."
+        if not len(self):
+            raise ValueError('min() of an empty DateArray')
+        np = _numpy()
+        if np is not None:
+            return date._fromordinal(int(np.asarray(self._ordinals).min()))
+        return date._fromordinal(min(self._ordinals))
+
+    def max(self):
+        "Return the latest date."
+        if not len(self):
+            raise ValueError('max() of an empty DateArray')
+        np = _numpy()
+        if np is not None:
+            return date._fromordinal(int(np.asarray(self._ordinals).max()))
+        return date._fromordinal(max(self._ordinals))
+
+    def sorted(self):
+        "Return a new DateArray with the dates in ascending order."
+        np = _numpy()
+        if np is not None:
+            return self._fromview(_readonly(np.sort(np.asarray(
+                self._ordinals))))
+        return self._fromview(_readonly(sorted(self._ordinals)))
+
+    def unique(self):
+        "Return a new DateArray with the distinct dates in ascending order."
+        np = _numpy()
+        if np is not None:
+            # Sort and drop repeats; much faster than np.unique() here.
+            ordinals = np.sort(np.asarray(self._ordinals))
+            if len(ordinals):
+                keep = np.empty(len(ordinals), dtype=bool)
+                keep[0] = True
+                np.not_equal(ordinals[1:], ordinals[:-1], out=keep[1:])
+                ordinals = ordinals[keep]
+            return self._fromview(_readonly(ordinals))
+        return self._fromview(_readonly(sorted(set(self._ordinals))))
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""strftime() for Bangla dates.
+
+Supported directives:
+
+    %a  Weekday as abbreviated name (Mon)      %A  Weekday as full name
+    %b  Month as abbreviated name (Bois)       %B  Month as full name
+    %d  Day of the month, 01..31               %e  Day of the month, 1..31
+    %m  Month, 01..12                          %j  Day of the year, 001..366
+    %y  Year without century, 00..99           %Y  Year, 0001..9999
+    %u  ISO weekday, Monday is 1..7            %w  Weekday, Sunday is 0..6
+    %G  ISO year                               %V  ISO week number, 01..53
+    %H  Hour, 00..23                           %M  Minute, 00..59
+    %S  Second, 00..59                         %f  Microsecond, 000000..999999
+    %%  A literal '%'
+
+The O modifier switches a directive to the Bangla script: %Od, %Om, %OY
+and the other numeric directives use Bangla digits, %Oa/%OA and %Ob/%OB
+give the weekday and month names in Bangla.
+
+A format string is compiled once into a %-style template plus the field
+getters that fill it, and the result is cached, so formatting many dates
+with the same format does not parse it again.
+"""
+
+__all__ = ("strftime", )
+
+from functools import lru_cache as _lru_cache
+
+from bangladatetime.date import (_MONTHNAMES, _DAYNAMES, _DAYS_BEFORE_MONTH,
+                                 _is_leap)
+
+_FULL_MONTHNAMES = [
+    None, "Boishakh", "Jyoishtho", "Asharh", "Shrabon", "Bhadro", "Ashshin",
+    "Kartik", "Ogrohayon", "Poush", "Magh", "Falgun", "Choitro"
+]
+_BANGLA_MONTHNAMES = [
+    None, "বৈশাখ", "জ্যৈষ্ঠ", "আষাঢ়", "শ্রাবণ", "ভাদ্র", "আশ্বিন", "কার্তিক",
+    "অগ্রহায়ণ", "পৌষ", "মাঘ", "ফাল্গুন", "চৈত্র"
+]
+_FULL_DAYNAMES = [
+    None, "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday",
+    "Sunday"
+]
+_BANGLA_DAYNAMES = [
+    None, "সোম", "মঙ্গল", "বুধ", "বৃহস্পতি", "শুক্র", "শনি", "রবি"
+]
+_BANGLA_FULL_DAYNAMES = [
+    None, "সোমবার", "মঙ্গলবার", "বুধবার", "বৃহস্পতিবার", "শুক্রবার", "শনিবার",
+    "রবিবার"
+]
+
+_BANGLA_DIGITS = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+
+def _day_of_year(d):
+    month = d.month
+    return (_DAYS_BEFORE_MONTH[month] + (month == 12 and _is_leap(d.year)) +
+            d.day)
+
+
+def _time_field(name):
+    # date has no time fields, they format as zero.
+    def get(d):
+        return getattr(d, name, 0)
+
+    return get
+
+
+# Numeric directives: conversion spec, field getter.
+_NUMERIC = {
+    'd': ('%02d', lambda d: d.day),
+    'e': ('%d', lambda d: d.day),
+    'm': ('%02d', lambda d: d.month),
+    'j': ('%03d', _day_of_year),
+    'y': ('%02d', lambda d: d.year % 100),
+    'Y': ('%04d', lambda d: d.year),
+    'u': ('%d', lambda d: d.isoweekday()),
+    'w': ('%d', lambda d: d.isoweekday() % 7),
+    'G': ('%04d', lambda d: d.isocalendar()[0]),
+    'V': ('%02d', lambda d: d.isocalendar()[1]),
+    'H': ('%02d', _time_field('hour')),
+    'M': ('%02d', _time_field('minute')),
+    'S': ('%02d', _time_field('second')),
+    'f': ('%06d', _time_field('microsecond')),
+}
+
+# Name directives: (names, Bangla script names), index getter.
+_NAMES = {
+    'a': ((_DAYNAMES, _BANGLA_DAYNAMES), lambda d: d.isoweekday()),
+    'A': ((_FULL_DAYNAMES, _BANGLA_FULL_DAYNAMES), lambda d: d.isoweekday()),
+    'b': ((_MONTHNAMES, _BANGLA_MONTHNAMES), lambda d: d.month),
+    'B': ((_FULL_MONTHNAMES, _BANGLA_MONTHNAMES), lambda d: d.month),
+}
+
+
+def _bangla_number(spec, get):
+    def emit(d):
+        return (spec % get(d)).translate(_BANGLA_DIGITS)
+
+    return emit
+
+
+def _name(names, get):
+    def emit(d):
+        return names[get(d)]
+
+    return emit
+
+
+@_lru_cache(maxsize=128)
+def _compile(fmt):
+    "format -> (%-style template, tuple of getters filling it)."
+    template = []
+    getters = []
+    i, n = 0, len(fmt)
+    while i < n:
+        ch = fmt[i]
+        i += 1
+        if ch != '%':
+            template.append(ch)
+            continue
+        if i == n:
+            raise ValueError('stray %% at end of format %r' % fmt)
+        ch = fmt[i]
+        i += 1
+        bangla = ch == 'O'
+        if bangla:
+            if i == n:
+                raise ValueError('stray %%O at end of format %r' % fmt)
+            ch = fmt[i]
+            i += 1
+        if ch == '%' and not bangla:
+            template.append('%%')
+        elif ch in _NUMERIC:
+            spec, get = _NUMERIC[ch]
+            if bangla:
+                template.append('%s')
+                getters.append(_bangla_number(spec, get))
+            else:
+                template.append(spec)
+                getters.append(get)
+        elif ch in _NAMES:
+            names, get = _NAMES[ch]
+            template.append('%s')
+            getters.append(_name(names[bangla], get))
+        else:
+            raise ValueError('invalid format directive %r in %r' %
+                             ('%O' + ch if bangla else '%' + ch, fmt))
+    return ''.join(template), tuple(getters)
+
+
+def strftime(d, fmt):
+    "Format the date (or datetime) d according to fmt, see above."
+    template, getters = _compile(fmt)
+    return template % tuple([get(d) for get in getters])
@@ -0,0 +1,209 @@
+"""A precomputed table of every Bangla date, shared through mmap.
+
+write_table() stores the year, month and day of every ordinal from 1 to
+the ordinal of date.max in a binary file, and LookupTable maps that file
+read-only.  Every process that opens the same file shares one copy of it
+in the page cache, and converting an ordinal or a Gregorian date to a
+Bangla date is then one indexed read:
+
+    offset  size  field
+         0     4  magic, b'BNLT'
+         4     2  format version, 1
+         6     2  flags, 0
+         8     4  number of ordinals, the ordinal of date.max
+        12     4  Gregorian ordinal minus Bangla ordinal of every day
+        16     4  CRC-32 of the entries
+        20    12  padding
+        32   4*n  entries
+
+Entry i - 1 is the date with ordinal i, packed in a little-endian uint32 as
+year << 9 | month << 5 | day.  The Gregorian ordinal of a day is its
+ordinal plus the offset of the header, so it needs no column of its own.
+
+LookupTable rejects a file of another format version, a file whose
+entries do not match its CRC-32 and a file written for other calendar
+rules, which it detects by checking a sample of entries against
+date.fromordinal().
+"""
+
+__all__ = ("LookupTable", "write_table")
+
+import datetime as _datetime
+import mmap as _mmap
+import os as _os
+import struct as _struct
+import sys as _sys
+import zlib as _zlib
+from array import array as _array
+from operator import index as _index
+
+from bangladatetime.date import (date, _days_in_month, _ord2ymd,
+                                 _GREGORIAN_ORDINAL_OFFSET, _MAXORDINAL,
+                                 MINYEAR, MAXYEAR)
+
+_MAGIC = b'BNLT'
+_VERSION = 1
+# magic, version, flags, count, Gregorian offset, crc32
+_HEADER = _struct.Struct('<4sHHIiI12x')
+_ENTRY = 'I'
+_ENTRY_STRUCT = _struct.Struct('<I')
+assert _array(_ENTRY).itemsize == 4
+
+_LITTLE_ENDIAN = _sys.byteorder == 'little'
+
+# Ordinals checked against _ord2ymd() when a table is opened.
+_SAMPLE = range(1, _MAXORDINAL + 1, 9973)
+
+
+def _entries():
+    "-> array of the packed fields of every date, in ordinal order."
+    entries = _array(_ENTRY)
+    extend = entries.extend
+    for year in range(MINYEAR, MAXYEAR + 1):
+        for month in range(1, 13):
+            first = year << 9 | month << 5
+            extend(range(first + 1, first + _days_in_month(year, month) + 1))
+    assert len(entries) == _MAXORDINAL
+    return entries
+
+
+def write_table(path):
+    """Write the lookup table to the file at path, replacing it atomically
+    if it exists, and return the number of entries.
+    """
+    entries = _entries()
+    if not _LITTLE_ENDIAN:
+        entries.byteswap()
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, len(entries),
+                          _GREGORIAN_ORDINAL_OFFSET, _zlib.crc32(entries))
+    # Workers may be mapping the old file; they keep their copy.
+    tmp = '%s.%d.tmp' % (path, _os.getpid())
+    try:
+        with open(tmp, 'wb') as file:
+            file.write(header)
+            file.write(entries)
+        _os.replace(tmp, path)
+    except BaseException:
+        try:
+            _os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return len(entries)
+
+
+def _unpack(entry):
+    return entry >> 9, entry >> 5 & 15, entry & 31
+
+
+def _check(data, verify):
+    "Raise ValueError unless the buffer data holds a valid, current table."
+    if len(data) < _HEADER.size:
+        raise ValueError('truncated lookup table header')
+    magic, version, flags, count, offset, crc = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError('not a bangladatetime lookup table')
+    if version != _VERSION:
+        raise ValueError('unsupported lookup table version %d' % version)
+    if count != _MAXORDINAL or offset != _GREGORIAN_ORDINAL_OFFSET:
+        raise ValueError('lookup table written for other calendar rules')
+    if len(data) != _HEADER.size + 4 * count:
+        raise ValueError('truncated lookup table')
+    if verify:
+        with memoryview(data) as view:
+            if _zlib.crc32(view[_HEADER.size:]) != crc:
+                raise ValueError('lookup table checksum mismatch')
+    for n in (*_SAMPLE, _MAXORDINAL):
+        entry, = _ENTRY_STRUCT.unpack_from(data, _HEADER.size + 4 * (n - 1))
+        if _unpack(entry) != _ord2ymd(n):
+            raise ValueError('lookup table written for other calendar rules')
+
+
+class LookupTable:
+    """LookupTable(path, verify=True) --> the table written by write_table()
+
+    The file is memory mapped read-only.  With verify true, the default,
+    the CRC-32 of all the entries is checked, which reads the whole file
+    once; the format version and a sample of the entries are always
+    checked.  Invalid or stale tables raise ValueError.
+
+    A table opened before os.fork() is shared with the children; opening the
+    same file in every worker process shares it as well.
+    """
+    __slots__ = '_mmap', '_entries'
+
+    def __init__(self, path, verify=True):
+        with open(path, 'rb') as file:
+            data = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+        try:
+            _check(data, verify)
+        except BaseException:
+            data.close()
+            raise
+        entries = memoryview(data)[_HEADER.size:].cast(_ENTRY)
+        if not _LITTLE_ENDIAN:
+            entries = _array(_ENTRY, entries)
+            entries.byteswap()
+            entries = memoryview(entries)
+        self._mmap = data
+        self._entries = entries
+
+    def close(self):
+        "Unmap the file.  The table cannot be used afterwards."
+        entries, self._entries = self._entries, memoryview(b'').cast(_ENTRY)
+        entries.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ord2ymd(self, n):
+        "Return the (year, month, day) of the date with ordinal n."
+        if not 1 <= n <= len(self._entries):
+            raise ValueError('ordinal must be in 1..%d' % _MAXORDINAL, n)
+        return _unpack(self._entries[n - 1])
+
+    def fromordinal(self, n):
+        "Like date.fromordinal()."
+        n = _index(n)
+        if not 1 <= n <= len(self._entries):
+            raise ValueError('ordinal must be in 1..%d' % _MAXORDINAL, n)
+        entry = self._entries[n - 1]
+        return date._fromfields(entry >> 9, entry >> 5 & 15, entry & 31, n)
+
+    def fromgregorian(self,
+                      gregorian_year=None,
+                      gregorian_month=None,
+                      gregorian_day=None):
+        """Like date.fromgregorian(); gregorian_year may also be a
+        datetime.date."""
+        if isinstance(gregorian_year, _datetime.date):
+            g = gregorian_year
+        else:
+            g = _datetime.date(gregorian_year, gregorian_month,
+                               gregorian_day)
+        n = g.toordinal() - _GREGORIAN_ORDINAL_OFFSET
+        if not 1 <= n <= len(self._entries):
+            raise ValueError('date out of the Bangla calendar range', g)
+        entry = self._entries[n - 1]
+        return date._fromfields(entry >> 9, entry >> 5 & 15, entry & 31, n)
+
+    def fromordinals(self, ordinals):
+        "fromordinal() of every ordinal of the iterable; return a list."
+        entries = self._entries
+        size = len(entries)
+        fromfields = date._fromfields
+        result = []
+        append = result.append
+        for n in ordinals:
+            if not 1 <= n <= size:
+                raise ValueError('ordinal must be in 1..%d' % _MAXORDINAL, n)
+            entry = entries[n - 1]
+            append(fromfields(entry >> 9, entry >> 5 & 15, entry & 31, n))
+        return result
@@ -0,0 +1,368 @@
+"""pandas integration: a Bangla date dtype and a ``.bangla`` accessor.
+
+Importing this module registers
+
+* the ``"bangladate"`` extension dtype, BanglaDateDtype, whose values are
+  stored as int32 date ordinals in a BanglaDateArray, 0 marking a missing
+  value;
+* the ``.bangla`` accessor on Series holding ``datetime64`` or
+  ``bangladate`` values, with ``year``, ``month``, ``day``, ``weekday``,
+  ``ordinal``, ``date`` and ``strftime()``.
+
+Everything goes through the vectorized conversions of
+``bangladatetime.batch``, so e.g. ``df.groupby(s.bangla.month)`` never
+builds a date object per row:
+
+    >>> import bangladatetime.pandas
+    >>> s = pd.Series(pd.to_datetime(['2020-12-24', '2021-04-14']))
+    >>> s.bangla.month.tolist()
+    [9, 1]
+
+pandas and NumPy are optional dependencies; they are only needed by this
+module.
+"""
+
+__all__ = ("BanglaDateDtype", "BanglaDateArray", "BanglaAccessor")
+
+import datetime as _datetime
+import numbers as _numbers
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (ExtensionArray, ExtensionDtype,
+                                   register_extension_dtype,
+                                   register_series_accessor, take)
+from pandas.api.indexers import check_array_indexer
+
+from bangladatetime import batch
+from bangladatetime.date import date, _EPOCH_ORDINAL, _MAXORDINAL
+
+# Ordinal standing for a missing value; real ordinals start at 1.
+_NA = 0
+
+
+def _is_na(value):
+    return value is None or value is pd.NaT or (isinstance(
+        value, (float, np.floating)) and value != value)
+
+
+def _check_ordinals(ordinals):
+    valid = ordinals[ordinals != _NA]
+    if len(valid) and not (1 <= valid.min() and valid.max() <= _MAXORDINAL):
+        raise ValueError('date out of the supported range')
+    return ordinals
+
+
+def _datetime64_to_ordinals(values):
+    "datetime64 array-like -> int32 ordinals, naive wall clock dates."
+    values = pd.DatetimeIndex(values)
+    if values.tz is not None:
+        values = values.tz_localize(None)
+    na = values.isna()
+    days = np.asarray(values.values.astype('datetime64[D]').astype(np.int64))
+    ordinals = np.where(na, _NA, days + _EPOCH_ORDINAL)
+    return _check_ordinals(ordinals).astype(np.int32)
+
+
+def _scalar_to_ordinal(value):
+    if _is_na(value):
+        return _NA
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, (_datetime.date, np.datetime64)):
+        # A Gregorian date, datetime or Timestamp.
+        value = pd.Timestamp(value)
+        if value is pd.NaT:
+            return _NA
+        value = date.fromgregorian(value.year, value.month, value.day)
+        return value.toordinal()
+    raise TypeError('can not convert %s to a Bangla date' %
+                    type(value).__name__)
+
+
+def _to_ordinals(values):
+    "dates, Gregorian datetimes or BanglaDateArray -> int32 ordinals."
+    if isinstance(values, BanglaDateArray):
+        return values._ordinals
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.array
+    if isinstance(values, BanglaDateArray):
+        return values._ordinals
+    if pd.api.types.is_datetime64_any_dtype(getattr(values, 'dtype', None)):
+        return _datetime64_to_ordinals(values)
+    return np.fromiter((_scalar_to_ordinal(value) for value in values),
+                       dtype=np.int32)
+
+
+@register_extension_dtype
+class BanglaDateDtype(ExtensionDtype):
+    "Extension dtype of Bangla dates, spelled 'bangladate'."
+    name = 'bangladate'
+    type = date
+    kind = 'O'
+    na_value = pd.NaT
+
+    @classmethod
+    def construct_array_type(cls):
+        return BanglaDateArray
+
+
+class BanglaDateArray(ExtensionArray):
+    """ExtensionArray of Bangla dates, stored as int32 ordinals.
+
+    BanglaDateArray(values) accepts another BanglaDateArray, a datetime64
+    array-like (the Gregorian dates are converted) or an iterable of
+    bangladatetime dates, Gregorian dates and missing values.
+    """
+    _dtype = BanglaDateDtype()
+
+    def __init__(self, values, copy=False):
+        ordinals = _to_ordinals(values)
+        self._ordinals = ordinals.copy() if copy else ordinals
+
+    @classmethod
+    def _fromordinals(cls, ordinals):
+        self = cls.__new__(cls)
+        self._ordinals = ordinals
+        return self
+
+    @classmethod
+    def fromordinals(cls, ordinals):
+        "Construct from date ordinals, 0 (or NaN) marking missing values."
+        ordinals = np.asarray(ordinals)
+        if ordinals.dtype.kind == 'f':
+            ordinals = np.where(np.isnan(ordinals), _NA, ordinals)
+        return cls._fromordinals(
+            _check_ordinals(ordinals.astype(np.int32, copy=True)))
+
+    # ExtensionArray interface
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        return cls(scalars, copy=copy)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype=None, copy=False):
+        return cls([None if _is_na(s) else date.fromisoformat(s)
+                    for s in strings])
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls._fromordinals(values.astype(np.int32))
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls._fromordinals(
+            np.concatenate([array._ordinals for array in to_concat]))
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        return self._ordinals.nbytes
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, item):
+        if isinstance(item, _numbers.Integral):
+            ordinal = self._ordinals[item]
+            return pd.NaT if ordinal == _NA else date._fromordinal(
+                int(ordinal))
+        item = check_array_indexer(self, item)
+        return self._fromordinals(self._ordinals[item])
+
+    def __setitem__(self, key, value):
+        if pd.api.types.is_list_like(value):
+            value = _to_ordinals(value)
+        else:
+            value = _scalar_to_ordinal(value)
+        key = check_array_indexer(self, key)
+        self._ordinals[key] = value
+
+    def __iter__(self):
+        fromordinal = date._fromordinal
+        for ordinal in self._ordinals.tolist():
+            yield pd.NaT if ordinal == _NA else fromordinal(ordinal)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype) != object:
+            raise TypeError('can only convert a BanglaDateArray to an '
+                            'object array')
+        return np.array(list(self), dtype=object)
+
+    def isna(self):
+        return self._ordinals == _NA
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        if allow_fill:
+            fill_value = (_NA if fill_value is None else
+                          _scalar_to_ordinal(fill_value))
+        return self._fromordinals(
+            take(self._ordinals, indices, allow_fill=allow_fill,
+                 fill_value=fill_value))
+
+    def copy(self):
+        return self._fromordinals(self._ordinals.copy())
+
+    def _values_for_factorize(self):
+        return self._ordinals, _NA
+
+    def _values_for_argsort(self):
+        return self._ordinals
+
+    def _formatter(self, boxed=False):
+        return str
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        if name not in ('min', 'max'):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims,
+                                   **kwargs)
+        valid = self._ordinals[~self.isna()]
+        if not len(valid) or (not skipna and len(valid) < len(self)):
+            result = pd.NaT
+        else:
+            result = date._fromordinal(int(getattr(valid, name)()))
+        if keepdims:
+            return type(self)([result])
+        return result
+
+    def _cmp(self, other, op):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if pd.api.types.is_list_like(other):
+            other = _to_ordinals(other)
+            if len(other) != len(self):
+                raise ValueError('Lengths must match to compare')
+            na = self.isna() | (other == _NA)
+        else:
+            if not _is_na(other) and not isinstance(other, date):
+                return NotImplemented
+            other = _scalar_to_ordinal(other)
+            na = self.isna() | (other == _NA)
+        result = op(self._ordinals, other)
+        result[na] = op is np.not_equal
+        return result
+
+    def __eq__(self, other):
+        return self._cmp(other, np.equal)
+
+    def __ne__(self, other):
+        return self._cmp(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._cmp(other, np.less)
+
+    def __le__(self, other):
+        return self._cmp(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._cmp(other, np.greater)
+
+    def __ge__(self, other):
+        return self._cmp(other, np.greater_equal)
+
+    # Bangla date fields
+
+    @property
+    def ordinals(self):
+        "int32 ndarray of the ordinals, 0 for missing values."
+        return self._ordinals
+
+    def fields(self):
+        """Return the (year, month, day) int64 ndarrays; they hold 0 for
+        missing values."""
+        na = self.isna()
+        columns = batch._ord2ymd(
+            np.where(na, 1, self._ordinals).astype(np.int64))
+        for column in columns:
+            column[na] = 0
+        return columns
+
+    def togregorian(self):
+        "Return the Gregorian dates as datetime64[s], NaT if missing."
+        days = self._ordinals.astype(np.int64) - _EPOCH_ORDINAL
+        result = days.astype('datetime64[D]').astype('datetime64[s]')
+        result[self.isna()] = np.datetime64('NaT')
+        return result
+
+    def strftime(self, fmt):
+        """Return an object ndarray with every date formatted according to
+        fmt, see date.strftime(); missing values give NaN.  Each distinct
+        date is only formatted once.
+        """
+        uniques, inverse = np.unique(self._ordinals, return_inverse=True)
+        formatted = np.array([
+            np.nan if ordinal == _NA else date._fromordinal(
+                int(ordinal)).strftime(fmt) for ordinal in uniques.tolist()
+        ],
+                             dtype=object)
+        return formatted[inverse.reshape(-1)]
+
+
+@register_series_accessor('bangla')
+class BanglaAccessor:
+    """Bangla date properties of a Series of datetime64 or bangladate
+    values, e.g. s.bangla.year.  The Bangla date of a timezone-aware
+    datetime is the date of its wall clock time.
+    """
+    def __init__(self, series):
+        dtype = series.dtype
+        if isinstance(dtype, BanglaDateDtype):
+            array = series.array
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            array = BanglaDateArray._fromordinals(
+                _datetime64_to_ordinals(series.array))
+        else:
+            raise AttributeError('Can only use .bangla accessor with '
+                                 'datetime64 or bangladate values')
+        self._series = series
+        self._array = array
+
+    def _wrap(self, values):
+        # Like the .dt fields, missing values make the result float NaNs.
+        na = self._array.isna()
+        if na.any():
+            values = values.astype(np.float64)
+            values[na] = np.nan
+        return pd.Series(values, index=self._series.index,
+                         name=self._series.name)
+
+    @property
+    def year(self):
+        return self._wrap(self._array.fields()[0])
+
+    @property
+    def month(self):
+        return self._wrap(self._array.fields()[1])
+
+    @property
+    def day(self):
+        return self._wrap(self._array.fields()[2])
+
+    @property
+    def weekday(self):
+        "Day of the week, Monday == 0 ... Sunday == 6."
+        return self._wrap((self._array.ordinals.astype(np.int64) + 6) % 7)
+
+    @property
+    def ordinal(self):
+        return self._wrap(self._array.ordinals.astype(np.int64))
+
+    @property
+    def date(self):
+        "The values as a Series of dtype bangladate."
+        return pd.Series(self._array.copy(), index=self._series.index,
+                         name=self._series.name)
+
+    def togregorian(self):
+        "The values as a Series of Gregorian datetime64[s]."
+        return pd.Series(self._array.togregorian(), index=self._series.index,
+                         name=self._series.name)
+
+    def strftime(self, fmt):
+        "Format every date according to fmt, see date.strftime()."
+        return pd.Series(self._array.strftime(fmt), index=self._series.index,
+                         name=self._series.name)
@@ -0,0 +1,465 @@
+"""Parsers for Bangla date strings.
+
+parse_isoformat_many() reads the 'YYYY-MM-DD' form written by
+date.isoformat() in bulk.  It works on the raw bytes of each record, so no
+str slices or int() calls are needed per field.
+
+strptime() and parse() read dates written by people, in the Bangla script
+or transliterated, such as '১৭ই পৌষ ১৪২৫' or 'Thursday, 9 Poush 1427':
+
+* numbers may use Bangla or ASCII digits and a day may carry a suffix such
+  as the ই of ১৭ই or the th of 17th;
+* month and weekday names may be abbreviated (Pous, Thu), full (Poush,
+  Thursday), in the Bangla script (পৌষ, বৃহস্পতিবার) or a common
+  alternative spelling (Pausha, Chaitra), in any case.
+
+All the names are compiled into one regular expression, shaped as a trie
+so that the engine never backtracks over a shared prefix, and strptime()
+formats are compiled once and cached.  parse_many() parses each distinct
+string only once.
+"""
+
+__all__ = ("parse_isoformat_many", "strptime", "parse", "parse_many")
+
+import re as _re
+import unicodedata as _unicodedata
+from array import array as _array
+from functools import lru_cache as _lru_cache
+
+from bangladatetime.date import (date, _checked_ymd2ord, _is_leap,
+                                 _check_date_fields, _ord2md, _ymd2ord,
+                                 _DAYS_IN_BANGLA_MONTH, _MONTHNAMES,
+                                 _DAYNAMES)
+from bangladatetime.formatting import (_FULL_MONTHNAMES, _BANGLA_MONTHNAMES,
+                                       _FULL_DAYNAMES, _BANGLA_DAYNAMES,
+                                       _BANGLA_FULL_DAYNAMES)
+
+_CARRIAGE_RETURN = 0x0d
+_HYPHEN = 0x2d
+_DIGITS = frozenset(b'0123456789')
+
+# Subtracting these from the weighted sums of the ASCII codes of the digits
+# gives the values of the year and the month or day fields.
+_YEAR_ZERO = 1111 * 0x30
+_MONTH_ZERO = 11 * 0x30
+
+
+def _fixed_width_records(data):
+    # When data is nothing but 'YYYY-MM-DD\n' records, return an iterator of
+    # the ASCII codes of their eight digits, taken column-wise with strided
+    # slices.  Otherwise return None.
+    size = len(data)
+    if size % 11 not in (0, 10):
+        return None
+    rows = (size + 1) // 11
+    newlines = size // 11
+    if (data[4::11] != b'-' * rows or data[7::11] != b'-' * rows
+            or data.count(b'-') != 2 * rows
+            or data[10::11] != b'\n' * newlines
+            or data.count(b'\n') != newlines
+            or data.translate(None, b'0123456789-\n')):
+        return None
+    return zip(data[0::11], data[1::11], data[2::11], data[3::11],
+               data[5::11], data[6::11], data[8::11], data[9::11])
+
+
+def _records(data):
+    # Yield the ASCII codes of the eight digits of every record of data, ()
+    # for empty records, or None for records that are not of the form
+    # 'YYYY-MM-DD'.
+    if hasattr(data, 'find'):
+        # Newline separated records in a bytes-like buffer.
+        find = data.find
+        pos = 0
+        size = len(data)
+        while pos < size:
+            nl = find(b'\n', pos)
+            if nl < 0:
+                nl = size
+            end = nl
+            if end > pos and data[end - 1] == _CARRIAGE_RETURN:
+                end -= 1
+            yield _record_digits(data, pos, end)
+            pos = nl + 1
+    else:
+        for record in data:
+            if isinstance(record, str):
+                record = record.encode('ascii', 'replace')
+            yield _record_digits(record, 0, len(record))
+
+
+def _record_digits(buf, pos, end):
+    if end == pos:
+        return ()
+    if (end - pos != 10 or buf[pos + 4] != _HYPHEN
+            or buf[pos + 7] != _HYPHEN):
+        return None
+    codes = (buf[pos], buf[pos + 1], buf[pos + 2], buf[pos + 3], buf[pos + 5],
+             buf[pos + 6], buf[pos + 8], buf[pos + 9])
+    if not _DIGITS.issuperset(codes):
+        return None
+    return codes
+
+
+def parse_isoformat_many(data, ordinals=False, errors='raise'):
+    """Parse many dates in the format 'YYYY-MM-DD'.
+
+    data is either a str or bytes-like object (bytes, bytearray,
+    memoryview, mmap) holding one date per line, or an iterable of str or
+    bytes, one date per item; empty lines and items are skipped.  Returns
+    a list of date objects, or with ordinals=True an array('i') of their
+    ordinals.
+
+    With errors='raise' (the default) an invalid record raises ValueError.
+    With errors='report' invalid records are left out of the result and a
+    (result, invalid) pair is returned, where invalid lists the zero-based
+    line or item numbers of the records that could not be parsed.
+    """
+    if errors not in ('raise', 'report'):
+        raise ValueError("errors must be 'raise' or 'report'", errors)
+    raise_errors = errors == 'raise'
+
+    if isinstance(data, str):
+        data = data.encode('ascii', 'replace')
+    elif isinstance(data, memoryview):
+        data = data.tobytes()
+    records = None
+    if isinstance(data, (bytes, bytearray)):
+        records = _fixed_width_records(data)
+    if records is None:
+        records = _records(data)
+
+    days_in_month = _DAYS_IN_BANGLA_MONTH
+    if ordinals:
+        result = _array('i')
+    else:
+        result = []
+        fromfields = date._fromfields
+    append = result.append
+    invalid = []
+
+    for row, codes in enumerate(records):
+        if codes == ():
+            # Blank lines, such as a trailing one, are not records.
+            continue
+        if codes is not None:
+            y0, y1, y2, y3, m0, m1, d0, d1 = codes
+            year = y0 * 1000 + y1 * 100 + y2 * 10 + y3 - _YEAR_ZERO
+            month = m0 * 10 + m1 - _MONTH_ZERO
+            day = d0 * 10 + d1 - _MONTH_ZERO
+            if (year and 1 <= month <= 12 and 1 <= day and
+                (day <= days_in_month[month] or
+                 (month == 11 and day == 30 and _is_leap(year)))):
+                ordinal = _checked_ymd2ord(year, month, day)
+                if ordinals:
+                    append(ordinal)
+                else:
+                    append(fromfields(year, month, day, ordinal))
+                continue
+        if raise_errors:
+            raise ValueError('Invalid isoformat string in record %d' % row)
+        invalid.append(row)
+
+    if raise_errors:
+        return result
+    return result, invalid
+
+
+# Free-form parsing ----------------------------------------------------------
+
+# Other common spellings of the month names.
+_MONTH_ALIASES = [
+    None,
+    ("Baishakh", "Baisakh"),
+    ("Jaishtha", "Jyoishtha", "Jyoistho", "Joishtho"),
+    ("Ashar", "Ashadh", "Asadh"),
+    ("Shraban", "Srabon", "Shrabana"),
+    ("Bhadra", ),
+    ("Ashwin", "Aswin", "Ashwina"),
+    ("Kartika", "Kartick"),
+    ("Agrahayan", "Agrahayana", "Ogrohayan"),
+    ("Pausha", "Paush"),
+    ("Magha", ),
+    ("Phalgun", "Phalguna"),
+    ("Chaitra", "Chaitro"),
+]
+
+# Words that may follow the year, such as বঙ্গাব্দ, the Bangla era.
+_YEAR_WORDS = ("বঙ্গাব্দ", "সাল", "সন", "bs", "b.s.")
+
+# Suffixes of day numbers: ১লা, ২রা, ৪ঠা, ৫ই, ১৯শে, and 1st, 2nd, ...
+_DAY_SUFFIX = '(?:লা|রা|ঠা|ই|শে|st|nd|rd|th)?'
+
+# ASCII and Bangla digits; int() reads both.
+_DIGIT = '[0-9\u09e6-\u09ef]'
+
+
+def _normalize(string):
+    # Bangla letters such as য় have a precomposed and a decomposed form.
+    # normalize() returns strings that are already NFC, such as ASCII
+    # ones, after a quick check.
+    return _unicodedata.normalize('NFC', string).lower()
+
+
+def _name_table():
+    "-> {normalized name: ('month' or 'weekday' or None, value)}."
+    names = {}
+    for month in range(1, 13):
+        for name in ((_MONTHNAMES[month], _FULL_MONTHNAMES[month],
+                      _BANGLA_MONTHNAMES[month]) + _MONTH_ALIASES[month]):
+            names[_normalize(name)] = ('month', month)
+    for weekday in range(1, 8):
+        for name in (_DAYNAMES[weekday], _FULL_DAYNAMES[weekday],
+                     _BANGLA_DAYNAMES[weekday],
+                     _BANGLA_FULL_DAYNAMES[weekday]):
+            names[_normalize(name)] = ('weekday', weekday)
+    for name in _YEAR_WORDS:
+        names[_normalize(name)] = (None, None)
+    return names
+
+
+def _trie_pattern(words):
+    """Return a regular expression matching any of words, longest first,
+    factored as a trie: ['Bois', 'Boishakh'] gives 'Bois(?:hakh)?'."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node):
+    branches = [
+        _re.escape(ch) + _node_pattern(child)
+        for ch, child in sorted(node.items()) if ch
+    ]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else \
+        '(?:%s)' % '|'.join(branches)
+    if '' in node:
+        # Greedy, so the longer names win.
+        if len(branches) == 1:
+            pattern = '(?:%s)' % pattern
+        pattern += '?'
+    return pattern
+
+
+_NAMES = _name_table()
+# A name must not be followed by more letters.
+_NAME = r'(?:%s)(?![^\W\d_])' % _trie_pattern(_NAMES)
+_MONTH_NAME = r'(?:%s)(?![^\W\d_])' % _trie_pattern(
+    name for name, (kind, _) in _NAMES.items() if kind == 'month')
+_WEEKDAY_NAME = r'(?:%s)(?![^\W\d_])' % _trie_pattern(
+    name for name, (kind, _) in _NAMES.items() if kind == 'weekday')
+
+# A number, a name or a run of separators; '\u0964' is the Bangla full stop.
+_TOKEN = _re.compile(r'(?P<number>%s+)%s|(?P<name>%s)|[\s,./\-\u0964]+' %
+                     (_DIGIT, _DAY_SUFFIX, _NAME))
+
+
+def _invalid(string):
+    return ValueError('Invalid date string: %r' % string)
+
+
+def _fields(string):
+    "string -> (year, month, day) of a free-form date, see parse()."
+    text = _normalize(string)
+    numbers = []
+    month = weekday = None
+    pos = 0
+    match = _TOKEN.match
+    while pos < len(text):
+        token = match(text, pos)
+        if token is None:
+            raise _invalid(string)
+        pos = token.end()
+        number, name = token.group('number', 'name')
+        if number is not None:
+            numbers.append(number)
+        elif name is not None:
+            kind, value = _NAMES[name]
+            if kind == 'month':
+                if month is not None:
+                    raise _invalid(string)
+                month = value
+            elif kind == 'weekday':
+                weekday = value
+    if month is not None:
+        if len(numbers) != 2:
+            raise _invalid(string)
+        numbers.insert(1, month)
+    elif len(numbers) != 3:
+        raise _invalid(string)
+    # The year is the number with 3 or more digits, first or last.
+    if len(numbers[0]) >= 3:
+        year, month, day = numbers
+    elif len(numbers[2]) >= 3:
+        day, month, year = numbers
+    else:
+        raise _invalid(string)
+    try:
+        year, month, day = _check_date_fields(int(year), int(month),
+                                              int(day))
+    except ValueError:
+        raise _invalid(string) from None
+    if weekday is not None and \
+            (_ymd2ord(year, month, day) + 6) % 7 + 1 != weekday:
+        raise ValueError('%r: the weekday does not match the date' % string)
+    return year, month, day
+
+
+def parse(string):
+    """Parse a date written in a free form, in the Bangla script or
+    transliterated, such as '১৭ই পৌষ ১৪২৫', '1425-09-17' or 'Thu, 9 Poush
+    1427'.
+
+    The date is a day, a month and a year in that order or in the reverse
+    order, separated by spaces, commas, '-', '/', '.' or '।'.  The month
+    may be a name, which may also come first, and the year must have at
+    least 3 digits.  A weekday name is checked against the date.
+    """
+    year, month, day = _fields(string)
+    return date._fromfields(year, month, day,
+                            _checked_ymd2ord(year, month, day))
+
+
+def parse_many(strings, errors='raise'):
+    """parse() every string of the iterable strings; each distinct string
+    is only parsed once.  Return a list of dates.
+
+    errors is 'raise' or 'report', like for parse_isoformat_many().
+    """
+    if errors not in ('raise', 'report'):
+        raise ValueError("errors must be 'raise' or 'report'", errors)
+    parsed = {}
+    result = []
+    append = result.append
+    invalid = []
+    for row, string in enumerate(strings):
+        try:
+            d = parsed[string]
+        except KeyError:
+            try:
+                d = parsed[string] = parse(string)
+            except ValueError:
+                if errors == 'raise':
+                    raise
+                invalid.append(row)
+                continue
+        append(d)
+    if errors == 'raise':
+        return result
+    return result, invalid
+
+
+# strptime() -----------------------------------------------------------------
+
+# Directive -> (group name, pattern).
+_DIRECTIVES = {
+    'd': ('day', '%s{1,2}%s' % (_DIGIT, _DAY_SUFFIX)),
+    'e': ('day', '%s{1,2}%s' % (_DIGIT, _DAY_SUFFIX)),
+    'm': ('month', '%s{1,2}' % _DIGIT),
+    'b': ('month_name', _MONTH_NAME),
+    'B': ('month_name', _MONTH_NAME),
+    'Y': ('year', '%s{1,4}' % _DIGIT),
+    'j': ('day_of_year', '%s{1,3}' % _DIGIT),
+    'a': ('weekday', _WEEKDAY_NAME),
+    'A': ('weekday', _WEEKDAY_NAME),
+    'H': ('hour', '%s{1,2}' % _DIGIT),
+    'M': ('minute', '%s{1,2}' % _DIGIT),
+    'S': ('second', '%s{1,2}' % _DIGIT),
+    'f': ('microsecond', '%s{1,6}' % _DIGIT),
+}
+
+
+@_lru_cache(maxsize=128)
+def _compile(fmt):
+    "format -> compiled pattern with a named group for every field."
+    pattern = []
+    groups = set()
+    i, n = 0, len(fmt)
+    while i < n:
+        ch = fmt[i]
+        i += 1
+        if ch != '%':
+            pattern.append(r'\s+' if ch.isspace() else _re.escape(ch))
+            continue
+        if i < n and fmt[i] == 'O':
+            # Bangla digits and names are always accepted.
+            i += 1
+        if i == n:
+            raise ValueError('stray %% at end of format %r' % fmt)
+        ch = fmt[i]
+        i += 1
+        if ch == '%':
+            pattern.append('%')
+        elif ch in _DIRECTIVES:
+            group, regex = _DIRECTIVES[ch]
+            if group in groups:
+                raise ValueError('format %r sets the %s twice' % (fmt, group))
+            groups.add(group)
+            pattern.append('(?P<%s>%s)' % (group, regex))
+        else:
+            raise ValueError('invalid format directive %r in %r' %
+                             ('%' + ch, fmt))
+    if 'year' not in groups:
+        raise ValueError('format %r has no year' % fmt)
+    return _re.compile(''.join(pattern))
+
+
+def _number(value):
+    # Drop a day suffix such as the ই of ১৭ই.
+    while not value[-1].isdigit():
+        value = value[:-1]
+    return int(value)
+
+
+def _strptime(string, fmt):
+    """string, format -> (year, month, day, hour, minute, second,
+    microsecond)."""
+    if not isinstance(string, str):
+        raise TypeError('strptime() argument 1 must be str, not %s' %
+                        type(string).__name__)
+    found = _compile(fmt).fullmatch(_normalize(string))
+    if found is None:
+        raise ValueError('time data %r does not match format %r' %
+                         (string, fmt))
+    fields = found.groupdict()
+    year = int(fields['year'])
+    try:
+        if fields.get('month_name') is not None:
+            month = _NAMES[fields['month_name']][1]
+        else:
+            month = int(fields.get('month') or 1)
+        day = _number(fields.get('day') or '1')
+        if fields.get('day_of_year') is not None and \
+                fields.get('month') is None and \
+                fields.get('month_name') is None:
+            month, day = _ord2md(year, int(fields['day_of_year']))
+        year, month, day = _check_date_fields(year, month, day)
+    except ValueError:
+        raise ValueError('time data %r does not match format %r' %
+                         (string, fmt)) from None
+    weekday = fields.get('weekday')
+    if weekday is not None and \
+            (_ymd2ord(year, month, day) + 6) % 7 + 1 != _NAMES[weekday][1]:
+        raise ValueError('%r: the weekday does not match the date' % string)
+    microsecond = fields.get('microsecond') or '0'
+    return (year, month, day, int(fields.get('hour') or 0),
+            int(fields.get('minute') or 0), int(fields.get('second') or 0),
+            int(microsecond.ljust(6, '0')))
+
+
+def strptime(string, fmt):
+    """Return the date in string, which must match the format fmt.
+
+    fmt uses the directives of strftime() but for %y, %u, %w, %G and %V;
+    a year is required, the month and day default to 1.  %j sets the month
+    and day when no month is given.  Numbers may use Bangla digits and
+    names may take any of the forms parse() accepts, with or without the O
+    modifier.
+    """
+    return date(*_strptime(string, fmt)[:3])
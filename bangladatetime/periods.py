@@ -0,0 +1,160 @@
+"""Integer ids of the Bangla month, quarter, ritu, year or fiscal year of
+dates, for bucketing and grouping.
+
+A period id is a single int that orders like the periods themselves:
+
+    period         id                          see also
+    'month'        year * 12 + month - 1
+    'quarter'      year * 4 + (month - 1) // 3
+    'ritu'         year * 6 + (month - 1) // 2  RITUS
+    'year'         year
+    'fiscal_year'  the year the fiscal year starts in, for fiscal years
+                   starting on the first day of month fiscal_start
+
+period_ids() computes the ids of a whole DateArray or buffer of ordinals
+at once, with NumPy when it is installed, and group_by_period() folds an
+iterable of records into one value per period, without building a date
+object per record:
+
+    >>> totals = group_by_period(sales,
+    ...                          key=lambda sale: sale.day,
+    ...                          reducer=lambda total, sale: total + sale.paid,
+    ...                          initial=0,
+    ...                          period='ritu')
+"""
+
+__all__ = ("PERIODS", "RITUS", "period_id", "period_ids", "period_fields",
+           "period_start", "group_by_period")
+
+import datetime as _datetime
+from array import array as _array
+from operator import index as _index
+
+from bangladatetime.date import date, _ord2ymd, _GREGORIAN_ORDINAL_OFFSET
+from bangladatetime.datearray import DateArray, _TYPECODE
+
+PERIODS = ('month', 'quarter', 'ritu', 'year', 'fiscal_year')
+
+# The six seasons, two months each, starting with Boishakh.
+RITUS = ('Grishma', 'Barsha', 'Sharat', 'Hemanta', 'Shit', 'Basanta')
+
+# Months per period, for the periods of whole months within a year.
+_PERIOD_MONTHS = {'month': 1, 'quarter': 3, 'ritu': 2}
+
+
+def _check_period(period, fiscal_start):
+    if period not in PERIODS:
+        raise ValueError('period must be one of %s' % ', '.join(PERIODS),
+                         period)
+    fiscal_start = _index(fiscal_start)
+    if not 1 <= fiscal_start <= 12:
+        raise ValueError('fiscal_start must be in 1..12', fiscal_start)
+    return fiscal_start
+
+
+def _ids(years, months, period, fiscal_start):
+    # Element-wise on ints or NumPy arrays alike.
+    if period in _PERIOD_MONTHS:
+        per_year = 12 // _PERIOD_MONTHS[period]
+        return years * per_year + (months - 1) // _PERIOD_MONTHS[period]
+    if period == 'year':
+        return years
+    return years - (months < fiscal_start)
+
+
+def _ordinal(value):
+    # Bangla date, Gregorian datetime.date or ordinal -> ordinal.
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, _datetime.date):
+        return value.toordinal() - _GREGORIAN_ORDINAL_OFFSET
+    return _index(value)
+
+
+def period_id(value, period='month', fiscal_start=1):
+    """Return the id of the period of value, a Bangla date, a Gregorian
+    datetime.date or an ordinal."""
+    fiscal_start = _check_period(period, fiscal_start)
+    year, month, _ = _ord2ymd(_ordinal(value))
+    return _ids(year, month, period, fiscal_start)
+
+
+def period_ids(values, period='month', fiscal_start=1):
+    """Like period_id(), for a DateArray, a buffer of int ordinals such as
+    an array('i') or a NumPy array, or an iterable of dates or ordinals.
+    Return an array('i') of the ids.
+    """
+    fiscal_start = _check_period(period, fiscal_start)
+    if isinstance(values, DateArray):
+        ordinals = values.ordinals
+    else:
+        try:
+            ordinals = memoryview(values)
+        except TypeError:
+            ordinals = _array(_TYPECODE, map(_ordinal, values))
+    try:
+        import numpy as np
+        from bangladatetime import batch
+    except ImportError:
+        result = _array(_TYPECODE)
+        append = result.append
+        for n in ordinals:
+            year, month, _ = _ord2ymd(n)
+            append(_ids(year, month, period, fiscal_start))
+        return result
+    years, months, _ = batch.from_ordinal(np.asarray(ordinals))
+    ids = _ids(years, months, period, fiscal_start)
+    return _array(_TYPECODE, ids.astype(np.int32).tobytes())
+
+
+def period_fields(pid, period='month'):
+    """Split a period id into (year, index): the month 1..12, the quarter
+    0..3 or the ritu 0..5 for those periods; the index is 0 for 'year' and
+    'fiscal_year'."""
+    _check_period(period, 1)
+    pid = _index(pid)
+    if period == 'month':
+        year, month = divmod(pid, 12)
+        return year, month + 1
+    if period in _PERIOD_MONTHS:
+        return divmod(pid, 12 // _PERIOD_MONTHS[period])
+    return pid, 0
+
+
+def period_start(pid, period='month', fiscal_start=1):
+    "Return the first date of the period with the id pid."
+    fiscal_start = _check_period(period, fiscal_start)
+    year, index = period_fields(pid, period)
+    if period == 'month':
+        return date(year, index, 1)
+    if period in _PERIOD_MONTHS:
+        return date(year, index * _PERIOD_MONTHS[period] + 1, 1)
+    return date(year, fiscal_start if period == 'fiscal_year' else 1, 1)
+
+
+def group_by_period(iterable,
+                    key,
+                    reducer,
+                    initial,
+                    period='month',
+                    fiscal_start=1):
+    """Fold the records of iterable into one value per period.
+
+    key(record) gives the day of a record as a Bangla date, a Gregorian
+    datetime.date or an ordinal; the period of each distinct day is only
+    computed once.  The value of a period starts as initial and becomes
+    reducer(value, record) for each of its records, like functools.reduce.
+    Return a dict mapping the ids of the periods to their values, in
+    ascending order of the ids.
+    """
+    fiscal_start = _check_period(period, fiscal_start)
+    ids = {}
+    groups = {}
+    for record in iterable:
+        n = _ordinal(key(record))
+        pid = ids.get(n)
+        if pid is None:
+            year, month, _ = _ord2ymd(n)
+            pid = ids[n] = _ids(year, month, period, fiscal_start)
+        groups[pid] = reducer(groups.get(pid, initial), record)
+    return dict(sorted(groups.items()))
@@ -0,0 +1,209 @@
+"""Convert a Gregorian date column of a large CSV file to Bangla dates.
+
+convert_csv() streams the input in chunks of lines, has a pool of worker
+processes parse and convert the chunks, and writes the converted chunks in
+input order as they complete.  Only a bounded number of chunks is in
+flight at any time, so memory use does not grow with the size of the file.
+The main process only decodes, splits and writes text; the csv parsing, the
+date conversion and the csv formatting all happen in the workers.
+"""
+
+__all__ = ("convert_csv", )
+
+import csv as _csv
+import io as _io
+import itertools as _itertools
+import os as _os
+from collections import deque as _deque
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+from bangladatetime.date import _gregorian2bangla
+
+# Lines per chunk handed to a worker.
+CHUNK_LINES = 50000
+
+
+def _chunks(lines, size):
+    # Yield (first line number, text) of chunks of about size lines, only
+    # cut where no quoted field is open, so that every chunk holds whole
+    # records.
+    lineno = 1
+    while True:
+        chunk = list(_itertools.islice(lines, size))
+        if not chunk:
+            return
+        quotes = sum(line.count('"') for line in chunk)
+        while quotes % 2:
+            line = next(lines, None)
+            if line is None:
+                break
+            chunk.append(line)
+            quotes += line.count('"')
+        yield lineno, ''.join(chunk)
+        lineno += len(chunk)
+
+
+def _bangla(value):
+    if len(value) > 10 and value[10] in ' T':
+        # Only the date of a datetime.
+        value = value[:10]
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError
+    year, month, day, _ = _gregorian2bangla(int(value[0:4]),
+                                            int(value[5:7]),
+                                            int(value[8:10]))
+    return '%04d-%02d-%02d' % (year, month, day)
+
+
+def _convert_chunk(lineno, text, column, errors, dialect):
+    """Convert one chunk of records, return the number of records and the
+    csv text of the output."""
+    reader = _csv.reader(_io.StringIO(text, newline=''), **dialect)
+    output = _io.StringIO(newline='')
+    writerow = _csv.writer(output, **dialect).writerow
+    count = 0
+    for row in reader:
+        if not row:
+            writerow(row)
+            continue
+        count += 1
+        try:
+            value = _bangla(row[column].strip())
+        except (ValueError, IndexError):
+            if errors == 'raise':
+                raise ValueError('line %d: can not convert %r to a Bangla '
+                                 'date' %
+                                 (lineno + reader.line_num - 1,
+                                  row[column] if column < len(row) else ''))
+            value = ''
+        row.append(value)
+        writerow(row)
+    return count, output.getvalue()
+
+
+def _open(file, mode, encoding):
+    # -> (text file, function to call when done with it).
+    if isinstance(file, _io.TextIOBase):
+        return file, file.flush if mode == 'w' else (lambda: None)
+    if hasattr(file, 'read' if mode == 'r' else 'write'):
+        # Leave the binary file of the caller open when done.
+        wrapper = _io.TextIOWrapper(file, encoding=encoding, newline='')
+
+        def detach():
+            if mode == 'w':
+                wrapper.flush()
+            wrapper.detach()
+
+        return wrapper, detach
+    file = open(file, mode, encoding=encoding, newline='')
+    return file, file.close
+
+
+def convert_csv(source,
+                destination,
+                column='gregorian',
+                output_column='bangla',
+                encoding='utf-8',
+                output_encoding=None,
+                workers=None,
+                chunk_lines=CHUNK_LINES,
+                errors='raise',
+                delimiter=','):
+    """Copy the CSV file source to destination, adding output_column with
+    the Bangla date of the Gregorian 'YYYY-MM-DD' dates in column.
+
+    source and destination are paths or file objects, binary ones are
+    decoded with encoding and encoded with output_encoding (default: the
+    input encoding), e.g. 'utf-16' for the format of tests/2019-2020.csv.
+    The first record must be a header; column is the name or the index of
+    the date column.  workers is the number of worker processes (default:
+    the number of CPUs); with 1 everything runs in this process.
+
+    With errors='raise' (the default) a value that is not a valid date
+    raises ValueError; with errors='ignore' its Bangla date is left empty.
+    Return the number of records converted, not counting the header.
+    """
+    if errors not in ('raise', 'ignore'):
+        raise ValueError("errors must be 'raise' or 'ignore'", errors)
+    if workers is None:
+        workers = _os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('workers must be at least 1', workers)
+    if chunk_lines < 1:
+        raise ValueError('chunk_lines must be at least 1', chunk_lines)
+    if output_encoding is None:
+        output_encoding = encoding
+    dialect = {'delimiter': delimiter}
+
+    infile, done_input = _open(source, 'r', encoding)
+    try:
+        outfile, done_output = _open(destination, 'w', output_encoding)
+        try:
+            return _convert(infile, outfile, column, output_column, workers,
+                            chunk_lines, errors, dialect)
+        finally:
+            done_output()
+    finally:
+        done_input()
+
+
+def _convert(infile, outfile, column, output_column, workers, chunk_lines,
+             errors, dialect):
+    lines = iter(infile)
+    try:
+        _, header_text = next(_chunks(lines, 1))
+    except StopIteration:
+        raise ValueError('the CSV file is empty') from None
+    header = next(_csv.reader(_io.StringIO(header_text, newline=''),
+                              **dialect))
+    if isinstance(column, int):
+        index = column
+        if not 0 <= index < len(header):
+            raise ValueError('no column %d in the header' % column)
+    else:
+        try:
+            index = header.index(column)
+        except ValueError:
+            raise ValueError('no column %r in the header' % column) from None
+    # Write the records the way the header is written.
+    dialect['lineterminator'] = '\r\n' if header_text.endswith(
+        '\r\n') else '\n'
+    if header_text.startswith('"'):
+        dialect['quoting'] = _csv.QUOTE_ALL
+    _csv.writer(outfile, **dialect).writerow(header + [output_column])
+
+    first = 1 + header_text.count('\n')
+    chunks = ((first + lineno - 1, text)
+              for lineno, text in _chunks(lines, chunk_lines))
+    count = 0
+    if workers == 1:
+        for lineno, text in chunks:
+            records, output = _convert_chunk(lineno, text, index, errors,
+                                             dialect)
+            count += records
+            outfile.write(output)
+        return count
+
+    with _ProcessPoolExecutor(workers) as executor:
+        # Keep a few chunks per worker queued and write the results in
+        # input order, waiting for the oldest chunk first.
+        pending = _deque()
+        try:
+            for lineno, text in chunks:
+                pending.append(
+                    executor.submit(_convert_chunk, lineno, text, index,
+                                    errors, dialect))
+                if len(pending) < 2 * workers:
+                    continue
+                records, output = pending.popleft().result()
+                count += records
+                outfile.write(output)
+            while pending:
+                records, output = pending.popleft().result()
+                count += records
+                outfile.write(output)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+    return count
@@ -0,0 +1,244 @@
+"""Historical revisions of the Bangla calendar, side by side.
+
+date follows the calendar as revised in 2019.  A RuleSet holds the month
+lengths and the leap rule of one revision, and an EraCalendar applies each
+RuleSet to the years from the one it took effect in, so that dates of
+archives spanning several revisions convert to and from the Gregorian
+calendar, or date objects, with the rules of their own era:
+
+    >>> BANGLADESH.fromgregorian(2017, 12, 16)  # the 1987 rules
+    (1424, 9, 2)
+    >>> date.fromgregorian(2017, 12, 16)
+    bangladatetime.date.date(1424, 9, 1)
+
+Ordinals count days from Boishakh 1 of year 1, as for date, whatever the
+era, so they convert to and from Gregorian dates and date objects.  The
+first era starts on the same day as that year in date; later years
+follow from the lengths of the years before them.  Both revisions shipped
+here add the leap day to the Bangla year ending in a Gregorian leap
+February, as date does, so their years start on April 14.
+
+RuleSet and EraCalendar build all their tables, the leap years included,
+when they are created; a conversion is one lookup of the year's RuleSet
+and a few table reads, with no per-field callbacks.
+
+The calendar used before 1987 followed the sidereal sun, with month
+lengths varying from year to year, and cannot be written as a RuleSet;
+BANGLADESH rejects the years before 1394.
+"""
+
+__all__ = ("RuleSet", "EraCalendar", "REVISION_1987", "REVISION_2019",
+           "BANGLADESH")
+
+import datetime as _datetime
+from array import array as _array
+from bisect import bisect_left as _bisect_left
+from operator import index as _index, itemgetter as _itemgetter
+
+from bangladatetime.date import (date, _checked_ymd2ord, _is_leap,
+                                 _DAYS_IN_BANGLA_MONTH,
+                                 _GREGORIAN_ORDINAL_OFFSET, MINYEAR, MAXYEAR)
+
+
+class RuleSet:
+    """RuleSet(name, days_in_month, leap_month=11, is_leap=None)
+
+    days_in_month gives the lengths of the 12 months in a common year, 365
+    days in all; leap_month is the month that has one more day in leap
+    years.  is_leap(year) tells whether a Bangla year is a leap year; it
+    is called once for every year when the RuleSet is created.  The
+    default is the rule of date: the year ending in a Gregorian leap
+    February.
+    """
+    __slots__ = ('_name', '_leap_month', '_leap', '_days_in_month',
+                 '_days_before_month', '_month_day')
+
+    def __init__(self, name, days_in_month, leap_month=11, is_leap=None):
+        days_in_month = [_index(days) for days in days_in_month]
+        leap_month = _index(leap_month)
+        if len(days_in_month) != 12 or sum(days_in_month) != 365:
+            raise ValueError('days_in_month must be 12 months of 365 days '
+                             'in all')
+        if not 1 <= leap_month <= 12:
+            raise ValueError('leap_month must be in 1..12', leap_month)
+        self._name = name
+        self._leap_month = leap_month
+        # 1 if leap year else 0, indexed by year.
+        is_leap = is_leap or _is_leap
+        self._leap = bytes(1 if is_leap(year) else 0
+                           for year in range(MAXYEAR + 1))
+        # Indexed by [leap][month] and [leap][day of year]; index 0 is a
+        # placeholder for indexing purposes.
+        self._days_in_month = ([-1], [-1])
+        self._days_before_month = ([-1], [-1])
+        self._month_day = ([None], [None])
+        for leap in (0, 1):
+            before = 0
+            for month, days in enumerate(days_in_month, 1):
+                days += leap and month == leap_month
+                self._days_in_month[leap].append(days)
+                self._days_before_month[leap].append(before)
+                self._month_day[leap].extend(
+                    (month, day) for day in range(1, days + 1))
+                before += days
+
+    @property
+    def name(self):
+        "The name of the revision."
+        return self._name
+
+    @property
+    def leap_month(self):
+        "The month with the leap day."
+        return self._leap_month
+
+    def is_leap(self, year):
+        "Return True if year is a leap year under these rules."
+        year = _index(year)
+        if not MINYEAR <= year <= MAXYEAR:
+            raise ValueError('year must be in %d..%d' % (MINYEAR, MAXYEAR),
+                             year)
+        return bool(self._leap[year])
+
+    def days_in_month(self, month, leap=False):
+        "Return the number of days in month, of a leap year if leap is true."
+        return self._days_in_month[bool(leap)][month]
+
+    def __repr__(self):
+        return '%s.%s(%r, %r, %d)' % (
+            self.__class__.__module__, self.__class__.__qualname__,
+            self._name, self._days_in_month[0][1:], self._leap_month)
+
+
+# Boishakh to Bhadro 31 days, Ashshin to Choitro 30, Falgun 31 in leap
+# years.
+REVISION_1987 = RuleSet('1987', [31] * 5 + [30] * 7)
+# Boishakh to Ashshin 31 days, Falgun 29, the others 30, Falgun 30 in leap
+# years: the rules of date.
+REVISION_2019 = RuleSet('2019', _DAYS_IN_BANGLA_MONTH[1:])
+
+
+class EraCalendar:
+    """EraCalendar(eras) --> the Bangla calendar under changing rules
+
+    eras is an iterable of (first_year, ruleset) pairs: ruleset applies to
+    the years from first_year up to the first year of the next era.  Years
+    before the first era raise ValueError.
+
+    Fields are (year, month, day) tuples of the era's rules; ordinals
+    count days like those of date, so they convert to and from date
+    objects.
+    """
+    __slots__ = '_eras', '_year_rules', '_first_year', '_days_before_year'
+
+    def __init__(self, eras):
+        eras = sorted(((_index(first_year), ruleset)
+                       for first_year, ruleset in eras),
+                      key=_itemgetter(0))
+        if not eras:
+            raise ValueError('EraCalendar needs at least one era')
+        for first_year, ruleset in eras:
+            if not MINYEAR <= first_year <= MAXYEAR:
+                raise ValueError('year must be in %d..%d' %
+                                 (MINYEAR, MAXYEAR), first_year)
+            if not isinstance(ruleset, RuleSet):
+                raise TypeError('expected a RuleSet, not %s' %
+                                type(ruleset).__name__)
+        stops = [first_year for first_year, _ in eras[1:]] + [MAXYEAR + 1]
+        if len(set(stops)) != len(stops) or eras[0][0] in stops:
+            raise ValueError('eras must start in different years')
+        self._eras = tuple(eras)
+        self._first_year = eras[0][0]
+        # The RuleSet of every year, indexed by year.
+        self._year_rules = [None] * (MAXYEAR + 1)
+        for (first_year, ruleset), stop in zip(eras, stops):
+            self._year_rules[first_year:stop] = [ruleset] * (stop - first_year)
+        # Ordinal of the day before Boishakh 1 of every year in 0..MAXYEAR+1,
+        # indexed by year: those of date up to the first era, then running
+        # sums of the lengths of the years in their era.
+        first = self._first_year
+        before = _array('i', (_checked_ymd2ord(year, 1, 1) - 1
+                              for year in range(MINYEAR, first + 1)))
+        before.insert(0, 0)
+        days = before[-1]
+        for year in range(first, MAXYEAR + 1):
+            days += 365 + self._year_rules[year]._leap[year]
+            before.append(days)
+        self._days_before_year = before
+
+    @property
+    def eras(self):
+        "The (first_year, ruleset) pairs, in order."
+        return self._eras
+
+    def __repr__(self):
+        return '%s.%s(%r)' % (self.__class__.__module__,
+                              self.__class__.__qualname__, list(self._eras))
+
+    def rules(self, year):
+        "Return the RuleSet in effect in year."
+        year = _index(year)
+        if not self._first_year <= year <= MAXYEAR:
+            raise ValueError('year must be in %d..%d' %
+                             (self._first_year, MAXYEAR), year)
+        return self._year_rules[year]
+
+    def ymd2ord(self, year, month, day):
+        "Return the ordinal of the date with the fields of its era."
+        rules = self.rules(year)
+        month = _index(month)
+        day = _index(day)
+        if not 1 <= month <= 12:
+            raise ValueError('month must be in 1..12', month)
+        leap = rules._leap[year]
+        dim = rules._days_in_month[leap][month]
+        if not 1 <= day <= dim:
+            raise ValueError('day must be in 1..%d' % dim, day)
+        return (self._days_before_year[year] +
+                rules._days_before_month[leap][month] + day)
+
+    def ord2ymd(self, n):
+        "Return the (year, month, day) of ordinal n in its era."
+        n = _index(n)
+        before = self._days_before_year
+        if not before[self._first_year] < n <= before[MAXYEAR + 1]:
+            raise ValueError('ordinal must be in %d..%d' %
+                             (before[self._first_year] + 1,
+                              before[MAXYEAR + 1]), n)
+        year = _bisect_left(before, n) - 1
+        rules = self._year_rules[year]
+        month, day = rules._month_day[rules._leap[year]][n - before[year]]
+        return year, month, day
+
+    def fromgregorian(self,
+                      gregorian_year=None,
+                      gregorian_month=None,
+                      gregorian_day=None):
+        """Return the (year, month, day) of a Gregorian date, given as a
+        year, month and day or as a datetime.date."""
+        if isinstance(gregorian_year, _datetime.date):
+            g = gregorian_year
+        else:
+            g = _datetime.date(gregorian_year, gregorian_month,
+                               gregorian_day)
+        return self.ord2ymd(g.toordinal() - _GREGORIAN_ORDINAL_OFFSET)
+
+    def togregorian(self, year, month, day):
+        "Return the Gregorian date of the fields as a datetime.date."
+        return _datetime.date.fromordinal(
+            self.ymd2ord(year, month, day) + _GREGORIAN_ORDINAL_OFFSET)
+
+    def todate(self, year, month, day):
+        "Return the same day as a date, in the rules of date."
+        return date._fromordinal(self.ymd2ord(year, month, day))
+
+    def fromdate(self, d):
+        "Return the (year, month, day) of the date d in its era."
+        if not isinstance(d, date):
+            raise TypeError('expected a date, not %s' % type(d).__name__)
+        return self.ord2ymd(d.toordinal())
+
+
+# The calendar of Bangladesh since the Bangla Academy reform took effect in
+# 1394 (1987), as revised in 1426 (2019).
+BANGLADESH = EraCalendar([(1394, REVISION_1987), (1426, REVISION_2019)])
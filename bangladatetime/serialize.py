@@ -0,0 +1,127 @@
+"""A dense binary format for many Bangla dates.
+
+pickle stores every date as a class reference plus a state string, so a
+pickled list of dates is mostly opcodes.  This format stores a 16 byte
+header followed by the ordinal of every date as a little-endian int32:
+
+    offset  size  field
+         0     4  magic, b'BNDT'
+         4     2  format version, 1
+         6     2  flags, 0
+         8     8  number of dates
+        16   4*n  ordinals
+
+The ordinals start on a 16 byte boundary, so an mmap of a file, or any
+other buffer holding the format, is loaded as a DateArray without copying.
+"""
+
+__all__ = ("dump_dates", "dumps_dates", "load_dates", "loads_dates",
+           "map_dates")
+
+import io as _io
+import mmap as _mmap
+import struct as _struct
+import sys as _sys
+from array import array as _array
+
+from bangladatetime.date import date
+from bangladatetime.datearray import DateArray, _TYPECODE
+
+_MAGIC = b'BNDT'
+_VERSION = 1
+_HEADER = _struct.Struct('<4sHHQ')  # magic, version, flags, count
+
+_LITTLE_ENDIAN = _sys.byteorder == 'little'
+
+
+def _ordinals(dates):
+    "dates or DateArray -> contiguous native int32 buffer of the ordinals."
+    if isinstance(dates, DateArray):
+        ordinals = dates.ordinals
+        if ordinals.c_contiguous:
+            return ordinals
+        return _array(_TYPECODE, ordinals)
+    ordinals = _array(_TYPECODE)
+    append = ordinals.append
+    for d in dates:
+        if not isinstance(d, date):
+            raise TypeError('dump_dates() items must be dates, not %s' %
+                            type(d).__name__)
+        append(d.toordinal())
+    return ordinals
+
+
+def dump_dates(dates, file):
+    """Write dates, an iterable of date objects or a DateArray, to the
+    binary file object file.  Return the number of dates written.
+    """
+    ordinals = _ordinals(dates)
+    if not _LITTLE_ENDIAN:
+        ordinals = _array(_TYPECODE, ordinals)
+        ordinals.byteswap()
+    count = len(ordinals)
+    file.write(_HEADER.pack(_MAGIC, _VERSION, 0, count))
+    file.write(ordinals)
+    return count
+
+
+def dumps_dates(dates):
+    "Like dump_dates(), but return the data as bytes."
+    file = _io.BytesIO()
+    dump_dates(dates, file)
+    return file.getvalue()
+
+
+def _parse_header(header):
+    if len(header) < _HEADER.size:
+        raise ValueError('truncated dates header')
+    magic, version, flags, count = _HEADER.unpack(header[:_HEADER.size])
+    if magic != _MAGIC:
+        raise ValueError('not a bangladatetime dates file')
+    if version != _VERSION:
+        raise ValueError('unsupported dates format version %d' % version)
+    return count
+
+
+def _result(ordinals, columnar):
+    if not _LITTLE_ENDIAN:
+        ordinals = _array(_TYPECODE, ordinals)
+        ordinals.byteswap()
+    if columnar:
+        return DateArray.fromordinals(ordinals)
+    fromordinal = date._fromordinal
+    return [fromordinal(n) for n in ordinals]
+
+
+def load_dates(file, columnar=False):
+    """Read dates written by dump_dates() from the binary file object file.
+    Return a list of date objects, or a DateArray if columnar is true.
+    """
+    count = _parse_header(file.read(_HEADER.size))
+    data = file.read(4 * count)
+    if len(data) != 4 * count:
+        raise ValueError('truncated dates data')
+    return _result(memoryview(data).cast(_TYPECODE), columnar)
+
+
+def loads_dates(data, columnar=False):
+    """Like load_dates(), for a bytes-like object such as bytes or an mmap.
+    With columnar true, the DateArray shares the buffer of data.
+    """
+    data = memoryview(data).cast('B')
+    count = _parse_header(data)
+    end = _HEADER.size + 4 * count
+    if len(data) < end:
+        raise ValueError('truncated dates data')
+    return _result(data[_HEADER.size:end].cast(_TYPECODE), columnar)
+
+
+def map_dates(path):
+    """Return a DateArray of the dates in the file at path, written by
+    dump_dates().  The file is memory mapped, not read into a copy: the
+    DateArray shares the pages of the page cache.  The range of every
+    ordinal is still checked here, which reads the whole file once.
+    """
+    with open(path, 'rb') as file:
+        data = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+    return loads_dates(data, columnar=True)
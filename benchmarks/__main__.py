@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Command line interface of the benchmark suite, see benchmarks.suite."""
+
+import argparse
+import json
+import sys
+
+from benchmarks import suite
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Time the conversion and construction hot paths.')
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help='benchmarks to run (default: all of them)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='workload size as a fraction of %d items' %
+                        suite.SIZE)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='report the best of this many runs')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='write the results to FILE as JSON')
+    parser.add_argument('--list', action='store_true',
+                        help='list the benchmarks and exit')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two JSON reports and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (workload, _, _) in suite.BENCHMARKS.items():
+            print('%-24s %s' % (name, workload))
+        return 0
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path) as file:
+                reports.append(json.load(file))
+        suite.compare(*reports)
+        return 0
+
+    unknown = set(args.names) - set(suite.BENCHMARKS)
+    if unknown:
+        parser.error('unknown benchmarks: %s' % ', '.join(sorted(unknown)))
+    report = suite.run(args.names or None, args.scale, args.repeat,
+                       log=print)
+    if args.output:
+        suite.write_report(report, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
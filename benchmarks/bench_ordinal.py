@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark: sorted() and set() over dates compared by ordinal.
+
+TupleDate below restores the previous behaviour, where every comparison
+built two (year, month, day) tuples and hashing built the pickle state
+bytes, so both can be timed side by side:
+
+    python -m benchmarks.bench_ordinal [number of dates]
+"""
+
+import random
+import sys
+import time
+
+from bangladatetime.date import date, _cmp, _MAXORDINAL
+
+
+class TupleDate(date):
+    __slots__ = ()
+
+    def _cmp(self, other):
+        y, m, d = self._year, self._month, self._day
+        y2, m2, d2 = other._year, other._month, other._day
+        return _cmp((y, m, d), (y2, m2, d2))
+
+    def __eq__(self, other):
+        return self._cmp(other) == 0
+
+    def __lt__(self, other):
+        return self._cmp(other) < 0
+
+    def __hash__(self):
+        return hash(self._getstate())
+
+
+def _best_of(func, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count=1000000):
+    rng = random.Random(20201224)
+    # A few thousand distinct days, so that set() also has to deduplicate.
+    ordinals = [rng.randint(1, _MAXORDINAL) for _ in range(count // 300 + 1)]
+    ordinals = [rng.choice(ordinals) for _ in range(count)]
+    for cls in (TupleDate, date):
+        dates = [cls.fromordinal(n) for n in ordinals]
+        print('%-10s sorted(): %.3fs  set(): %.3fs' %
+              (cls.__name__, _best_of(sorted, dates), _best_of(set, dates)))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmarks of the conversion and construction hot paths.
+
+Every benchmark runs over a fixed workload generated from a fixed seed, so
+two runs on the same machine time exactly the same work and the JSON
+reports of two releases can be compared:
+
+    python -m benchmarks [--scale 0.1] [--output results.json]
+    python -m benchmarks --compare old.json new.json
+
+The workloads, with their sizes at --scale 1:
+
+    gregorian   1M random Gregorian (year, month, day) tuples up to the
+                end of Gregorian year 9999
+    ordinals    1M ordinals spread evenly over the full supported range
+    dates       1M dates over a few thousand distinct days up to the end of
+                Gregorian year 9999, so that set() and hashing also have to
+                deduplicate
+    isoformat   the 'YYYY-MM-DD' strings of the ordinals workload
+    fields      the (year, month, day) tuples of the ordinals workload
+"""
+
+import datetime as _datetime
+import gc
+import json
+import platform
+import random
+import time
+
+from bangladatetime.date import (date, datetime, _MAXORDINAL,
+                                 _GREGORIAN_ORDINAL_OFFSET)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SEED = 20201224
+SIZE = 1000000
+
+BENCHMARKS = {}
+
+# Bangla ordinal of 9999-12-31, the last day togregorian() can return.
+_LAST_GREGORIAN = _datetime.date.max.toordinal() - _GREGORIAN_ORDINAL_OFFSET
+
+
+def benchmark(workload, available=True):
+    """Register the decorated function as a benchmark over workload.  It is
+    skipped when available is false, i.e. an optional dependency is missing.
+    """
+    def register(func):
+        BENCHMARKS[func.__name__[len('bench_'):]] = (workload, func,
+                                                     available)
+        return func
+
+    return register
+
+
+# Workloads -----------------------------------------------------------------
+
+
+def make_ordinals(size):
+    step = max(_MAXORDINAL // size, 1)
+    return list(range(1, _MAXORDINAL + 1, step))[:size]
+
+
+def make_gregorian(size):
+    rng = random.Random(SEED)
+    first = _GREGORIAN_ORDINAL_OFFSET + 1
+    last = _GREGORIAN_ORDINAL_OFFSET + _LAST_GREGORIAN
+    fromordinal = _datetime.date.fromordinal
+    result = []
+    for _ in range(size):
+        g = fromordinal(rng.randint(first, last))
+        result.append((g.year, g.month, g.day))
+    return result
+
+
+def make_dates(size):
+    rng = random.Random(SEED)
+    days = [rng.randint(1, _LAST_GREGORIAN) for _ in range(size // 300 + 1)]
+    return [date.fromordinal(rng.choice(days)) for _ in range(size)]
+
+
+def make_isoformat(size):
+    return [date.fromordinal(n).isoformat() for n in make_ordinals(size)]
+
+
+def make_fields(size):
+    dates = map(date.fromordinal, make_ordinals(size))
+    return [(d.year, d.month, d.day) for d in dates]
+
+
+WORKLOADS = {
+    'gregorian': make_gregorian,
+    'ordinals': make_ordinals,
+    'dates': make_dates,
+    'isoformat': make_isoformat,
+    'fields': make_fields,
+}
+
+# Benchmarks ----------------------------------------------------------------
+
+
+@benchmark('gregorian')
+def bench_fromgregorian(data):
+    fromgregorian = date.fromgregorian
+    for y, m, d in data:
+        fromgregorian(y, m, d)
+
+
+@benchmark('ordinals')
+def bench_fromordinal(data):
+    fromordinal = date.fromordinal
+    for n in data:
+        fromordinal(n)
+
+
+@benchmark('fields')
+def bench_construct(data):
+    for y, m, d in data:
+        date(y, m, d)
+
+
+@benchmark('fields')
+def bench_fromtrusted(data):
+    date.fromtrusted(data)
+
+
+@benchmark('dates')
+def bench_replace(data):
+    for d in data:
+        d.replace(day=1)
+
+
+@benchmark('dates')
+def bench_combine(data):
+    combine = datetime.combine
+    midnight = datetime.min.time()
+    for d in data:
+        combine(d, midnight)
+
+
+@benchmark('dates')
+def bench_toordinal(data):
+    for d in data:
+        d.toordinal()
+
+
+@benchmark('dates')
+def bench_togregorian(data):
+    for d in data:
+        d.togregorian()
+
+
+@benchmark('dates')
+def bench_isocalendar(data):
+    for d in data:
+        d.isocalendar()
+
+
+@benchmark('dates')
+def bench_isoformat(data):
+    for d in data:
+        d.isoformat()
+
+
+@benchmark('dates')
+def bench_strftime(data):
+    for d in data:
+        d.strftime('%d %B %Y')
+
+
+@benchmark('isoformat')
+def bench_fromisoformat(data):
+    fromisoformat = date.fromisoformat
+    for s in data:
+        fromisoformat(s)
+
+
+@benchmark('isoformat')
+def bench_parse_isoformat_many(data):
+    from bangladatetime.parsing import parse_isoformat_many
+    parse_isoformat_many(data)
+
+
+@benchmark('dates')
+def bench_hash(data):
+    for d in data:
+        hash(d)
+
+
+@benchmark('dates')
+def bench_sorted(data):
+    sorted(data)
+
+
+@benchmark('dates')
+def bench_set(data):
+    set(data)
+
+
+@benchmark('gregorian', available=np is not None)
+def bench_batch_from_gregorian(data):
+    from bangladatetime import batch
+    batch.from_gregorian(*zip(*data))
+
+
+# Runner --------------------------------------------------------------------
+
+
+def _best_of(func, data, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(names=None, scale=1.0, repeat=3, log=None):
+    """Run the named benchmarks (all of them by default) and return the
+    report as a dict, see write_report().
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError('unknown benchmarks: %s' % ', '.join(sorted(unknown)))
+    size = max(int(SIZE * scale), 1)
+    workloads = {}
+    results = {}
+    for name in names:
+        workload, func, available = BENCHMARKS[name]
+        if not available:
+            if log is not None:
+                log('%-24s skipped' % name)
+            continue
+        if workload not in workloads:
+            workloads[workload] = WORKLOADS[workload](size)
+        data = workloads[workload]
+        seconds = _best_of(func, data, repeat)
+        results[name] = {
+            'workload': workload,
+            'size': len(data),
+            'seconds': seconds,
+            'ns_per_item': seconds * 1e9 / len(data),
+        }
+        if log is not None:
+            log('%-24s %9.3fs %9.1f ns/item' %
+                (name, seconds, results[name]['ns_per_item']))
+    return {
+        'version': _version(),
+        'python': platform.python_implementation() + ' ' +
+        platform.python_version(),
+        'platform': platform.platform(),
+        'seed': SEED,
+        'scale': scale,
+        'repeat': repeat,
+        'benchmarks': results,
+    }
+
+
+def _version():
+    try:
+        from importlib.metadata import version
+        return version('bangladatetime')
+    except Exception:
+        return None
+
+
+def write_report(report, path):
+    "Write the report returned by run() to path as JSON."
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def compare(old, new, log=print):
+    """Print the timings of two reports side by side, with the ratio
+    new / old, for the benchmarks they have in common.
+    """
+    old, new = old['benchmarks'], new['benchmarks']
+    for name in new:
+        if name not in old:
+            continue
+        a, b = old[name]['ns_per_item'], new[name]['ns_per_item']
+        log('%-24s %9.1f %9.1f ns/item  %5.2fx' % (name, a, b, b / a))
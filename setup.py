@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 readme = open('README.md').read()
 
@@ -22,9 +22,22 @@ setup(
         'bangla', 'bangla date', 'bongabdo', 'bengali', 'bengali date',
         'bengali datetime', 'bangla datetime'
     ],
-    packages=find_packages(exclude=('tests', )),
+    packages=find_packages(exclude=('tests', 'benchmarks')),
+    # The accelerator is optional: if it can not be built, bangladatetime
+    # uses its pure Python implementation.
+    ext_modules=[
+        Extension('_bangladatetime', ['src/_bangladatetimemodule.c'],
+                  optional=True),
+    ],
     install_requires=[],
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+    },
     include_package_data=True,
+    entry_points={
+        'console_scripts': ['bangladatetime = bangladatetime.cli:main'],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Programming Language :: Python :: 3",
@@ -0,0 +1,495 @@
+/*  C implementation of the calendar helpers of bangladatetime.date.
+ *
+ *  bangladatetime/date.py imports these functions in place of its pure
+ *  Python versions when this module is available, the same way the
+ *  standard library's datetime.py falls back on _datetime.  Every function
+ *  here must behave exactly like the Python function of the same name,
+ *  including the exceptions it raises; tests/test_accelerator.py checks
+ *  that.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+
+#define MINYEAR 1
+#define MAXYEAR 9999
+#define MAXORDINAL 3652060L     /* date(MAXYEAR, 12, 30).toordinal() */
+
+/* Days from the start of the 400-year leap cycle containing Boishakh 1,
+ * 0001 up to that day, i.e. the days in Gregorian years 1..594.
+ */
+#define DAYS_BEFORE_CYCLE (594L * 365 + 144)
+#define DI400Y 146097L          /* number of days in 400 years */
+#define DI100Y 36524L           /* number of days in 100 years */
+#define DI4Y 1461L              /*  number of days in 4 years */
+
+/* The tables below are the ones at the top of date.py; -1 is a placeholder
+ * for indexing purposes.
+ */
+static const int gregorian_day_at_end_of_bangla_month[13] = {
+    -1, 14, 13, 14, 13, 14, 14, 15, 15, 15, 16, 15, 15
+};
+
+static const int bangla_day_at_gregorian_month_start[13] = {
+    -1, 17, 18, 16, 18, 18, 18, 17, 17, 17, 16, 16, 16
+};
+
+static const int bangla_day_at_gregorian_month_end[13] = {
+    -1, 17, 15, 17, 17, 17, 16, 16, 16, 15, 15, 15, 16
+};
+
+static const int days_in_gregorian_month[13] = {
+    -1, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31
+};
+
+static const int days_in_bangla_month[13] = {
+    -1, 31, 31, 31, 31, 31, 31, 30, 30, 30, 30, 29, 30
+};
+
+static const int days_before_month[13] = {
+    -1, 0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 335
+};
+
+/* ---------------------------------------------------------------------------
+ * Calendar arithmetic.  Years are Bangla years unless the name says
+ * otherwise; see date.py for the 594 years offset.
+ */
+
+static int
+is_gregorian_leap(long year)
+{
+    return year % 4 == 0 && (year % 100 != 0 || year % 400 == 0);
+}
+
+static int
+is_leap(long year)
+{
+    /* Only year % 400 matters, which also keeps huge years from
+     * overflowing.
+     */
+    return is_gregorian_leap(year % 400 + 594);
+}
+
+static int
+days_in_month(long year, int month)
+{
+    if (month == 11 && is_leap(year))
+        return 30;
+    return days_in_bangla_month[month];
+}
+
+static int
+days_in_gregorian_month_of(long year, int month)
+{
+    if (month == 2 && is_gregorian_leap(year))
+        return 29;
+    return days_in_gregorian_month[month];
+}
+
+/* Floor division, for the years before the Gregorian year 1. */
+static long
+floordiv(long a, long b)
+{
+    long q = a / b;
+    return (a % b != 0 && (a < 0) != (b < 0)) ? q - 1 : q;
+}
+
+static long
+days_before_year(long year)
+{
+    long y = year - 1;
+    long yy = y + 594;
+    return y * 365 + floordiv(yy, 4) - floordiv(yy, 100) +
+           floordiv(yy, 400) - 144;
+}
+
+static long
+ymd_to_ord(long year, int month, int day)
+{
+    return days_before_year(year) + days_before_month[month] +
+           (month == 12 && is_leap(year)) + day;
+}
+
+static void
+ord_to_ymd(long n, long *year, int *month, int *day)
+{
+    long n400, n100, n4, n1;
+    int leap, dim;
+
+    n += DAYS_BEFORE_CYCLE - 1;
+    n400 = n / DI400Y;
+    n %= DI400Y;
+    n100 = n / DI100Y;
+    n %= DI100Y;
+    n4 = n / DI4Y;
+    n %= DI4Y;
+    n1 = n / 365;
+    n %= 365;
+    *year = n400 * 400 + 1 + n100 * 100 + n4 * 4 + n1 - 594;
+    if (n1 == 4 || n100 == 4) {
+        /* Last day of a leap year, i.e. Choitro 30 of the previous year. */
+        *year -= 1;
+        *month = 12;
+        *day = 30;
+        return;
+    }
+    leap = n1 == 3 && (n4 != 24 || n100 == 3);
+    *month = 1;
+    for (;;) {
+        dim = days_in_bangla_month[*month] + (*month == 11 && leap);
+        if (n < dim)
+            break;
+        n -= dim;
+        *month += 1;
+    }
+    *day = (int)n + 1;
+}
+
+/* ---------------------------------------------------------------------------
+ * Argument handling.
+ */
+
+static int
+check_nargs(const char *name, Py_ssize_t nargs, Py_ssize_t expected)
+{
+    if (nargs != expected) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s() takes exactly %zd arguments (%zd given)",
+                     name, expected, nargs);
+        return -1;
+    }
+    return 0;
+}
+
+/* Raise ValueError(message, value), like the Python code does. */
+static void
+value_error(const char *message, PyObject *value)
+{
+    PyObject *args = Py_BuildValue("(sO)", message, value);
+    if (args != NULL) {
+        PyErr_SetObject(PyExc_ValueError, args);
+        Py_DECREF(args);
+    }
+}
+
+static void
+value_error_long(const char *message, long value)
+{
+    PyObject *obj = PyLong_FromLong(value);
+    if (obj != NULL) {
+        value_error(message, obj);
+        Py_DECREF(obj);
+    }
+}
+
+/* Store operator.index(obj) in *result and its value in *value.  Values
+ * that do not fit in a C long are clamped to LONG_MIN or LONG_MAX, which
+ * every range check rejects.
+ */
+static int
+as_index(PyObject *obj, PyObject **result, long *value)
+{
+    int overflow;
+
+    *result = PyNumber_Index(obj);
+    if (*result == NULL)
+        return -1;
+    *value = PyLong_AsLongAndOverflow(*result, &overflow);
+    if (overflow)
+        *value = overflow > 0 ? LONG_MAX : LONG_MIN;
+    else if (*value == -1 && PyErr_Occurred()) {
+        Py_CLEAR(*result);
+        return -1;
+    }
+    return 0;
+}
+
+/* Like as_index(), for arguments the Python code uses without
+ * operator.index() and only gets as ints.
+ */
+static int
+as_long(PyObject *obj, long *value)
+{
+    PyObject *result;
+    int ret = as_index(obj, &result, value);
+    Py_XDECREF(result);
+    return ret;
+}
+
+/* Check and convert year, month and day the way date.py's
+ * _check_date_fields() and _check_gregorian_date_fields() do.  On success
+ * the new references to the indexes are stored in objs.
+ */
+static int
+check_fields(PyObject *const *args, Py_ssize_t nargs, const char *name,
+             int gregorian, PyObject *objs[3], long *year, int *month,
+             int *day)
+{
+    long values[3];
+    int i, dim;
+
+    if (check_nargs(name, nargs, 3) < 0)
+        return -1;
+    objs[0] = objs[1] = objs[2] = NULL;
+    for (i = 0; i < 3; i++) {
+        if (as_index(args[i], &objs[i], &values[i]) < 0)
+            goto error;
+    }
+    if (values[0] < MINYEAR || values[0] > MAXYEAR) {
+        value_error("year must be in 1..9999", objs[0]);
+        goto error;
+    }
+    if (values[1] < 1 || values[1] > 12) {
+        value_error("month must be in 1..12", objs[1]);
+        goto error;
+    }
+    if (gregorian)
+        dim = days_in_gregorian_month_of(values[0], (int)values[1]);
+    else
+        dim = days_in_month(values[0], (int)values[1]);
+    if (values[2] < 1 || values[2] > dim) {
+        char message[32];
+        PyOS_snprintf(message, sizeof(message), "day must be in 1..%d", dim);
+        value_error(message, objs[2]);
+        goto error;
+    }
+    *year = values[0];
+    *month = (int)values[1];
+    *day = (int)values[2];
+    return 0;
+
+  error:
+    for (i = 0; i < 3; i++)
+        Py_XDECREF(objs[i]);
+    return -1;
+}
+
+/* The Python versions of the unchecked helpers only guard the month with an
+ * assert statement, whose message varies.
+ */
+static int
+assert_month(long month, PyObject *message)
+{
+    if (month < 1 || month > 12) {
+        PyErr_SetObject(PyExc_AssertionError, message);
+        return -1;
+    }
+    return 0;
+}
+
+/* ---------------------------------------------------------------------------
+ * Module functions.
+ */
+
+PyDoc_STRVAR(check_date_fields_doc,
+"_check_date_fields(year, month, day) -> (year, month, day)\n\n"
+"Raise if the fields are not a valid Bangla date.");
+
+static PyObject *
+check_date_fields(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *objs[3];
+    long year;
+    int month, day;
+
+    if (check_fields(args, nargs, "_check_date_fields", 0, objs,
+                     &year, &month, &day) < 0)
+        return NULL;
+    return Py_BuildValue("(NNN)", objs[0], objs[1], objs[2]);
+}
+
+PyDoc_STRVAR(check_gregorian_date_fields_doc,
+"_check_gregorian_date_fields(year, month, day) -> (year, month, day)\n\n"
+"Raise if the fields are not a valid Gregorian date.");
+
+static PyObject *
+check_gregorian_date_fields(PyObject *module, PyObject *const *args,
+                            Py_ssize_t nargs)
+{
+    PyObject *objs[3];
+    long year;
+    int month, day;
+
+    if (check_fields(args, nargs, "_check_gregorian_date_fields", 1, objs,
+                     &year, &month, &day) < 0)
+        return NULL;
+    return Py_BuildValue("(NNN)", objs[0], objs[1], objs[2]);
+}
+
+PyDoc_STRVAR(gregorian2bangla_doc,
+"_gregorian2bangla(year, month, day) -> (year, month, day, ordinal)\n\n"
+"Gregorian year, month, day -> the same day in the Bangla calendar.");
+
+static PyObject *
+gregorian2bangla(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *objs[3];
+    long gregorian_year, year;
+    int gregorian_month, gregorian_day, month, day, i;
+
+    if (check_fields(args, nargs, "_gregorian2bangla", 1, objs,
+                     &gregorian_year, &gregorian_month, &gregorian_day) < 0)
+        return NULL;
+    for (i = 0; i < 3; i++)
+        Py_DECREF(objs[i]);
+
+    year = gregorian_year - 593 - (gregorian_month < 4 ||
+                                   (gregorian_month == 4 &&
+                                    gregorian_day < 14));
+    if (year < MINYEAR) {
+        value_error_long("year must be in 1..9999", year);
+        return NULL;
+    }
+    if (gregorian_day <=
+            gregorian_day_at_end_of_bangla_month[gregorian_month]) {
+        month = (gregorian_month + 8) % 12;
+        day = gregorian_day + bangla_day_at_gregorian_month_start[
+            gregorian_month] - 1;
+        if (gregorian_month == 3 && is_gregorian_leap(gregorian_year))
+            day += 1;
+    }
+    else {
+        int month_end = bangla_day_at_gregorian_month_end[gregorian_month];
+        if (gregorian_month == 2 && is_gregorian_leap(gregorian_year))
+            month_end = 16;
+        month = (gregorian_month + 9) % 12;
+        day = gregorian_day - (days_in_gregorian_month_of(gregorian_year,
+                                                          gregorian_month) -
+                               month_end);
+    }
+    if (month == 0)
+        month = 12;
+    return Py_BuildValue("(liil)", year, month, day,
+                         ymd_to_ord(year, month, day));
+}
+
+PyDoc_STRVAR(days_in_month_doc,
+"_days_in_month(year, month) -> number of days in that bangla month in that "
+"bangla year.");
+
+static PyObject *
+days_in_month_py(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    long year, month;
+
+    if (check_nargs("_days_in_month", nargs, 2) < 0)
+        return NULL;
+    if (as_long(args[0], &year) < 0 || as_long(args[1], &month) < 0)
+        return NULL;
+    if (assert_month(month, args[1]) < 0)
+        return NULL;
+    return PyLong_FromLong(days_in_month(year, (int)month));
+}
+
+PyDoc_STRVAR(ymd2ord_doc,
+"_ymd2ord(year, month, day) -> ordinal, considering Boishakh 1, 0001 as "
+"day 1.");
+
+static PyObject *
+ymd2ord(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    long year, month, day;
+    int dim;
+
+    if (check_nargs("_ymd2ord", nargs, 3) < 0)
+        return NULL;
+    if (as_long(args[0], &year) < 0 || as_long(args[1], &month) < 0 ||
+            as_long(args[2], &day) < 0)
+        return NULL;
+    if (month < 1 || month > 12) {
+        PyErr_SetString(PyExc_AssertionError, "month must be in 1..12");
+        return NULL;
+    }
+    dim = days_in_month(year, (int)month);
+    if (day < 1 || day > dim) {
+        PyErr_Format(PyExc_AssertionError, "day must be in 1..%d", dim);
+        return NULL;
+    }
+    if (year < 0 || year > MAXYEAR + 1) {
+        PyErr_SetString(PyExc_IndexError, "array index out of range");
+        return NULL;
+    }
+    return PyLong_FromLong(ymd_to_ord(year, (int)month, (int)day));
+}
+
+PyDoc_STRVAR(checked_ymd2ord_doc,
+"Like _ymd2ord(), for fields already validated by _check_date_fields().");
+
+static PyObject *
+checked_ymd2ord(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    long year, month, day;
+
+    if (check_nargs("_checked_ymd2ord", nargs, 3) < 0)
+        return NULL;
+    if (as_long(args[0], &year) < 0 || as_long(args[1], &month) < 0 ||
+            as_long(args[2], &day) < 0)
+        return NULL;
+    /* Only the table lookups are guarded, garbage in is garbage out. */
+    if (month < 0 || month > 12) {
+        PyErr_SetString(PyExc_IndexError, "list index out of range");
+        return NULL;
+    }
+    if (year < 0 || year > MAXYEAR + 1) {
+        PyErr_SetString(PyExc_IndexError, "array index out of range");
+        return NULL;
+    }
+    return PyLong_FromLong(ymd_to_ord(year, (int)month, 0) + day);
+}
+
+PyDoc_STRVAR(ord2ymd_doc,
+"_ord2ymd(n) -> (year, month, day), considering Boishakh 1, 0001 as day 1.");
+
+static PyObject *
+ord2ymd(PyObject *module, PyObject *arg)
+{
+    PyObject *obj;
+    long n, year;
+    int month, day;
+
+    if (as_index(arg, &obj, &n) < 0)
+        return NULL;
+    if (n < 1 || n > MAXORDINAL) {
+        value_error("Ordinal date must be in 1..3652060", obj);
+        Py_DECREF(obj);
+        return NULL;
+    }
+    Py_DECREF(obj);
+    ord_to_ymd(n, &year, &month, &day);
+    return Py_BuildValue("(lii)", year, month, day);
+}
+
+static PyMethodDef module_methods[] = {
+    {"_check_date_fields", (PyCFunction)(void(*)(void))check_date_fields,
+     METH_FASTCALL, check_date_fields_doc},
+    {"_check_gregorian_date_fields",
+     (PyCFunction)(void(*)(void))check_gregorian_date_fields,
+     METH_FASTCALL, check_gregorian_date_fields_doc},
+    {"_gregorian2bangla", (PyCFunction)(void(*)(void))gregorian2bangla,
+     METH_FASTCALL, gregorian2bangla_doc},
+    {"_days_in_month", (PyCFunction)(void(*)(void))days_in_month_py,
+     METH_FASTCALL, days_in_month_doc},
+    {"_ymd2ord", (PyCFunction)(void(*)(void))ymd2ord,
+     METH_FASTCALL, ymd2ord_doc},
+    {"_checked_ymd2ord", (PyCFunction)(void(*)(void))checked_ymd2ord,
+     METH_FASTCALL, checked_ymd2ord_doc},
+    {"_ord2ymd", (PyCFunction)ord2ymd, METH_O, ord2ymd_doc},
+    {NULL, NULL}
+};
+
+PyDoc_STRVAR(module_doc,
+"C implementation of the calendar helpers of bangladatetime.date.");
+
+static struct PyModuleDef bangladatetimemodule = {
+    PyModuleDef_HEAD_INIT,
+    "_bangladatetime",
+    module_doc,
+    0,
+    module_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__bangladatetime(void)
+{
+    return PyModuleDef_Init(&bangladatetimemodule);
+}
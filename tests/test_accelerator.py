@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Conformance of the optional _bangladatetime C accelerator.
+
+The rest of the test suite runs against whichever implementation
+bangladatetime.date picked up.  When the accelerator is built, this module
+also runs the whole suite in a subprocess with it blocked, and compares
+each accelerated helper with its pure Python version directly.
+"""
+
+import datetime
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+try:
+    import _bangladatetime
+except ImportError:
+    _bangladatetime = None
+
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_RUN_PURE = """\
+import sys
+import unittest
+
+sys.modules['_bangladatetime'] = None
+suite = unittest.defaultTestLoader.discover(%r, top_level_dir=%r)
+result = unittest.TextTestRunner(verbosity=0).run(suite)
+sys.exit(not result.wasSuccessful())
+"""
+
+
+def _import_pure():
+    # A fresh copy of bangladatetime.date that can not see the accelerator.
+    spec = importlib.util.find_spec('bangladatetime.date')
+    module = importlib.util.module_from_spec(spec)
+    saved = sys.modules.get('_bangladatetime')
+    sys.modules['_bangladatetime'] = None
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules['_bangladatetime']
+        else:
+            sys.modules['_bangladatetime'] = saved
+    return module
+
+
+@unittest.skipIf(_bangladatetime is None, "_bangladatetime is not built")
+class TestAccelerator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fast = importlib.import_module('bangladatetime.date')
+        cls.pure = _import_pure()
+
+    def assertSameResult(self, name, *args):
+        fast = getattr(self.fast, name)
+        pure = getattr(self.pure, name)
+        try:
+            expected = pure(*args)
+        except Exception as e:
+            with self.assertRaises(type(e), msg='%s%r' % (name, args)) as cm:
+                fast(*args)
+            # Only the messages of argument type errors may differ.
+            if not isinstance(e, TypeError):
+                self.assertEqual(cm.exception.args, e.args)
+        else:
+            self.assertEqual(fast(*args), expected, '%s%r' % (name, args))
+
+    def test_accelerated(self):
+        self.assertIs(self.fast._ord2ymd, _bangladatetime._ord2ymd)
+        self.assertIsNot(self.pure._ord2ymd, _bangladatetime._ord2ymd)
+
+    def test_ord2ymd(self):
+        fast, pure = self.fast._ord2ymd, self.pure._ord2ymd
+        for n in range(1, self.pure._MAXORDINAL + 1):
+            self.assertEqual(fast(n), pure(n))
+        for n in (0, -1, self.pure._MAXORDINAL + 1, 2**64, 1.5, '1'):
+            self.assertSameResult('_ord2ymd', n)
+
+    def test_ymd2ord(self):
+        days_in_month = self.pure._days_in_month
+        for year in range(1, self.pure.MAXYEAR + 1):
+            for month in range(1, 13):
+                dim = days_in_month(year, month)
+                self.assertSameResult('_days_in_month', year, month)
+                for day in (1, dim):
+                    self.assertSameResult('_ymd2ord', year, month, day)
+                    self.assertSameResult('_checked_ymd2ord', year, month,
+                                          day)
+        for args in ((1427, 0, 1), (1427, 13, 1), (1427, 11, 30),
+                     (1426, 11, 31), (1427, 1, 0)):
+            self.assertSameResult('_ymd2ord', *args)
+        self.assertSameResult('_days_in_month', 1427, 13)
+        self.assertSameResult('_checked_ymd2ord', 1427, 13, 1)
+
+    def test_check_date_fields(self):
+        for args in ((1, 1, 1), (9999, 12, 30), (1426, 11, 30),
+                     (1427, 11, 30), (0, 1, 1), (10000, 1, 1), (1427, 0, 1),
+                     (1427, 13, 1), (1427, 1, 0), (1427, 1, 32),
+                     (1427, 7, 31), (2**64, 1, 1), (1427, -2**64, 1),
+                     (1427.0, 1, 1), (1427, '1', 1), (True, True, True)):
+            self.assertSameResult('_check_date_fields', *args)
+            self.assertSameResult('_check_gregorian_date_fields', *args)
+            self.assertSameResult('_gregorian2bangla', *args)
+        self.assertSameResult('_check_date_fields', 1427, 1)
+
+    def test_gregorian2bangla(self):
+        first = datetime.date(594, 4, 14).toordinal()
+        for n in range(first - 400, datetime.date.max.toordinal() + 1, 3):
+            g = datetime.date.fromordinal(n)
+            self.assertSameResult('_gregorian2bangla', g.year, g.month,
+                                  g.day)
+
+    def test_pure_suite(self):
+        source = _RUN_PURE % (_TESTS_DIR, os.path.dirname(_TESTS_DIR))
+        result = subprocess.run([sys.executable, '-c', source],
+                                cwd=os.path.dirname(_TESTS_DIR),
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        self.assertEqual(result.returncode, 0,
+                         result.stdout.decode('utf-8', 'replace'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import datetime
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import bangladatetime
+from bangladatetime.date import _parse_isoformat_date
+
+
+def _read_csv():
+    with open('tests/2019-2020.csv', encoding="utf16") as file:
+        has_header = csv.Sniffer().has_header(file.read(1024))
+        file.seek(0)
+        reader = csv.reader(file)
+        if has_header:
+            next(reader)
+        return tuple((_parse_isoformat_date(row[0]),
+                      _parse_isoformat_date(row[1])) for row in reader)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        from bangladatetime import batch
+        self.batch = batch
+
+    def test_from_gregorian(self):
+        data = _read_csv()
+        gregorian = np.array([g for (g, b) in data])
+        bangla = np.array([b for (g, b) in data])
+
+        year, month, day = self.batch.from_gregorian(gregorian[:, 0],
+                                                     gregorian[:, 1],
+                                                     gregorian[:, 2])
+        self.assertEqual(np.stack([year, month, day], axis=1).tolist(),
+                         bangla.tolist())
+
+    def test_from_gregorian_datetime64(self):
+        dates = np.arange('0595-01-01', '2400-01-01', dtype='datetime64[D]')
+        year, month, day = self.batch.from_gregorian(dates)
+        for i in range(0, len(dates), 97):
+            g = dates[i].item()
+            calc = bangladatetime.date.fromgregorian(g.year, g.month, g.day)
+            self.assertEqual((year[i], month[i], day[i]),
+                             (calc.year, calc.month, calc.day), str(g))
+
+    def test_to_gregorian(self):
+        data = _read_csv()
+        gregorian = np.array(['%04d-%02d-%02d' % tuple(g) for (g, b) in data],
+                             dtype='datetime64[D]')
+        bangla = np.array([b for (g, b) in data])
+        calc = self.batch.to_gregorian(bangla[:, 0], bangla[:, 1],
+                                       bangla[:, 2])
+        self.assertEqual(calc.dtype, np.dtype('datetime64[D]'))
+        self.assertTrue((calc == gregorian).all())
+
+        dates = np.arange('0595-01-01', '2400-01-01', dtype='datetime64[D]')
+        self.assertTrue(
+            (self.batch.to_gregorian(*self.batch.from_gregorian(dates)) ==
+             dates).all())
+
+        with self.assertRaises(ValueError):
+            self.batch.to_gregorian([1427], [11], [30])
+
+    def test_from_ordinal(self):
+        ordinals = np.arange(1, bangladatetime.date.max.toordinal() + 1, 37)
+        year, month, day = self.batch.from_ordinal(ordinals)
+        for i in range(0, len(ordinals), 89):
+            calc = bangladatetime.date.fromordinal(int(ordinals[i]))
+            self.assertEqual((year[i], month[i], day[i]),
+                             (calc.year, calc.month, calc.day))
+        year, month, day = self.batch.from_ordinal(
+            [bangladatetime.date.max.toordinal()])
+        self.assertEqual((year[0], month[0], day[0]), (9999, 12, 30))
+        with self.assertRaises(ValueError):
+            self.batch.from_ordinal([0])
+
+    def test_from_timestamp(self):
+        timestamps = np.arange(-10**10, 10**10, 86400 * 7 + 3607)
+        utc = datetime.timezone.utc
+        for tz in (None, utc):
+            year, month, day = self.batch.from_timestamp(timestamps, tz)
+            for i in range(0, len(timestamps), 101):
+                calc = bangladatetime.date.fromtimestamp(int(timestamps[i]),
+                                                         tz)
+                self.assertEqual((year[i], month[i], day[i]),
+                                 (calc.year, calc.month, calc.day))
+        year, month, day = self.batch.from_timestamp([-0.5, 0.5], utc)
+        self.assertEqual(day.tolist(), [16, 17])
+
+    def test_from_gregorian_invalid(self):
+        with self.assertRaises(ValueError):
+            self.batch.from_gregorian([2019, 2019], [2, 2], [28, 29])
+        with self.assertRaises(ValueError):
+            self.batch.from_gregorian([2019], [13], [1])
+        with self.assertRaises(ValueError):
+            self.batch.from_gregorian([594], [4], [13])
+        with self.assertRaises(ValueError):
+            self.batch.from_gregorian(np.array(['NaT'],
+                                               dtype='datetime64[D]'))
+        # Non-integers raise TypeError, like date.fromgregorian().
+        with self.assertRaises(TypeError):
+            self.batch.from_gregorian([2020.7], [12], [24])
+        with self.assertRaises(TypeError):
+            self.batch.from_gregorian(np.array([2020.0]), 12, 24)
+        with self.assertRaises(TypeError):
+            self.batch.to_gregorian([1427], [9.5], [9])
+        with self.assertRaises(TypeError):
+            self.batch.from_ordinal([1.0])
+        year, month, day = self.batch.from_gregorian(
+            np.array([2020], dtype=np.int32), np.uint8(12), 24)
+        self.assertEqual((year.tolist(), month.tolist(), day.tolist()),
+                         ([1427], [9], [9]))
+        self.assertEqual(len(self.batch.from_gregorian([], [], [])[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import suite
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_workloads(self):
+        self.assertEqual(suite.make_gregorian(50), suite.make_gregorian(50))
+        self.assertEqual(len(suite.make_ordinals(50)), 50)
+        self.assertEqual(suite.make_ordinals(50)[0], 1)
+        for d in suite.make_dates(50):
+            d.togregorian()
+
+    def test_run(self):
+        report = suite.run(scale=0.0001, repeat=1)
+        self.assertEqual(report['seed'], suite.SEED)
+        for name, (_, _, available) in suite.BENCHMARKS.items():
+            if available:
+                self.assertEqual(report['benchmarks'][name]['size'], 100)
+
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            suite.write_report(report, path)
+            with open(path) as file:
+                self.assertEqual(json.load(file), report)
+        finally:
+            os.remove(path)
+
+        lines = []
+        suite.compare(report, report, log=lines.append)
+        self.assertEqual(len(lines), len(report['benchmarks']))
+        self.assertTrue(all(line.endswith('1.00x') for line in lines))
+
+        self.assertRaises(ValueError, suite.run, ['nonexistent'])
+
+
+if __name__ == "__main__":
+    unittest.main()
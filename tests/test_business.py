@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import bangladatetime
+from bangladatetime import BusinessCalendar, DateArray, date
+from bangladatetime.business import POHELA_BOISHAKH
+
+ONE_DAY = bangladatetime.datetime.resolution * 86400000000
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    def setUp(self):
+        # Victory Day, Poush 1, 1427 (December 16, 2020), and a Thursday.
+        self.holidays = [date(1427, 9, 1), date(1427, 9, 16)]
+        self.cal = BusinessCalendar(holidays=self.holidays,
+                                    first_year=1425,
+                                    last_year=1430)
+        self.dates = [
+            self.cal.first + n * ONE_DAY
+            for n in range(0, self.cal.busday_count(self.cal.first,
+                                                    self.cal.last) * 7 // 5,
+                           11)
+        ]
+
+    def naive_is_busday(self, d):
+        return (d.weekday() not in (4, 5) and d not in self.holidays
+                and (d.month, d.day) != POHELA_BOISHAKH)
+
+    def naive_offset(self, d, offset, roll):
+        step = ONE_DAY if roll in ('forward', 'following') else -ONE_DAY
+        while not self.naive_is_busday(d):
+            d += step
+        step = ONE_DAY if offset >= 0 else -ONE_DAY
+        for _ in range(abs(offset)):
+            d += step
+            while not self.naive_is_busday(d):
+                d += step
+        return d
+
+    def test_is_busday(self):
+        cal = self.cal
+        self.assertEqual(cal.weekmask, '1111001')
+        self.assertFalse(cal.is_busday(date(1427, 1, 1)))  # Pohela Boishakh
+        self.assertFalse(cal.is_busday(date(1427, 9, 10)))  # Friday
+        self.assertFalse(cal.is_busday(date(1427, 9, 11)))  # Saturday
+        self.assertFalse(cal.is_busday(date(1427, 9, 16)))
+        self.assertTrue(cal.is_busday(date(1427, 9, 9)))
+        for d in self.dates:
+            self.assertEqual(cal.is_busday(d), self.naive_is_busday(d), d)
+        # Only the holidays on business days of the week.
+        self.assertEqual(list(cal.holidays)[:4],
+                         [date(1426, 1, 1), date(1427, 1, 1),
+                          date(1427, 9, 1), date(1427, 9, 16)])
+        self.assertRaises(ValueError, cal.is_busday, date(1424, 12, 30))
+        self.assertRaises(ValueError, cal.is_busday, date(1431, 1, 1))
+        self.assertRaises(TypeError, cal.is_busday, 1)
+
+    def test_busday_count(self):
+        cal = self.cal
+        self.assertEqual(cal.busday_count(date(1427, 9, 9), date(1427, 9, 9)),
+                         0)
+        self.assertEqual(cal.busday_count(date(1427, 9, 9),
+                                          date(1427, 9, 20)), 6)
+        self.assertEqual(cal.busday_count(date(1427, 9, 20),
+                                          date(1427, 9, 9)), -6)
+        # end is exclusive, so it may be the day after the last date.
+        stop = cal.last + ONE_DAY
+        total = cal.busday_count(cal.first, cal.last) + \
+            cal.is_busday(cal.last)
+        self.assertEqual(cal.busday_count(cal.first, stop), total)
+        self.assertEqual(cal.busday_count(stop, cal.first), -total)
+        self.assertEqual(cal.busday_count(stop, stop), 0)
+        self.assertRaises(ValueError, cal.busday_count, cal.first,
+                          stop + ONE_DAY)
+        self.assertRaises(ValueError, cal.is_busday, stop)
+        self.assertRaises(ValueError, cal.busday_offset, stop, 0, 'backward')
+        begin = date(1427, 8, 20)
+        count = 0
+        for n in range(100):
+            end = begin + n * ONE_DAY
+            self.assertEqual(cal.busday_count(begin, end), count, end)
+            count += self.naive_is_busday(end)
+
+    def test_busday_offset(self):
+        cal = self.cal
+        self.assertEqual(cal.busday_offset(date(1427, 9, 9), 5),
+                         date(1427, 9, 19))
+        self.assertEqual(cal.busday_offset(date(1427, 9, 19), -5),
+                         date(1427, 9, 9))
+        self.assertEqual(cal.busday_offset(date(1427, 9, 9), 0),
+                         date(1427, 9, 9))
+        self.assertRaises(ValueError, cal.busday_offset, date(1427, 9, 10), 1)
+        self.assertEqual(cal.busday_offset(date(1427, 9, 10), 0, 'forward'),
+                         date(1427, 9, 12))
+        self.assertEqual(cal.busday_offset(date(1427, 9, 10), 0, 'backward'),
+                         date(1427, 9, 9))
+        self.assertRaises(ValueError, cal.busday_offset, date(1427, 9, 9), 1,
+                          'nearest')
+        self.assertRaises(ValueError, cal.busday_offset, cal.last, 10)
+        for d in self.dates[3:-3]:
+            for offset in (-7, -1, 0, 1, 3, 20):
+                for roll in ('forward', 'preceding'):
+                    self.assertEqual(cal.busday_offset(d, offset, roll),
+                                     self.naive_offset(d, offset, roll),
+                                     (d, offset, roll))
+
+    def test_many(self):
+        cal = self.cal
+        dates = self.dates[3:-3]
+        array = DateArray(dates)
+        for numpy in (True, False):
+            with mock.patch.dict('sys.modules',
+                                 {} if numpy else {'numpy': None}):
+                for values in (dates, array):
+                    self.assertEqual(
+                        cal.is_busday_many(values).tolist(),
+                        [cal.is_busday(d) for d in dates])
+                    self.assertEqual(
+                        cal.busday_count_many(values, values[::-1]).tolist(),
+                        [cal.busday_count(b, e)
+                         for b, e in zip(dates, dates[::-1])])
+                    self.assertEqual(
+                        list(cal.busday_offset_many(values, 3, 'backward')),
+                        [cal.busday_offset(d, 3, 'backward') for d in dates])
+                    offsets = [n % 41 - 20 for n in range(len(dates))]
+                    self.assertEqual(
+                        list(cal.busday_offset_many(values, offsets,
+                                                    'following')),
+                        [cal.busday_offset(d, n, 'following')
+                         for d, n in zip(dates, offsets)])
+                with self.assertRaises(ValueError):
+                    cal.busday_offset_many(dates, 0)
+                with self.assertRaises(ValueError):
+                    cal.busday_offset_many([cal.last], 1)
+                with self.assertRaises(ValueError):
+                    cal.is_busday_many([date(1424, 1, 1)])
+                with self.assertRaises(ValueError):
+                    cal.busday_count_many(dates, dates[1:])
+                stop = cal.last + ONE_DAY
+                self.assertEqual(
+                    cal.busday_count_many([cal.first], [stop]).tolist(),
+                    [cal.busday_count(cal.first, stop)])
+                with self.assertRaises(ValueError):
+                    cal.busday_count_many([cal.first], [stop + ONE_DAY])
+                with self.assertRaises(ValueError):
+                    cal.is_busday_many([stop])
+                self.assertEqual(len(cal.is_busday_many([])), 0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_offsets(self):
+        cal = self.cal
+        dates = [date(1427, 9, 9), date(1427, 9, 12)]
+        expected = [cal.busday_offset(d, 3) for d in dates]
+        for offset in (np.int64(3), np.int32(3)):
+            self.assertEqual(cal.busday_offset(dates[0], offset), expected[0])
+            self.assertEqual(list(cal.busday_offset_many(dates, offset)),
+                             expected)
+        self.assertEqual(
+            list(cal.busday_offset_many(dates, np.array([3, 3]))), expected)
+
+    def test_arguments(self):
+        cal = BusinessCalendar('1111010', annual_holidays=[(11, 30)],
+                               first_year=1426, last_year=1427)
+        self.assertEqual(cal.weekmask, '1111010')
+        self.assertEqual(cal.first, date(1426, 1, 1))
+        self.assertEqual(cal.last, date(1427, 12, 30))
+        # Falgun 30 only exists in leap years.
+        self.assertEqual(list(cal.holidays), [date(1426, 11, 30)])
+        self.assertEqual(
+            BusinessCalendar([1, 1, 1, 1, 1, 0, 0]).weekmask, '1111100')
+        for weekmask in ('111100', '11110a1', '0000000', [1] * 6):
+            self.assertRaises(ValueError, BusinessCalendar, weekmask)
+        self.assertRaises(ValueError, BusinessCalendar,
+                          annual_holidays=[(13, 1)])
+        self.assertRaises(ValueError, BusinessCalendar, first_year=1500,
+                          last_year=1400)
+        self.assertRaises(TypeError, BusinessCalendar, holidays=[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
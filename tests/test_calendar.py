@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import calendar
+import datetime
+import unittest
+
+import bangladatetime
+from bangladatetime.calendar import Calendar, monthrange, SATURDAY
+from bangladatetime.date import _days_in_month
+
+
+class TestCalendar(unittest.TestCase):
+    def test_daterange(self):
+        start = bangladatetime.date(1425, 10, 20)
+        stop = bangladatetime.date(1428, 2, 3)
+        for step in (1, 2, 7, 28, 29, 30, 31, 45, 365, 400):
+            expected = [
+                bangladatetime.date.fromordinal(n) for n in range(
+                    start.toordinal(), stop.toordinal(), step)
+            ]
+            self.assertEqual(
+                list(bangladatetime.daterange(start, stop, step)), expected,
+                step)
+            expected = [
+                bangladatetime.date.fromordinal(n) for n in range(
+                    stop.toordinal(), start.toordinal(), -step)
+            ]
+            self.assertEqual(
+                list(bangladatetime.daterange(stop, start, -step)), expected,
+                -step)
+
+        self.assertEqual(
+            list(
+                bangladatetime.daterange(start, stop,
+                                         datetime.timedelta(weeks=20))),
+            list(bangladatetime.daterange(start, stop, 140)))
+        self.assertEqual(list(bangladatetime.daterange(stop, start)), [])
+        self.assertRaises(ValueError, bangladatetime.daterange, start, stop, 0)
+        self.assertRaises(TypeError, bangladatetime.daterange, start, 5)
+
+    def test_iter_month(self):
+        for year in (1426, 1427):
+            for month in range(1, 13):
+                days = list(bangladatetime.iter_month(year, month))
+                self.assertEqual(len(days), _days_in_month(year, month))
+                for day, test in enumerate(days, 1):
+                    self.assertEqual(test, bangladatetime.date(year, month,
+                                                               day))
+                    self.assertEqual(test.toordinal(),
+                                     bangladatetime.date(year, month,
+                                                         day).toordinal())
+        self.assertEqual(len(list(bangladatetime.iter_year(1426))), 366)
+        self.assertEqual(len(list(bangladatetime.iter_year(1427))), 365)
+        self.assertRaises(ValueError, next,
+                          bangladatetime.iter_month(1427, 13))
+
+    def test_calendar(self):
+        self.assertEqual(monthrange(1427, 9), (2, 30))
+        for firstweekday in range(7):
+            bangla = Calendar(firstweekday)
+            gregorian = calendar.Calendar(firstweekday)
+            self.assertEqual(list(bangla.iterweekdays()),
+                             list(gregorian.iterweekdays()))
+            # Poush 1427 starts on Wednesday and has 30 days, as did
+            # September 2021.
+            self.assertEqual(bangla.monthdays2calendar(1427, 9),
+                             gregorian.monthdays2calendar(2021, 9))
+            self.assertEqual(bangla.monthdayscalendar(1427, 9),
+                             gregorian.monthdayscalendar(2021, 9))
+        weeks = Calendar(SATURDAY).monthdayscalendar(1427, 1)
+        self.assertEqual(weeks[0], [0, 0, 0, 1, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
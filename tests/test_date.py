@@ -3,7 +3,11 @@
 
 # import sys
 # import os
+import contextlib
 import csv
+import datetime
+import io
+import sys
 import unittest
 from collections import Counter
 
@@ -15,6 +19,9 @@ import bangladatetime.date
 from bangladatetime.date import _is_leap
 from bangladatetime.date import _days_before_year, _parse_isoformat_date
 from bangladatetime.date import _days_in_month, _ord2md, _ymd2ord
+from bangladatetime.date import _ord2ymd, _MAXORDINAL, MAXYEAR
+from bangladatetime.date import _build_days_before_year, _year_info
+from bangladatetime.date import _isoweek1monday
 
 _DAYS_IN_BANGLA_MONTH = [-1, 31, 31, 31, 31, 31, 31, 30, 30, 30, 30, 29, 30]
 
@@ -58,6 +65,118 @@ class Testbangladatetime(unittest.TestCase):
             self.assertEqual((calc.year, calc.month, calc.day),
                              (bangla_year, bangla_month, bangla_day))
 
+    def test_togregorian(self):
+        with open('tests/2019-2020.csv', encoding="utf16") as file:
+            reader = csv.reader(file)
+            next(reader)
+            data = tuple((str(row[0]), str(row[1])) for row in reader)
+
+        for (gregorian, bangla) in data:
+            calc = bangladatetime.date(*_parse_isoformat_date(bangla))
+            self.assertEqual(calc.togregorian(),
+                             datetime.date(*_parse_isoformat_date(gregorian)))
+            self.assertEqual(calc.to_pydate(), calc.togregorian())
+
+        self.assertEqual(bangladatetime.date(1, 1, 1).togregorian(),
+                         datetime.date(594, 4, 14))
+        with self.assertRaises(ValueError):
+            bangladatetime.date(9999, 1, 1).togregorian()
+
+    def test_arithmetic(self):
+        day = datetime.timedelta(days=1)
+        test = bangladatetime.date(1426, 11, 29)
+        self.assertEqual(test + day, bangladatetime.date(1426, 11, 30))
+        self.assertEqual(day + test, bangladatetime.date(1426, 11, 30))
+        self.assertEqual(test + 2 * day, bangladatetime.date(1426, 12, 1))
+        self.assertEqual(test - 29 * day, bangladatetime.date(1426, 10, 30))
+        self.assertEqual(test + datetime.timedelta(hours=23), test)
+        self.assertEqual(
+            bangladatetime.date(1427, 1, 1) - bangladatetime.date(1426, 1, 1),
+            366 * day)
+        self.assertEqual(
+            bangladatetime.date(1426, 1, 1) - bangladatetime.date(1427, 1, 1),
+            -366 * day)
+        self.assertRaises(OverflowError, bangladatetime.date.max.__add__, day)
+        self.assertRaises(OverflowError, bangladatetime.date.min.__sub__, day)
+        with self.assertRaises(TypeError):
+            test + 1
+        with self.assertRaises(TypeError):
+            test - datetime.date(2020, 1, 1)
+
+    def test_shift(self):
+        test = bangladatetime.date(1426, 11, 29)
+        offsets = [-400, -1, 0, 1, 30, 365, 366]
+        self.assertEqual(
+            test.shift(offsets),
+            [test + datetime.timedelta(days=n) for n in offsets])
+        self.assertEqual(test.shift([]), [])
+        self.assertRaises(OverflowError, test.shift, [0, 10**7])
+        self.assertRaises(TypeError, test.shift, [1.5])
+
+    def test_gregorian_cache(self):
+        bangladatetime.set_gregorian_cache(2)
+        try:
+            first = bangladatetime.date.fromgregorian(2020, 12, 24)
+            self.assertIs(bangladatetime.date.fromgregorian(2020, 12, 24),
+                          first)
+            bangladatetime.date.fromgregorian(2020, 12, 25)
+            bangladatetime.date.fromgregorian(2020, 12, 24)
+            bangladatetime.date.fromgregorian(2020, 12, 26)
+            # 2020-12-25 was the least recently used one.
+            self.assertEqual(bangladatetime.gregorian_cache_info(),
+                             (2, 3, 2, 2))
+            self.assertIs(bangladatetime.date.fromgregorian(2020, 12, 24),
+                          first)
+            self.assertEqual(first, bangladatetime.date(1427, 9, 9))
+            self.assertRaises(ValueError, bangladatetime.date.fromgregorian,
+                              2020, 2, 30)
+            # A warm cache accepts the same arguments as no cache.
+            self.assertRaises(TypeError, bangladatetime.date.fromgregorian,
+                              2020.0, 12, 24)
+            self.assertRaises(TypeError, bangladatetime.date.fromgregorian,
+                              2020, 12.0, 24)
+            self.assertRaises(ValueError, bangladatetime.date.fromgregorian,
+                              594, 1, 1)
+
+            bangladatetime.clear_gregorian_cache()
+            self.assertEqual(bangladatetime.gregorian_cache_info(),
+                             (0, 0, 2, 0))
+            self.assertIsNot(bangladatetime.date.fromgregorian(2020, 12, 24),
+                             first)
+        finally:
+            bangladatetime.set_gregorian_cache(None)
+        self.assertEqual(bangladatetime.gregorian_cache_info(), (0, 0, 0, 0))
+        self.assertRaises(ValueError, bangladatetime.set_gregorian_cache, -1)
+
+    def test_fromtimestamp(self):
+        # 2020-12-23 18:00 UTC is midnight of Poush 9, 1427 in Bangladesh.
+        midnight = datetime.datetime(2020, 12, 23, 18,
+                                     tzinfo=datetime.timezone.utc).timestamp()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            test = bangladatetime.date.fromtimestamp(midnight)
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual(test, bangladatetime.date(1427, 9, 9))
+        self.assertEqual(bangladatetime.date.fromtimestamp(midnight - 0.5),
+                         bangladatetime.date(1427, 9, 8))
+        self.assertEqual(
+            bangladatetime.date.fromtimestamp(midnight,
+                                              datetime.timezone.utc),
+            bangladatetime.date(1427, 9, 8))
+        self.assertEqual(bangladatetime.date.fromtimestamp(0),
+                         bangladatetime.date.fromgregorian(1970, 1, 1))
+
+        class NoFixedOffset(datetime.tzinfo):
+            def utcoffset(self, dt):
+                return None if dt is None else datetime.timedelta(0)
+
+        self.assertRaises(ValueError, bangladatetime.date.fromtimestamp, 0,
+                          NoFixedOffset())
+        self.assertRaises(TypeError, bangladatetime.date.fromtimestamp, 0,
+                          'UTC')
+        self.assertRaises(OverflowError, bangladatetime.date.fromtimestamp,
+                          1e20)
+
     def test_is_leap_year(self):
         """
         Test that it can sum a list of integers
@@ -80,6 +199,50 @@ class Testbangladatetime(unittest.TestCase):
             ans = (year - 1) * 365 + NUMBER_OF_LEAP_YEARS_BEFORE[year - 1]
             self.assertEqual(ans, ret, errorMsg + str(year))
 
+    def test_year_tables(self):
+        days_before_year = _build_days_before_year()
+        self.assertEqual(len(days_before_year), MAXYEAR + 2)
+        for year in range(1, MAXYEAR + 2):
+            self.assertEqual(days_before_year[year], _days_before_year(year))
+        for year in (1, 1426, 1427, 9999):
+            self.assertEqual(_year_info(year),
+                             (_is_leap(year), _isoweek1monday(year)))
+
+    def test_constant_tables(self):
+        # Tables spelled out as literals, so that they cost nothing to
+        # import, against what they are derived from.
+        m = sys.modules['bangladatetime.date']
+        self.assertEqual(m._DAYS_BEFORE_MONTH[1:], [
+            sum(_DAYS_IN_BANGLA_MONTH[1:month]) for month in range(1, 13)
+        ])
+        self.assertEqual(m._DI4Y, _days_before_year(5))
+        self.assertEqual(m._DI100Y, _days_before_year(101))
+        self.assertEqual(m._DI400Y, _days_before_year(401))
+        self.assertEqual(m._DI4Y, 4 * 365 + 1)
+        self.assertEqual(m._DI100Y, 25 * m._DI4Y - 1)
+        self.assertEqual(m._DI400Y, 4 * m._DI100Y + 1)
+        for value, fields in ((m.date.min, (1, 1, 1)),
+                              (m.date.max, (MAXYEAR, 12, 30)),
+                              (m.datetime.min, (1, 1, 1)),
+                              (m.datetime.max,
+                               (MAXYEAR, 12, 30, 23, 59, 59, 999999))):
+            self.assertEqual(value, type(value)(*fields))
+            self.assertEqual(value.toordinal(), _ymd2ord(*fields[:3]))
+
+    def test_isocalendar(self):
+        ordinal = _ymd2ord(1426, 12, 26)
+        for offset in range(-14, 14):
+            test = bangladatetime.date.fromordinal(ordinal + offset)
+            year, week, day = test.isocalendar()
+            self.assertEqual(day, test.isoweekday())
+            self.assertEqual(
+                _isoweek1monday(year) + (week - 1) * 7 + day - 1,
+                test.toordinal())
+        self.assertEqual(bangladatetime.date(1427, 1, 1).isocalendar(),
+                         (1427, 1, 2))
+        self.assertEqual(bangladatetime.date(1426, 12, 30).isocalendar(),
+                         (1427, 1, 1))
+
     def test_ord2md(self):
         non_leap_list = []
         for i in range(1, 366):
@@ -95,6 +258,25 @@ class Testbangladatetime(unittest.TestCase):
         duplicates = Counter(leap_list)
         self.assertEqual(len(duplicates), 366, "Failed in a leap year")
 
+        self.assertEqual(_ord2md(1426, 336), (11, 30))
+        self.assertEqual(_ord2md(1427, 336), (12, 1))
+        self.assertRaises(ValueError, _ord2md, 1427, 0)
+        self.assertRaises(ValueError, _ord2md, 1427, 366)
+
+    def test_ord2ymd(self):
+        errorMsg = "Test failed with bangla year: "
+        ordinaldate = 0
+        for year in range(1, MAXYEAR + 1):
+            for month in range(1, 13):
+                days = _days_in_month(year, month)
+                for day in range(1, days + 1):
+                    ordinaldate = ordinaldate + 1
+                    self.assertEqual(_ord2ymd(ordinaldate), (year, month, day),
+                                     errorMsg + str(year))
+        self.assertEqual(ordinaldate, _MAXORDINAL)
+        self.assertRaises(ValueError, _ord2ymd, 0)
+        self.assertRaises(ValueError, _ord2ymd, _MAXORDINAL + 1)
+
     def test_fromordinal(self):
         """
         Test that it can sum a list of integers
@@ -110,6 +292,26 @@ class Testbangladatetime(unittest.TestCase):
                     self.assertEqual((test.year, test.month, test.day),
                                      (year, month, day), errorMsg + str(year))
 
+    def test_fromtrusted(self):
+        fields = [(1, 1, 1), (1426, 11, 30), (1427, 9, 9), (MAXYEAR, 12, 30)]
+        for cls in (bangladatetime.date, bangladatetime.datetime):
+            dates = cls.fromtrusted(fields)
+            self.assertEqual(dates, [cls(*f) for f in fields])
+            self.assertEqual([d.toordinal() for d in dates],
+                             [_ymd2ord(*f) for f in fields])
+            self.assertTrue(all(type(d) is cls for d in dates))
+        self.assertEqual(bangladatetime.date.fromtrusted(iter([])), [])
+
+    def test_replace(self):
+        d = bangladatetime.date(1426, 11, 30)
+        self.assertEqual(d.replace(), d)
+        self.assertEqual(d.replace(day=29), bangladatetime.date(1426, 11, 29))
+        self.assertEqual(d.replace(year=1427, day=29).toordinal(),
+                         _ymd2ord(1427, 11, 29))
+        self.assertRaises(ValueError, d.replace, year=1427)
+        self.assertRaises(ValueError, d.replace, month=13)
+        self.assertRaises(TypeError, d.replace, day='1')
+
     def test_ymd2ord(self):
         """
         Test that it can sum a list of integers
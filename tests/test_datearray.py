@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pickle
+import unittest
+from array import array
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import bangladatetime
+from bangladatetime import DateArray
+
+
+class TestDateArray(unittest.TestCase):
+    def setUp(self):
+        self.dates = [
+            bangladatetime.date(1427, 9, 9),
+            bangladatetime.date(1400, 1, 1),
+            bangladatetime.date(1426, 11, 30),
+            bangladatetime.date(1427, 9, 9),
+            bangladatetime.date(9999, 12, 30),
+            bangladatetime.date(1, 1, 1),
+        ]
+        self.array = DateArray(self.dates)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.array), len(self.dates))
+        self.assertEqual(list(self.array), self.dates)
+        self.assertEqual(self.array[0], self.dates[0])
+        self.assertEqual(self.array[-1], self.dates[-1])
+        self.assertIn(bangladatetime.date(1400, 1, 1), self.array)
+        self.assertNotIn(bangladatetime.date(1400, 1, 2), self.array)
+        self.assertNotIn(1, self.array)
+        self.assertEqual(len(DateArray()), 0)
+        self.assertEqual(self.array.ordinals.itemsize, 4)
+        self.assertEqual(self.array.ordinals.tolist(),
+                         [d.toordinal() for d in self.dates])
+        self.assertRaises(TypeError, DateArray, [1])
+        self.assertRaises(IndexError, self.array.__getitem__, 6)
+        with self.assertRaises(TypeError):
+            self.array.ordinals[0] = 1
+
+    def test_slicing(self):
+        for s in (slice(1, 4), slice(None, None, -1), slice(0, 6, 2),
+                  slice(5, 0, -2)):
+            part = self.array[s]
+            self.assertIsInstance(part, DateArray)
+            self.assertEqual(list(part), self.dates[s])
+            self.assertEqual(part.year.tolist(),
+                             [d.year for d in self.dates[s]])
+        # Slices share the buffer of the array.
+        ordinals = array('i', [d.toordinal() for d in self.dates])
+        full = DateArray.fromordinals(ordinals)
+        part = full[1:3]
+        ordinals[1] += 1
+        self.assertEqual(part[0], self.dates[1].replace(day=2))
+
+    def test_fields(self):
+        self.assertEqual(self.array.year.tolist(),
+                         [d.year for d in self.dates])
+        self.assertEqual(self.array.month.tolist(),
+                         [d.month for d in self.dates])
+        self.assertEqual(self.array.day.tolist(),
+                         [d.day for d in self.dates])
+        self.assertEqual(self.array.weekday().tolist(),
+                         [d.weekday() for d in self.dates])
+        self.assertEqual(DateArray().year.tolist(), [])
+
+        expected = tuple(column.tolist() for column in self.array.fields())
+        with mock.patch.dict('sys.modules', {'numpy': None}):
+            self.assertEqual(
+                tuple(column.tolist() for column in self.array.fields()),
+                expected)
+            self.assertEqual(self.array.weekday().tolist(),
+                             [d.weekday() for d in self.dates])
+
+    def test_fromordinals(self):
+        ordinals = [d.toordinal() for d in self.dates]
+        for numpy in (True, False):
+            with mock.patch.dict('sys.modules',
+                                 {} if numpy else {'numpy': None}):
+                self.assertEqual(DateArray.fromordinals(ordinals), self.array)
+                self.assertEqual(DateArray.fromordinals(array('i', ordinals)),
+                                 self.array)
+                self.assertEqual(DateArray.fromordinals(array('q', ordinals)),
+                                 self.array)
+                self.assertRaises(ValueError, DateArray.fromordinals, [0])
+                self.assertRaises(ValueError, DateArray.fromordinals,
+                                  array('i', [0]))
+                self.assertRaises(ValueError, DateArray.fromordinals,
+                                  [1, bangladatetime.date.max.toordinal() + 1])
+                self.assertRaises(TypeError, DateArray.fromordinals, [1.0])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self):
+        ordinals = np.arange(1, bangladatetime.date.max.toordinal() + 1,
+                             dtype=np.int32)
+        dates = DateArray.fromordinals(ordinals)
+        self.assertTrue(np.shares_memory(dates.to_numpy(), ordinals))
+        self.assertEqual(dates[-1], bangladatetime.date.max)
+        year, month, day = dates[::1000].fields()
+        for i, d in enumerate(dates[::1000]):
+            self.assertEqual((year[i], month[i], day[i]),
+                             (d.year, d.month, d.day))
+        self.assertEqual(DateArray.fromordinals(ordinals.astype(np.int64)),
+                         dates)
+
+    def test_searchsorted(self):
+        dates = self.array.sorted()
+        self.assertEqual(list(dates), sorted(self.dates))
+        value = bangladatetime.date(1427, 9, 9)
+        self.assertEqual(dates.searchsorted(value), 3)
+        self.assertEqual(dates.searchsorted(value, side='right'), 5)
+        self.assertEqual(dates.searchsorted(bangladatetime.date(1, 1, 1)), 0)
+        self.assertRaises(ValueError, dates.searchsorted, value, 'middle')
+        self.assertRaises(TypeError, dates.searchsorted, 1)
+
+    def test_reductions(self):
+        for numpy in (True, False):
+            with mock.patch.dict('sys.modules',
+                                 {} if numpy else {'numpy': None}):
+                self.assertEqual(self.array.min(),
+                                 bangladatetime.date(1, 1, 1))
+                self.assertEqual(self.array.max(),
+                                 bangladatetime.date(9999, 12, 30))
+                self.assertEqual(list(self.array.sorted()),
+                                 sorted(self.dates))
+                self.assertEqual(list(self.array.unique()),
+                                 sorted(set(self.dates)))
+                self.assertEqual(self.array[::-1].unique(),
+                                 self.array.unique())
+                self.assertEqual(len(DateArray().unique()), 0)
+                self.assertRaises(ValueError, DateArray().min)
+                self.assertRaises(ValueError, DateArray().max)
+
+    def test_pickle(self):
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(self.array, proto)),
+                             self.array)
+
+    def test_repr(self):
+        self.assertEqual(repr(DateArray()),
+                         'bangladatetime.datearray.DateArray([])')
+        self.assertIn('...', repr(DateArray(self.dates * 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import pickle
+import unittest
+
+import bangladatetime
+from bangladatetime import BST
+
+# 2020-12-24T00:00:00Z, which is Poush 9, 1427 06:00 in Bangladesh.
+TIMESTAMP = 1608768000
+
+
+class TestTime(unittest.TestCase):
+    def test_fields(self):
+        t = bangladatetime.time(5, 6, 7, 8)
+        self.assertEqual((t.hour, t.minute, t.second, t.microsecond),
+                         (5, 6, 7, 8))
+        self.assertIsNone(t.tzinfo)
+        self.assertRaises(ValueError, bangladatetime.time, 24)
+        self.assertRaises(TypeError, bangladatetime.time, 1, tzinfo=1)
+
+    def test_isoformat(self):
+        t = bangladatetime.time(5, 6, 7, 8000, BST)
+        self.assertEqual(t.isoformat(), '05:06:07.008000+06:00')
+        self.assertEqual(t.isoformat('milliseconds'), '05:06:07.008+06:00')
+        self.assertEqual(str(bangladatetime.time(5, 6)), '05:06:00')
+        self.assertEqual(bangladatetime.time.fromisoformat(t.isoformat()), t)
+        self.assertRaises(ValueError, bangladatetime.time.fromisoformat, '5')
+
+    def test_compare(self):
+        utc = datetime.timezone.utc
+        self.assertEqual(bangladatetime.time(6, tzinfo=BST),
+                         bangladatetime.time(0, tzinfo=utc))
+        self.assertEqual(hash(bangladatetime.time(6, tzinfo=BST)),
+                         hash(bangladatetime.time(0, tzinfo=utc)))
+        self.assertLess(bangladatetime.time(5), bangladatetime.time(5, 1))
+        self.assertNotEqual(bangladatetime.time(0),
+                            bangladatetime.time(0, tzinfo=utc))
+        with self.assertRaises(TypeError):
+            bangladatetime.time(0) < bangladatetime.time(0, tzinfo=utc)
+
+    def test_pickle(self):
+        for t in (bangladatetime.time(5, 6, 7, 8),
+                  bangladatetime.time(23, 59, tzinfo=BST, fold=1)):
+            self.assertEqual(pickle.loads(pickle.dumps(t)), t)
+            self.assertEqual(pickle.loads(pickle.dumps(t)).fold, t.fold)
+
+
+class TestDatetime(unittest.TestCase):
+    def test_fromtimestamp(self):
+        dt = bangladatetime.datetime.fromtimestamp(TIMESTAMP)
+        self.assertEqual(dt, bangladatetime.datetime(1427, 9, 9, 6))
+        self.assertIsNone(dt.tzinfo)
+        self.assertEqual(dt.timestamp(), TIMESTAMP)
+
+        dt = bangladatetime.datetime.utcfromtimestamp(TIMESTAMP - 0.25)
+        self.assertEqual(dt,
+                         bangladatetime.datetime(1427, 9, 8, 23, 59, 59,
+                                                 750000))
+
+        utc = datetime.timezone.utc
+        dt = bangladatetime.datetime.fromtimestamp(TIMESTAMP, utc)
+        self.assertEqual(dt.isoformat(), '1427-09-09T00:00:00+00:00')
+        self.assertEqual(dt.timestamp(), TIMESTAMP)
+
+        for t in range(TIMESTAMP - 86400 * 400, TIMESTAMP, 86400 * 7 + 3607):
+            expected = datetime.datetime.fromtimestamp(t, utc)
+            dt = bangladatetime.datetime.fromtimestamp(t, utc)
+            self.assertEqual(dt.togregorian(), expected)
+            self.assertEqual(
+                bangladatetime.datetime.fromtimestamp(t).togregorian(),
+                expected.astimezone(BST).replace(tzinfo=None))
+
+    def test_fromtimestamp_tzinfo(self):
+        class Fixed(datetime.tzinfo):
+            def utcoffset(self, dt):
+                return datetime.timedelta(hours=-5)
+
+            def dst(self, dt):
+                return datetime.timedelta(0)
+
+            def fromutc(self, dt):
+                return dt + self.utcoffset(dt)
+
+        dt = bangladatetime.datetime.fromtimestamp(TIMESTAMP, Fixed())
+        self.assertEqual((dt.day, dt.hour), (8, 19))
+        self.assertEqual(dt.timestamp(), TIMESTAMP)
+
+    def test_isoformat(self):
+        dt = bangladatetime.datetime(1427, 9, 9, 6, 5, 4, 3)
+        self.assertEqual(dt.isoformat(), '1427-09-09T06:05:04.000003')
+        self.assertEqual(str(dt), '1427-09-09 06:05:04.000003')
+        self.assertEqual(dt.isoformat(timespec='minutes'), '1427-09-09T06:05')
+        self.assertEqual(bangladatetime.datetime.fromisoformat(dt.isoformat()),
+                         dt)
+        dt = dt.replace(tzinfo=BST)
+        self.assertEqual(bangladatetime.datetime.fromisoformat(dt.isoformat()),
+                         dt)
+        self.assertEqual(
+            repr(dt), 'bangladatetime.date.datetime(1427, 9, 9, 6, 5, 4, 3, '
+            'tzinfo=%r)' % BST)
+        self.assertEqual(f'{dt:%OA %H:%M}', 'বৃহস্পতিবার 06:05')
+        self.assertEqual(dt.ctime(), 'Thu Pous  9 06:05:04 1427')
+
+    def test_arithmetic(self):
+        dt = bangladatetime.datetime(1427, 12, 30, 23)
+        hour = datetime.timedelta(hours=1)
+        self.assertEqual(dt + hour, bangladatetime.datetime(1428, 1, 1))
+        self.assertEqual(hour + dt, bangladatetime.datetime(1428, 1, 1))
+        self.assertEqual(dt - 24 * hour, bangladatetime.datetime(1427, 12,
+                                                                 29, 23))
+        self.assertEqual(dt - bangladatetime.datetime(1427, 12, 30),
+                         23 * hour)
+        aware = dt.replace(tzinfo=BST)
+        self.assertEqual(aware - aware.astimezone(datetime.timezone.utc),
+                         datetime.timedelta(0))
+        self.assertRaises(TypeError, dt.__sub__, aware)
+        self.assertEqual(dt.shift([1, 2]), [dt + 24 * hour, dt + 48 * hour])
+        self.assertRaises(OverflowError, bangladatetime.datetime.max.__add__,
+                          hour)
+
+    def test_compare(self):
+        dt = bangladatetime.datetime(1427, 9, 9, 6)
+        aware = dt.replace(tzinfo=BST)
+        utc = aware.astimezone(datetime.timezone.utc)
+        self.assertEqual(utc.hour, 0)
+        self.assertEqual(aware, utc)
+        self.assertEqual(hash(aware), hash(utc))
+        self.assertNotEqual(dt, aware)
+        self.assertNotEqual(dt, bangladatetime.date(1427, 9, 9))
+        self.assertNotEqual(bangladatetime.date(1427, 9, 9),
+                            bangladatetime.datetime(1427, 9, 9))
+        self.assertLess(dt, dt.replace(microsecond=1))
+        with self.assertRaises(TypeError):
+            dt < aware
+        with self.assertRaises(TypeError):
+            dt < bangladatetime.date(1427, 9, 9)
+        with self.assertRaises(TypeError):
+            bangladatetime.date(1427, 9, 9) - dt
+
+    def test_parts(self):
+        dt = bangladatetime.datetime(1427, 9, 9, 6, 5, tzinfo=BST)
+        self.assertEqual(dt.date(), bangladatetime.date(1427, 9, 9))
+        self.assertIs(type(dt.date()), bangladatetime.date)
+        self.assertEqual(dt.time(), bangladatetime.time(6, 5))
+        self.assertEqual(dt.timetz(), bangladatetime.time(6, 5, tzinfo=BST))
+        self.assertEqual(
+            bangladatetime.datetime.combine(dt.date(), dt.timetz()), dt)
+        self.assertEqual(dt.togregorian(),
+                         datetime.datetime(2020, 12, 24, 6, 5, tzinfo=BST))
+        self.assertEqual(dt.utcoffset(), datetime.timedelta(hours=6))
+        self.assertEqual(dt.tzname(), 'BST')
+        self.assertEqual(bangladatetime.datetime.fromordinal(5),
+                         bangladatetime.datetime(1, 1, 5))
+        self.assertEqual(bangladatetime.datetime.fromgregorian(2020, 12, 24),
+                         bangladatetime.datetime(1427, 9, 9))
+
+    def test_replace(self):
+        dt = bangladatetime.datetime(1426, 11, 30, 6, 5, 4, 3, fold=1)
+        self.assertEqual(dt.replace(), dt)
+        self.assertEqual(dt.replace().fold, 1)
+        self.assertEqual(dt.replace(hour=7, tzinfo=BST),
+                         bangladatetime.datetime(1426, 11, 30, 7, 5, 4, 3,
+                                                 tzinfo=BST))
+        self.assertEqual(dt.replace(day=1).toordinal(),
+                         bangladatetime.date(1426, 11, 1).toordinal())
+        self.assertRaises(ValueError, dt.replace, year=1427)
+        self.assertRaises(ValueError, dt.replace, hour=24)
+        self.assertRaises(TypeError, dt.replace, tzinfo=1)
+        with self.assertRaises(TypeError):
+            bangladatetime.datetime.combine(dt.date(), dt.time(), tzinfo=1)
+        self.assertEqual(
+            bangladatetime.datetime.combine(dt.date(), dt.time(), BST),
+            dt.replace(tzinfo=BST, fold=0))
+
+    def test_pickle(self):
+        for dt in (bangladatetime.datetime(1427, 9, 9, 6, 5, 4, 3),
+                   bangladatetime.datetime(1427, 9, 9, tzinfo=BST, fold=1)):
+            copy = pickle.loads(pickle.dumps(dt))
+            self.assertEqual(copy, dt)
+            self.assertEqual(copy.fold, dt.fold)
+            self.assertEqual(copy.toordinal(), dt.toordinal())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import bangladatetime
+from bangladatetime.formatting import _compile
+
+
+class TestStrftime(unittest.TestCase):
+    def test_directives(self):
+        test = bangladatetime.date(1427, 9, 9)
+        self.assertEqual(
+            test.strftime('%a %A %b %B %d %e %m %j %y %Y %u %w %G %V'),
+            'Thu Thursday Pous Poush 09 9 09 255 27 1427 4 4 1427 37')
+        self.assertEqual(test.strftime('%H:%M:%S.%f %%Y'),
+                         '00:00:00.000000 %Y')
+        self.assertEqual(bangladatetime.date(1426, 12, 30).strftime('%j'),
+                         '366')
+        self.assertEqual(bangladatetime.date(5, 1, 1).strftime('%Y %y'),
+                         '0005 05')
+
+    def test_bangla_directives(self):
+        test = bangladatetime.date(1427, 9, 9)
+        self.assertEqual(test.strftime('%OA, %Oe %OB %OY'),
+                         'বৃহস্পতিবার, ৯ পৌষ ১৪২৭')
+        self.assertEqual(test.strftime('%Oa %Ob %Od-%Om-%Oy %Oj'),
+                         'বৃহস্পতি পৌষ ০৯-০৯-২৭ ২৫৫')
+
+    def test_format(self):
+        test = bangladatetime.date(1427, 1, 1)
+        self.assertEqual(f'{test:%d %B %Y}', '01 Boishakh 1427')
+        self.assertEqual(f'{test}', '1427-01-01')
+        self.assertRaises(TypeError, test.__format__, 1)
+
+    def test_invalid(self):
+        test = bangladatetime.date(1427, 1, 1)
+        for fmt in ('%', '%O', '%Q', '%O%', '%Oz'):
+            self.assertRaises(ValueError, test.strftime, fmt)
+
+    def test_cache(self):
+        _compile.cache_clear()
+        test = bangladatetime.date(1427, 1, 1)
+        for _ in range(3):
+            test.strftime('%Y/%m/%d')
+        self.assertEqual(_compile.cache_info().misses, 1)
+        self.assertEqual(_compile.cache_info().hits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Import-time regressions of "import bangladatetime".
+
+The package only imports bangladatetime.date eagerly; the other modules,
+and their dependencies such as NumPy, are loaded when first used.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+import bangladatetime
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous budget in milliseconds for the time spent in the package's own
+# modules, not counting the standard library modules they import.  It is
+# about 1 ms on a typical machine.
+_BUDGET = 25
+
+
+def _importtime(source='import bangladatetime'):
+    "-> {module: (self us, cumulative us)} of a fresh interpreter."
+    env = dict(os.environ)
+    # Stale bytecode would be compiled again on every run.
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', source],
+                            cwd=_ROOT,
+                            env=env,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        if own.strip().isdigit():
+            modules[name.strip()] = (int(own), int(cumulative))
+    return modules
+
+
+@unittest.skipIf(sys.version_info < (3, 7),
+                 'module __getattr__ and -X importtime need Python 3.7')
+class TestImport(unittest.TestCase):
+    def test_eager_modules(self):
+        modules = _importtime()
+        self.assertEqual(
+            {name for name in modules if name.startswith('bangladatetime')},
+            {'bangladatetime', 'bangladatetime.date'})
+        for name in ('numpy', 'pandas', 'concurrent.futures', 'mmap',
+                     'struct', 'csv'):
+            self.assertNotIn(name, modules)
+
+    def test_budget(self):
+        _importtime()  # Write the bytecode of the package.
+        own = min(
+            sum(times[0] for name, times in _importtime().items()
+                if name.startswith('bangladatetime')) for _ in range(3))
+        self.assertLess(own / 1000, _BUDGET)
+
+    def test_lazy_attributes(self):
+        from bangladatetime import calendar, datearray, serialize
+        self.assertIs(bangladatetime.DateArray, datearray.DateArray)
+        self.assertIs(bangladatetime.daterange, calendar.daterange)
+        self.assertIs(bangladatetime.map_dates, serialize.map_dates)
+        self.assertIs(bangladatetime.formatting,
+                      sys.modules['bangladatetime.formatting'])
+        for name in ('DateArray', 'iter_year', 'load_dates', 'formatting',
+                     'date'):
+            self.assertIn(name, dir(bangladatetime))
+        with self.assertRaises(AttributeError):
+            bangladatetime.no_such_name
+
+    def test_without_numpy(self):
+        # What "python -m unittest" discovery does, without NumPy or pandas.
+        subprocess.run([
+            sys.executable, '-c',
+            'import sys\n'
+            'sys.modules["numpy"] = sys.modules["pandas"] = None\n'
+            'import bangladatetime\n'
+            'assert "batch" not in dir(bangladatetime)\n'
+            'for name in dir(bangladatetime):\n'
+            '    getattr(bangladatetime, name)\n'
+            'assert not hasattr(bangladatetime, "pandas")\n'
+            'assert "bangladatetime.pandas" not in sys.modules\n'
+        ], cwd=_ROOT, check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
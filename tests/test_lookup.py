@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+
+from bangladatetime import LookupTable, date
+from bangladatetime.cli import main
+from bangladatetime.lookup import write_table, _HEADER
+
+
+class TestLookupTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.tmpdir, 'dates.bin')
+        cls.count = write_table(cls.path)
+        with open(cls.path, 'rb') as file:
+            cls.data = file.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def write(self, data):
+        path = os.path.join(self.tmpdir, 'bad.bin')
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def test_lookup(self):
+        self.assertEqual(self.count, date.max.toordinal())
+        self.assertEqual(len(self.data), _HEADER.size + 4 * self.count)
+        with LookupTable(self.path) as table:
+            self.assertEqual(len(table), self.count)
+            for n in list(range(1, self.count + 1, 997)) + [self.count]:
+                d = date.fromordinal(n)
+                self.assertEqual(table.fromordinal(n), d)
+                self.assertEqual(table.ord2ymd(n), (d.year, d.month, d.day))
+                self.assertEqual(table.fromordinal(n).toordinal(), n)
+            self.assertEqual(table.fromgregorian(2020, 12, 24),
+                             date(1427, 9, 9))
+            self.assertEqual(table.fromgregorian(datetime.date(2020, 4, 13)),
+                             date(1426, 12, 30))
+            self.assertEqual(
+                table.fromordinals([1, date(1427, 9, 9).toordinal()]),
+                [date.min, date(1427, 9, 9)])
+            for n in (0, self.count + 1):
+                self.assertRaises(ValueError, table.fromordinal, n)
+                self.assertRaises(ValueError, table.fromordinals, [n])
+            self.assertRaises(TypeError, table.fromordinal, 1.0)
+            self.assertRaises(ValueError, table.fromgregorian, 1, 1, 1)
+        self.assertRaises(ValueError, table.fromordinal, 1)
+
+    def test_stale(self):
+        header, entries = self.data[:_HEADER.size], self.data[_HEADER.size:]
+        corrupt = bytearray(entries)
+        corrupt[4 * 1000] ^= 1
+        wrong = bytearray(entries)
+        # Shift the dates by a day, with a valid checksum.
+        wrong[4:] = entries[:-4]
+        fields = list(_HEADER.unpack(header))
+        for data in (b'', header, header + entries[:-4],
+                     b'XXXX' + self.data[4:], header + corrupt):
+            self.assertRaises(ValueError, LookupTable, self.write(data))
+        for i, value in ((1, 2), (3, 1), (4, 0)):
+            stale = list(fields)
+            stale[i] = value
+            self.assertRaises(ValueError, LookupTable,
+                              self.write(_HEADER.pack(*stale) + entries))
+        fields[5] = zlib.crc32(wrong)
+        self.assertRaises(ValueError, LookupTable,
+                          self.write(_HEADER.pack(*fields) + wrong))
+        # Without verify, only the checksum is skipped.
+        LookupTable(self.write(header + corrupt), verify=False).close()
+
+    def test_cli(self):
+        path = os.path.join(self.tmpdir, 'cli.bin')
+        self.assertEqual(main(['table', path]), 0)
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read(), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
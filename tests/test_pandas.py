@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+import bangladatetime
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestPandas(unittest.TestCase):
+    def setUp(self):
+        import numpy as np
+        from bangladatetime import pandas as bpd
+        self.np = np
+        self.bpd = bpd
+        self.gregorian = pd.Series(pd.to_datetime(
+            ['2020-12-24', '2021-04-14', None, '1969-12-31 23:00:00'],
+            format='ISO8601'),
+                                   name='g')
+        self.dates = [
+            bangladatetime.date(1427, 9, 9),
+            bangladatetime.date(1428, 1, 1), None,
+            bangladatetime.date(1376, 9, 16)
+        ]
+
+    def test_accessor_fields(self):
+        s = self.gregorian
+        self.assertEqual(s.bangla.year.tolist()[:2], [1427, 1428])
+        self.assertTrue(self.np.isnan(s.bangla.year[2]))
+        self.assertEqual(s.bangla.month.tolist()[3], 9)
+        self.assertEqual(s.bangla.day.tolist()[3], 16)
+        self.assertEqual(s.bangla.weekday.tolist()[0], 3)
+        self.assertEqual(s.bangla.ordinal.tolist()[0],
+                         self.dates[0].toordinal())
+        self.assertEqual(s.bangla.year.name, 'g')
+        self.assertEqual(
+            s.bangla.strftime('%d %B %Y').tolist()[:2],
+            ['09 Poush 1427', '01 Boishakh 1428'])
+        self.assertTrue(self.np.isnan(s.bangla.strftime('%Y')[2]))
+
+        complete = s.dropna()
+        self.assertEqual(complete.bangla.year.dtype, self.np.int64)
+
+        with self.assertRaises(AttributeError):
+            pd.Series([1, 2]).bangla
+
+    def test_accessor_matches_scalar(self):
+        s = pd.Series(pd.date_range('1900-01-01', '2100-12-31', freq='7D'))
+        year, month, day = (s.bangla.year, s.bangla.month, s.bangla.day)
+        for i in range(0, len(s), 53):
+            g = s[i]
+            d = bangladatetime.date.fromgregorian(g.year, g.month, g.day)
+            self.assertEqual((year[i], month[i], day[i]),
+                             (d.year, d.month, d.day))
+
+    def test_timezone(self):
+        s = pd.Series(pd.to_datetime(['2020-12-23 18:30']).tz_localize(
+            'UTC').tz_convert('Asia/Dhaka'))
+        # The wall clock date in Dhaka, 2020-12-24.
+        self.assertEqual(s.bangla.date[0], bangladatetime.date(1427, 9, 9))
+
+    def test_dtype(self):
+        s = self.gregorian.bangla.date
+        self.assertIsInstance(s.dtype, self.bpd.BanglaDateDtype)
+        self.assertEqual(str(s.dtype), 'bangladate')
+        self.assertEqual(list(s.isna()), [False, False, True, False])
+        self.assertEqual(s[0], self.dates[0])
+        self.assertIs(s[2], pd.NaT)
+        self.assertEqual(s.array.nbytes, 16)
+
+        from_dates = pd.Series(self.dates, dtype='bangladate', name='g')
+        self.assertTrue(from_dates.equals(s))
+        from_gregorian = pd.Series(
+            self.bpd.BanglaDateArray(
+                [datetime.date(2020, 12, 24),
+                 datetime.date(2021, 4, 14), None,
+                 datetime.date(1969, 12, 31)]), name='g')
+        self.assertTrue(from_gregorian.equals(s))
+        self.assertTrue(s.bangla.togregorian().dropna().equals(
+            self.gregorian.dropna().dt.normalize().astype('datetime64[s]')))
+        self.assertEqual(s.bangla.month.tolist()[:2], [9, 1])
+        self.assertRaises(TypeError, self.bpd.BanglaDateArray, [1])
+        self.assertRaises(ValueError, self.bpd.BanglaDateArray.fromordinals,
+                          [-1])
+
+    def test_operations(self):
+        s = self.gregorian.bangla.date
+        self.assertEqual(list(s == self.dates[0]), [True, False, False, False])
+        self.assertEqual(list(s != self.dates[0]), [False, True, True, True])
+        self.assertEqual(list(s < self.dates[1]), [True, False, False, True])
+        self.assertEqual(s.min(), self.dates[3])
+        self.assertEqual(s.max(), self.dates[1])
+        self.assertEqual(list(s.sort_values().dropna()),
+                         sorted(d for d in self.dates if d is not None))
+        self.assertEqual(len(pd.concat([s, s]).unique()), 4)
+        self.assertEqual(s.take([0, 0]).tolist(), [self.dates[0]] * 2)
+
+        copy = s.copy()
+        copy[1] = self.dates[0]
+        self.assertEqual(copy[1], self.dates[0])
+        self.assertEqual(s[1], self.dates[1])
+
+    def test_groupby(self):
+        df = pd.DataFrame({
+            'g': pd.date_range('2020-04-14', periods=365),
+            'v': 1
+        })
+        by_month = df.groupby(df.g.bangla.month).v.sum()
+        self.assertEqual(by_month.tolist(),
+                         [31] * 6 + [30] * 4 + [29, 30])
+        by_date = df.groupby(df.g.bangla.date).v.sum()
+        self.assertEqual(len(by_date), 365)
+        self.assertEqual(by_date.index[0], bangladatetime.date(1427, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import bangladatetime
+from bangladatetime.parsing import (parse_isoformat_many, parse,
+                                    parse_many, strptime)
+
+
+class TestParseIsoformatMany(unittest.TestCase):
+    def setUp(self):
+        self.dates = [
+            bangladatetime.date.fromordinal(n)
+            for n in range(1, bangladatetime.date.max.toordinal(), 7919)
+        ]
+        self.dates.append(bangladatetime.date(1426, 11, 30))
+        self.strings = [d.isoformat() for d in self.dates]
+
+    def test_buffer(self):
+        text = '\n'.join(self.strings)
+        for data in (text, text + '\n', text.encode(),
+                     bytearray(text.encode() + b'\n'),
+                     memoryview(text.encode()),
+                     text.replace('\n', '\r\n').encode()):
+            self.assertEqual(parse_isoformat_many(data), self.dates)
+        self.assertEqual(parse_isoformat_many(b''), [])
+        for data in (b'\n', '\n\n', b'\r\n', text + '\n\n',
+                     '\n' + text.replace('\n', '\n\n') + '\r\n\n'):
+            self.assertEqual(parse_isoformat_many(data),
+                             self.dates if len(data) > 2 else [])
+        self.assertEqual(parse_isoformat_many(['', self.strings[0], b'']),
+                         self.dates[:1])
+
+    def test_iterable(self):
+        self.assertEqual(parse_isoformat_many(self.strings), self.dates)
+        self.assertEqual(
+            parse_isoformat_many(s.encode() for s in self.strings),
+            self.dates)
+
+    def test_ordinals(self):
+        ordinals = parse_isoformat_many('\n'.join(self.strings),
+                                        ordinals=True)
+        self.assertEqual(list(ordinals), [d.toordinal() for d in self.dates])
+
+    def test_invalid(self):
+        data = [
+            '1427-11-30', '1427-01-01', '0000-01-01', '1427-13-01',
+            '1427-1-01', '', '1427/01/01', '১৪২৭-০১-০১', '1427-01-0x',
+            '1426-11-30'
+        ]
+        for records in (data, '\n'.join(data), '\n'.join(data).encode()):
+            with self.assertRaises(ValueError):
+                parse_isoformat_many(records)
+            result, invalid = parse_isoformat_many(records, errors='report')
+            self.assertEqual(result, [
+                bangladatetime.date(1427, 1, 1),
+                bangladatetime.date(1426, 11, 30)
+            ])
+            # The empty record 5 is skipped, not invalid.
+            self.assertEqual(invalid, [0, 2, 3, 4, 6, 7, 8])
+        self.assertRaises(ValueError, parse_isoformat_many, [], errors='x')
+
+
+class TestParse(unittest.TestCase):
+    def test_parse(self):
+        d = bangladatetime.date(1427, 9, 9)
+        for string in ('৯ পৌষ ১৪২৭', '৯ই পৌষ, ১৪২৭ বঙ্গাব্দ', '9 Poush 1427',
+                       'Thu, 9 Pous 1427', 'বৃহস্পতিবার, ০৯-০৯-১৪২৭',
+                       '1427-09-09', '09/09/1427', 'POUSH 9, 1427',
+                       '1427 Pausha 9th', '৯.৯.১৪২৭।', '9 Poush 1427 B.S.',
+                       # A decomposed য়, as some keyboards type it.
+                       '৯ পৌষ ১৪২৭ সাল'.replace('য়', 'য\u09bc')):
+            self.assertEqual(parse(string), d, string)
+        self.assertEqual(parse('১লা বৈশাখ ১৪৩০'),
+                         bangladatetime.date(1430, 1, 1))
+        self.assertEqual(parse('Bois 1 1430'),
+                         bangladatetime.date(1430, 1, 1))
+        self.assertEqual(parse('৩০ ফাল্গুন ১৪২৬'),
+                         bangladatetime.date(1426, 11, 30))
+        for string in ('', '৩০ ফাল্গুন ১৪২৭', '9 Poush', '9 9 27',
+                       '9 Poush Magh 1427', 'Fri, 9 Poush 1427',
+                       '9 Poushx 1427', '9 9 9 1427', '1427-09-09T00:00'):
+            self.assertRaises(ValueError, parse, string)
+
+    def test_parse_many(self):
+        strings = ['৯ পৌষ ১৪২৭', 'x', '১লা বৈশাখ ১৪৩০', '৯ পৌষ ১৪২৭']
+        with self.assertRaises(ValueError):
+            parse_many(strings)
+        result, invalid = parse_many(strings, errors='report')
+        self.assertEqual(result, [
+            bangladatetime.date(1427, 9, 9),
+            bangladatetime.date(1430, 1, 1),
+            bangladatetime.date(1427, 9, 9)
+        ])
+        self.assertEqual(invalid, [1])
+        self.assertEqual(parse_many(s for s in strings if s != 'x'), result)
+        self.assertRaises(ValueError, parse_many, [], errors='x')
+
+
+class TestStrptime(unittest.TestCase):
+    def test_strptime(self):
+        d = bangladatetime.date(1427, 9, 9)
+        for string, fmt in (('1427-09-09', '%Y-%m-%d'),
+                            ('১৪২৭-০৯-০৯', '%Y-%m-%d'),
+                            ('৯ই পৌষ ১৪২৭', '%d %B %Y'),
+                            ('9 Pous  1427', '%d %b %Y'),
+                            ('Thursday 9th Poush 1427', '%A %d %B %Y'),
+                            ('বৃহস্পতি, ৯ পৌষ ১৪২৭', '%a, %Od %OB %OY'),
+                            ('1427 255', '%Y %j'),
+                            ('1427/9/9 100%', '%Y/%m/%d 100%%')):
+            self.assertEqual(strptime(string, fmt), d, (string, fmt))
+        self.assertEqual(strptime('1427', '%Y'),
+                         bangladatetime.date(1427, 1, 1))
+        for string, fmt in (('1427-09-31', '%Y-%m-%d'),
+                            ('1427-09-09', '%Y/%m/%d'),
+                            ('Fri 1427-09-09', '%a %Y-%m-%d'),
+                            ('1427 366', '%Y %j'),
+                            ('09-09', '%m-%d'),
+                            ('1427', '%Y %q'),
+                            ('1427 9', '%Y %m %m'),
+                            ('1427', '%Y%')):
+            self.assertRaises(ValueError, strptime, string, fmt)
+        self.assertRaises(TypeError, strptime, b'1427', '%Y')
+
+    def test_classmethods(self):
+        self.assertEqual(
+            bangladatetime.date.strptime('৯ পৌষ ১৪২৭', '%d %B %Y'),
+            bangladatetime.date(1427, 9, 9))
+        self.assertEqual(
+            bangladatetime.datetime.strptime('৯ পৌষ ১৪২৭ ১৩:০৫:০৭.২৫',
+                                             '%d %B %Y %H:%M:%S.%f'),
+            bangladatetime.datetime(1427, 9, 9, 13, 5, 7, 250000))
+        self.assertRaises(ValueError, bangladatetime.datetime.strptime,
+                          '1427-09-09 24:00', '%Y-%m-%d %H:%M')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+from array import array
+from collections import namedtuple
+from unittest import mock
+
+from bangladatetime import DateArray, date
+from bangladatetime.periods import (PERIODS, RITUS, period_id, period_ids,
+                                    period_fields, period_start,
+                                    group_by_period)
+
+Sale = namedtuple('Sale', 'day amount')
+
+
+class TestPeriods(unittest.TestCase):
+    def test_period_id(self):
+        d = date(1427, 9, 9)
+        self.assertEqual(period_id(d), 1427 * 12 + 8)
+        self.assertEqual(period_id(d, 'quarter'), 1427 * 4 + 2)
+        self.assertEqual(period_id(d, 'ritu'), 1427 * 6 + 4)
+        self.assertEqual(RITUS[period_fields(period_id(d, 'ritu'),
+                                             'ritu')[1]], 'Shit')
+        self.assertEqual(period_id(d, 'year'), 1427)
+        self.assertEqual(period_id(d, 'fiscal_year'), 1427)
+        self.assertEqual(period_id(d, 'fiscal_year', fiscal_start=10), 1426)
+        self.assertEqual(period_id(d, 'fiscal_year', fiscal_start=9), 1427)
+        self.assertEqual(period_id(d.toordinal()), period_id(d))
+        self.assertEqual(period_id(datetime.date(2020, 12, 24)),
+                         period_id(d))
+        self.assertRaises(ValueError, period_id, d, 'week')
+        self.assertRaises(ValueError, period_id, d, 'fiscal_year', 13)
+        self.assertRaises(ValueError, period_id, 0)
+        self.assertRaises(TypeError, period_id, '1427-09-09')
+
+    def test_period_ids(self):
+        dates = [date.fromordinal(n) for n in range(1, 3652060, 997)]
+        ordinals = array('i', [d.toordinal() for d in dates])
+        for numpy in (True, False):
+            with mock.patch.dict('sys.modules',
+                                 {} if numpy else {'numpy': None}):
+                for period in PERIODS:
+                    expected = [period_id(d, period, 4) for d in dates]
+                    for values in (dates, ordinals, DateArray(dates)):
+                        ids = period_ids(values, period, fiscal_start=4)
+                        self.assertEqual(ids.tolist(), expected, period)
+                self.assertEqual(len(period_ids([])), 0)
+                self.assertRaises(ValueError, period_ids, [0])
+
+    def test_period_start(self):
+        for d in (date(1, 1, 1), date(1426, 11, 30), date(1427, 9, 9),
+                  date(9999, 12, 30)):
+            for period in PERIODS:
+                pid = period_id(d, period, 7)
+                if pid == 0:
+                    # The fiscal year starting in year 0.
+                    self.assertRaises(ValueError, period_start, pid, period,
+                                      7)
+                    continue
+                start = period_start(pid, period, 7)
+                self.assertLessEqual(start, d)
+                self.assertEqual(period_id(start, period, 7), pid)
+                if start.toordinal() > 1:
+                    self.assertEqual(
+                        period_id(start.toordinal() - 1, period, 7), pid - 1)
+        self.assertEqual(period_fields(1427 * 12 + 8), (1427, 9))
+        self.assertEqual(period_start(1427, 'fiscal_year', 4),
+                         date(1427, 4, 1))
+
+    def test_group_by_period(self):
+        sales = [
+            Sale(date(1427, 1, 1), 10),
+            Sale(date(1427, 2, 31), 5),
+            Sale(date(1427, 9, 9), 7),
+            Sale(datetime.date(2020, 4, 13), 1),  # Choitro 30, 1426
+            Sale(date(1427, 1, 1).toordinal(), 2),
+        ]
+        self.assertEqual(
+            group_by_period(sales, lambda sale: sale.day,
+                            lambda total, sale: total + sale.amount, 0),
+            {1426 * 12 + 11: 1, 1427 * 12: 12, 1427 * 12 + 1: 5,
+             1427 * 12 + 8: 7})
+        groups = group_by_period(sales, lambda sale: sale.day,
+                                 lambda count, sale: count + 1, 0, 'ritu')
+        self.assertEqual(list(groups), [1426 * 6 + 5, 1427 * 6, 1427 * 6 + 4])
+        self.assertEqual(list(groups.values()), [1, 3, 1])
+        self.assertEqual(group_by_period([], None, None, 0), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
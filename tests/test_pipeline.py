@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from bangladatetime.cli import main
+from bangladatetime.pipeline import convert_csv
+
+
+def _read_rows(path, encoding):
+    with open(path, encoding=encoding, newline='') as file:
+        return list(csv.reader(file))
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        fd, self.output = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.output)
+
+    def test_convert_csv(self):
+        for workers in (1, 2):
+            count = convert_csv('tests/2019-2020.csv', self.output,
+                                column='gregorian', encoding='utf-16',
+                                workers=workers, chunk_lines=50)
+            self.assertEqual(count, 731)
+            rows = _read_rows(self.output, 'utf-16')
+            self.assertEqual(rows[0], ['gregorian', 'bengali', 'bangla'])
+            self.assertEqual(len(rows), 732)
+            for row in rows[1:]:
+                self.assertEqual(row[2], row[1], row[0])
+        # The header quotes all the fields, so every field is quoted.
+        with open(self.output, encoding='utf-16', newline='') as file:
+            self.assertEqual(file.readline(),
+                             '"gregorian","bengali","bangla"\n')
+
+    def test_file_objects(self):
+        source = io.BytesIO(
+            b'id;when\r\n1;2020-12-24\r\n2;"2021-04-14 10:00"\r\n'
+            b'\r\n3;2021-04-13T23:59\r\n')
+        destination = io.BytesIO()
+        count = convert_csv(source, destination, column=1,
+                            output_column='bn', workers=1, delimiter=';')
+        self.assertEqual(count, 3)
+        self.assertFalse(source.closed or destination.closed)
+        self.assertEqual(
+            destination.getvalue(),
+            b'id;when;bn\r\n1;2020-12-24;1427-09-09\r\n'
+            b'2;2021-04-14 10:00;1428-01-01\r\n\r\n'
+            b'3;2021-04-13T23:59;1427-12-30\r\n')
+
+        text = io.StringIO()
+        convert_csv(io.StringIO('d,note\n2020-12-24,"two\nlines"\n'), text,
+                    column='d', workers=2, chunk_lines=1)
+        self.assertEqual(text.getvalue(),
+                         'd,note,bangla\n2020-12-24,"two\nlines",1427-09-09\n')
+
+    def test_errors(self):
+        data = 'd\n2020-12-24\n2020-02-30\nnot a date\n'
+        with self.assertRaisesRegex(ValueError, 'line 3'):
+            convert_csv(io.StringIO(data), io.StringIO(), column='d',
+                        workers=1)
+        with self.assertRaisesRegex(ValueError, 'line 3'):
+            convert_csv(io.StringIO(data), io.StringIO(), column='d',
+                        workers=2, chunk_lines=1)
+        output = io.StringIO()
+        self.assertEqual(
+            convert_csv(io.StringIO(data), output, column='d', workers=1,
+                        errors='ignore'), 3)
+        self.assertEqual(
+            output.getvalue(),
+            'd,bangla\n2020-12-24,1427-09-09\n2020-02-30,\nnot a date,\n')
+        self.assertRaises(ValueError, convert_csv, io.StringIO(data),
+                          io.StringIO(), column='x')
+        self.assertRaises(ValueError, convert_csv, io.StringIO(''),
+                          io.StringIO())
+        self.assertRaises(ValueError, convert_csv, io.StringIO(data),
+                          io.StringIO(), column='d', workers=0)
+        for chunk_lines in (0, -1):
+            output = io.StringIO()
+            self.assertRaises(ValueError, convert_csv, io.StringIO(data),
+                              output, column='d', chunk_lines=chunk_lines)
+            self.assertEqual(output.getvalue(), '')
+
+    def test_cli(self):
+        self.assertEqual(
+            main([
+                'csv', 'tests/2019-2020.csv', self.output, '--encoding',
+                'utf-16', '--output-encoding', 'utf-8', '-j', '1',
+                '--column', '0'
+            ]), 0)
+        rows = _read_rows(self.output, 'utf-8')
+        self.assertEqual(rows[1], ['2019-01-01', '1425-09-17', '1425-09-17'])
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), \
+                self.assertRaises(SystemExit) as cm:
+            main(['csv', 'tests/2019-2020.csv', self.output, '--column', 'x',
+                  '--encoding', 'utf-16'])
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("no column 'x'", stderr.getvalue())
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), \
+                self.assertRaises(SystemExit) as cm:
+            main(['csv', 'tests/2019-2020.csv', self.output,
+                  '--chunk-lines', '0', '--encoding', 'utf-16'])
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn('chunk_lines must be at least 1', stderr.getvalue())
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            main(['today', '--format', '%Y'])
+        self.assertEqual(len(stdout.getvalue()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
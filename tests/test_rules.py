@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+
+from bangladatetime import EraCalendar, RuleSet, date
+from bangladatetime.rules import BANGLADESH, REVISION_1987, REVISION_2019
+
+
+class TestRuleSet(unittest.TestCase):
+    def test_tables(self):
+        self.assertEqual(REVISION_1987.days_in_month(5), 31)
+        self.assertEqual(REVISION_1987.days_in_month(6), 30)
+        self.assertEqual(REVISION_1987.days_in_month(11), 30)
+        self.assertEqual(REVISION_1987.days_in_month(11, leap=True), 31)
+        self.assertEqual(REVISION_2019.days_in_month(6), 31)
+        self.assertEqual(REVISION_2019.days_in_month(11), 29)
+        self.assertEqual(REVISION_2019.days_in_month(11, leap=True), 30)
+        self.assertTrue(REVISION_2019.is_leap(1426))
+        self.assertFalse(REVISION_2019.is_leap(1427))
+        self.assertFalse(REVISION_2019.is_leap(1506))  # Gregorian 2100
+        self.assertTrue(RuleSet('x', [31] * 5 + [30] * 7,
+                                is_leap=lambda year: year % 4 == 2).is_leap(
+                                    1506))
+        self.assertRaises(ValueError, REVISION_2019.is_leap, 0)
+        self.assertEqual(REVISION_2019.name, '2019')
+        self.assertEqual(REVISION_2019.leap_month, 11)
+        self.assertEqual(
+            RuleSet('x', [30] * 11 + [35], leap_month=12).days_in_month(
+                12, True), 36)
+        self.assertRaises(ValueError, RuleSet, 'x', [30] * 12)
+        self.assertRaises(ValueError, RuleSet, 'x', [31] * 5 + [30] * 6)
+        self.assertRaises(ValueError, RuleSet, 'x', [31] * 5 + [30] * 7, 13)
+
+
+class TestEraCalendar(unittest.TestCase):
+    def test_current_rules(self):
+        # The 2019 rules are the rules of date.
+        cal = EraCalendar([(1, REVISION_2019)])
+        for n in list(range(1, date.max.toordinal() + 1, 997)) + \
+                [date.max.toordinal()]:
+            d = date.fromordinal(n)
+            fields = d.year, d.month, d.day
+            self.assertEqual(cal.ord2ymd(n), fields)
+            self.assertEqual(cal.ymd2ord(*fields), n)
+            self.assertEqual(cal.todate(*fields), d)
+
+    def test_1987_rules(self):
+        cal = EraCalendar([(1, REVISION_1987)])
+        for n in range(1, date.max.toordinal() + 1, 101):
+            self.assertEqual(cal.ymd2ord(*cal.ord2ymd(n)), n)
+        # Every year still starts on April 14 and ends on April 13.
+        self.assertEqual(cal.togregorian(1424, 1, 1),
+                         datetime.date(2017, 4, 14))
+        self.assertEqual(cal.togregorian(1424, 6, 1),
+                         datetime.date(2017, 9, 16))
+        self.assertEqual(cal.togregorian(1426, 11, 31),
+                         datetime.date(2020, 3, 14))
+        self.assertEqual(cal.togregorian(1424, 12, 30),
+                         datetime.date(2018, 4, 13))
+        self.assertRaises(ValueError, cal.ymd2ord, 1424, 11, 31)
+        self.assertRaises(ValueError, cal.ymd2ord, 1424, 6, 31)
+
+    def test_eras(self):
+        cal = BANGLADESH
+        self.assertEqual([year for year, _ in cal.eras], [1394, 1426])
+        self.assertIs(cal.rules(1394), REVISION_1987)
+        self.assertIs(cal.rules(1425), REVISION_1987)
+        self.assertIs(cal.rules(9999), REVISION_2019)
+        # Victory Day: Poush 2 under the 1987 rules, Poush 1 since 2019.
+        self.assertEqual(cal.fromgregorian(2017, 12, 16), (1424, 9, 2))
+        self.assertEqual(cal.fromgregorian(datetime.date(2020, 12, 16)),
+                         (1427, 9, 1))
+        self.assertEqual(cal.fromgregorian(1987, 4, 14), (1394, 1, 1))
+        self.assertEqual(cal.todate(1424, 9, 2), date(1424, 9, 1))
+        self.assertEqual(cal.fromdate(date(1424, 9, 1)), (1424, 9, 2))
+        self.assertEqual(cal.fromdate(date(1427, 9, 9)), (1427, 9, 9))
+        self.assertEqual(cal.togregorian(1425, 12, 30),
+                         datetime.date(2019, 4, 13))
+        self.assertEqual(cal.togregorian(1426, 1, 1),
+                         datetime.date(2019, 4, 14))
+        # The traditional calendar before 1394 is not supported.
+        self.assertRaises(ValueError, cal.rules, 1393)
+        self.assertRaises(ValueError, cal.fromgregorian, 1987, 4, 13)
+        self.assertRaises(ValueError, cal.ymd2ord, 1393, 1, 1)
+        self.assertRaises(ValueError, cal.ord2ymd, 0)
+        self.assertRaises(ValueError, cal.fromgregorian, 1, 1, 1)
+        self.assertRaises(TypeError, cal.fromdate, datetime.date(2020, 1, 1))
+
+    def test_leap_rules(self):
+        # An era whose leap years are those of the Julian calendar: 1506
+        # (Gregorian 2100) gets a leap day, so the years after it start a
+        # day later than in date.
+        julian = RuleSet('julian', [31] * 5 + [30] * 7,
+                         is_leap=lambda year: year % 4 == 2)
+        cal = EraCalendar([(1426, REVISION_2019), (1500, julian)])
+        self.assertEqual(cal.togregorian(1506, 1, 1),
+                         datetime.date(2099, 4, 14))
+        self.assertEqual(cal.togregorian(1506, 11, 31),
+                         datetime.date(2100, 3, 15))
+        self.assertEqual(cal.togregorian(1507, 1, 1),
+                         datetime.date(2100, 4, 15))
+        self.assertRaises(ValueError, cal.ymd2ord, 1507, 11, 31)
+        self.assertEqual(cal.fromgregorian(2100, 4, 14), (1506, 12, 30))
+        self.assertEqual(cal.todate(1427, 9, 9), date(1427, 9, 9))
+        first = cal.ymd2ord(1426, 1, 1)
+        last = cal.ymd2ord(9999, 12, 30)
+        self.assertRaises(ValueError, cal.ord2ymd, first - 1)
+        self.assertRaises(ValueError, cal.ord2ymd, last + 1)
+        for n in list(range(first, last + 1, 97)) + [last]:
+            self.assertEqual(cal.ymd2ord(*cal.ord2ymd(n)), n)
+
+    def test_arguments(self):
+        self.assertRaises(ValueError, EraCalendar, [])
+        self.assertRaises(ValueError, EraCalendar, [(0, REVISION_2019)])
+        self.assertRaises(ValueError, EraCalendar, [(1, REVISION_1987),
+                                                    (1, REVISION_2019)])
+        self.assertRaises(TypeError, EraCalendar, [(1, None)])
+        # Eras are sorted by their first year.
+        cal = EraCalendar([(1426, REVISION_2019), (1394, REVISION_1987)])
+        self.assertEqual(cal.eras, BANGLADESH.eras)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import pickle
+import struct
+import tempfile
+import unittest
+
+import bangladatetime
+from bangladatetime import DateArray
+
+
+class TestSerialize(unittest.TestCase):
+    def setUp(self):
+        self.dates = [
+            bangladatetime.date.fromordinal(n)
+            for n in range(1, bangladatetime.date.max.toordinal() + 1, 9973)
+        ]
+        self.dates.append(bangladatetime.date.max)
+
+    def test_roundtrip(self):
+        file = io.BytesIO()
+        self.assertEqual(bangladatetime.dump_dates(self.dates, file),
+                         len(self.dates))
+        data = file.getvalue()
+        self.assertEqual(len(data), 16 + 4 * len(self.dates))
+        self.assertEqual(data[:4], b'BNDT')
+        self.assertEqual(struct.unpack('<i', data[16:20]), (1, ))
+        self.assertEqual(data, bangladatetime.dumps_dates(self.dates))
+
+        file.seek(0)
+        self.assertEqual(bangladatetime.load_dates(file), self.dates)
+        file.seek(0)
+        loaded = bangladatetime.load_dates(file, columnar=True)
+        self.assertIsInstance(loaded, DateArray)
+        self.assertEqual(list(loaded), self.dates)
+        self.assertEqual(bangladatetime.loads_dates(data), self.dates)
+        self.assertEqual(list(bangladatetime.loads_dates(data, True)),
+                         self.dates)
+
+        self.assertEqual(bangladatetime.loads_dates(
+            bangladatetime.dumps_dates([])), [])
+        # datetimes are stored as their dates.
+        self.assertEqual(
+            bangladatetime.loads_dates(
+                bangladatetime.dumps_dates(
+                    [bangladatetime.datetime(1427, 9, 9, 12)])),
+            [bangladatetime.date(1427, 9, 9)])
+
+    def test_datearray(self):
+        dates = DateArray(self.dates)
+        for part in (dates, dates[::2], dates[::-3]):
+            data = bangladatetime.dumps_dates(part)
+            self.assertEqual(bangladatetime.loads_dates(data), list(part))
+        # A DateArray loaded from a buffer shares it.
+        data = bytearray(bangladatetime.dumps_dates(dates))
+        loaded = bangladatetime.loads_dates(data, columnar=True)
+        data[16:20] = struct.pack('<i', 2)
+        self.assertEqual(loaded[0], bangladatetime.date(1, 1, 2))
+
+    def test_map_dates(self):
+        fd, path = tempfile.mkstemp(suffix='.bndt')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                bangladatetime.dump_dates(self.dates, file)
+            dates = bangladatetime.map_dates(path)
+            self.assertEqual(list(dates), self.dates)
+            self.assertEqual(dates.max(), bangladatetime.date.max)
+            del dates
+        finally:
+            os.remove(path)
+
+    def test_invalid(self):
+        data = bangladatetime.dumps_dates(self.dates)
+        self.assertRaises(ValueError, bangladatetime.loads_dates, data[:10])
+        self.assertRaises(ValueError, bangladatetime.loads_dates, data[:-1])
+        self.assertRaises(ValueError, bangladatetime.loads_dates,
+                          b'XXXX' + data[4:])
+        self.assertRaises(ValueError, bangladatetime.loads_dates,
+                          data[:4] + b'\x02' + data[5:])
+        self.assertRaises(ValueError, bangladatetime.load_dates,
+                          io.BytesIO(data[:-1]))
+        bad = data[:16] + struct.pack('<i', 0) + data[20:]
+        self.assertRaises(ValueError, bangladatetime.loads_dates, bad)
+        self.assertRaises(ValueError, bangladatetime.loads_dates, bad, True)
+        self.assertRaises(TypeError, bangladatetime.dumps_dates, [1])
+
+    def test_pickle_size(self):
+        dates = DateArray(self.dates * 100)
+        data = pickle.dumps(dates, pickle.HIGHEST_PROTOCOL)
+        self.assertLess(len(data), 4 * len(dates) + 200)
+        self.assertEqual(pickle.loads(data), dates)
+
+
+if __name__ == "__main__":
+    unittest.main()